@@ -1,21 +1,142 @@
+import asyncio
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Any
+from collections.abc import Awaitable, Callable
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from pydantic import BaseModel
+from strands import Agent
+
+from deep_research_agent.common.config import settings
+from deep_research_agent.core.agent_factory import AgentFactory
+from deep_research_agent.core.async_agent import invoke_agent_async
+from deep_research_agent.core.model_routing import is_model_unavailable
+from deep_research_agent.services.response_cache import response_cache
+from deep_research_agent.utils.logger import logger
 
 if TYPE_CHECKING:
+    from deep_research_agent.common.schemas import AgentType
     from deep_research_agent.services.prompt_service import PromptService
 
+T = TypeVar("T", bound=BaseModel)
+
 
 class BaseAgent(ABC):
     """Abstract base class for all agents in the system."""
 
-    def __init__(self, prompt_service: "PromptService | None" = None):
+    # AgentType whose system prompt is used for model calls made by this agent
+    agent_type: "AgentType | None" = None
+    # Whether execute() calls a model at all (used for per-model latency tracking)
+    uses_model: bool = True
+
+    def __init__(self, prompt_service: "PromptService | None" = None, model_id: str | None = None):
         """
         Initialize the base agent.
 
         Args:
             prompt_service: Optional service for retrieving prompts
+            model_id: Optional Bedrock model ID (defaults to the factory's default model)
         """
         self.prompt_service = prompt_service
+        self.model_id = model_id
+
+    @property
+    def effective_model_id(self) -> str | None:
+        """The model this agent's calls run on, or None if it does not call a model."""
+        if not self.uses_model:
+            return None
+        return self.model_id or settings.default_model_id
+
+    def _system_prompt(self) -> str | None:
+        if self.prompt_service and self.agent_type:
+            return self.prompt_service.get_system_prompt(self.agent_type)
+        return None
+
+    def _create_agent(self, model_id: str | None = None) -> Agent:
+        """
+        Create an isolated agent handle for a single model call.
+
+        The handle shares the pooled model client but has its own system prompt and message
+        history, so concurrent workflows never see each other's conversation state.
+        """
+        return AgentFactory.create_agent(model_id or self.model_id, system_prompt=self._system_prompt())
+
+    def _call_model(self, prompt: str, output_model: type[BaseModel] | None, call: Callable[[Agent], Any]) -> Any:
+        """
+        Run ``call`` on a fresh agent handle, through the response cache.
+
+        If the agent's model is unavailable (e.g. a routed model not enabled in this region), the call
+        is retried once on the default tier instead of failing the step.
+        """
+        system_prompt = self._system_prompt()
+        try:
+            return response_cache.get_or_call(
+                self.agent_type,
+                self.effective_model_id,
+                system_prompt,
+                prompt,
+                output_model,
+                lambda: call(self._create_agent()),
+            )
+        except Exception as e:
+            fallback_model_id = self._fallback_model_id(e)
+            if fallback_model_id is None:
+                raise
+            return response_cache.get_or_call(
+                self.agent_type,
+                fallback_model_id,
+                system_prompt,
+                prompt,
+                output_model,
+                lambda: call(self._create_agent(fallback_model_id)),
+            )
+
+    async def _call_model_async(
+        self, prompt: str, output_model: type[BaseModel] | None, call: Callable[[Agent], Awaitable[Any]]
+    ) -> Any:
+        """``_call_model`` for a call awaited on the event loop."""
+        system_prompt = self._system_prompt()
+        try:
+            return await response_cache.get_or_call_async(
+                self.agent_type,
+                self.effective_model_id,
+                system_prompt,
+                prompt,
+                output_model,
+                lambda: call(self._create_agent()),
+            )
+        except Exception as e:
+            fallback_model_id = self._fallback_model_id(e)
+            if fallback_model_id is None:
+                raise
+            return await response_cache.get_or_call_async(
+                self.agent_type,
+                fallback_model_id,
+                system_prompt,
+                prompt,
+                output_model,
+                lambda: call(self._create_agent(fallback_model_id)),
+            )
+
+    def _fallback_model_id(self, error: Exception) -> str | None:
+        """The model to retry a failed call on: the default tier, if the agent's model is unavailable."""
+        model_id = self.effective_model_id
+        fallback_model_id = settings.default_model_id
+        if not settings.model_fallback_enabled or model_id == fallback_model_id or not is_model_unavailable(error):
+            return None
+        logger.warning(f"Model {model_id} is unavailable ({error}); retrying on the default model {fallback_model_id}")
+        return fallback_model_id
+
+    def _invoke(self, prompt: str) -> str:
+        """Send a prompt to the model on a fresh agent handle and return the response text."""
+        return self._call_model(prompt, None, lambda agent: str(agent(prompt)))
+
+    async def _invoke_async(self, prompt: str, semaphore: asyncio.Semaphore | None = None) -> str:
+        """``_invoke`` on the research executor, under the current invocation deadline and ``semaphore``."""
+        return await self._call_model_async(prompt, None, lambda agent: invoke_agent_async(agent, prompt, semaphore))
+
+    def _structured_output(self, output_model: type[T], prompt: str) -> T:
+        """Get structured output from the model on a fresh agent handle."""
+        return self._call_model(prompt, output_model, lambda agent: agent.structured_output(output_model, prompt))
 
     @abstractmethod
     def execute(self, context: dict[str, Any]):
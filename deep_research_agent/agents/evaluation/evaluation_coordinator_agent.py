@@ -1,9 +1,9 @@
+import functools
 from typing import Any, cast
 
 from deep_research_agent.agents.base_agent import BaseAgent
 from deep_research_agent.common.config import settings
 from deep_research_agent.common.schemas import AgentType, UseCases
-from deep_research_agent.core.agent_factory import AgentFactory
 from deep_research_agent.services.prompt_service import PromptService
 from deep_research_agent.utils.logger import logger
 
@@ -13,15 +13,23 @@ from .technical_feasibility_agent import TechnicalFeasibilityAgent
 
 
 class EvaluationCoordinatorAgent(BaseAgent):
+    agent_type = AgentType.EVALUATION_COORDINATOR
+
     def __init__(self, prompt_service: PromptService, model_id: str | None = None):
-        super().__init__(prompt_service)
-        self._agent = AgentFactory.create_agent(model_id or settings.claude_3_5_sonnet_model_id)
-        if self.prompt_service:
-            self._agent.system_prompt = self.prompt_service.get_system_prompt(AgentType.EVALUATION_COORDINATOR)
+        super().__init__(prompt_service, model_id or settings.claude_3_5_sonnet_model_id)
+        # Model requested for the specialists; None lets each use its own default
+        self._specialist_model_id = model_id
 
         self.technical_feasibility_agent = TechnicalFeasibilityAgent(prompt_service, model_id=model_id)
-        self.ethical_guardian_agent = EthicalGuardianAgent(prompt_service, model_id=model_id)
-        self.market_viability_agent = MarketViabilityAgent(prompt_service, model_id=model_id)
+
+    # Specialists not currently consulted are built on first use
+    @functools.cached_property
+    def ethical_guardian_agent(self) -> EthicalGuardianAgent:
+        return EthicalGuardianAgent(self.prompt_service, model_id=self._specialist_model_id)
+
+    @functools.cached_property
+    def market_viability_agent(self) -> MarketViabilityAgent:
+        return MarketViabilityAgent(self.prompt_service, model_id=self._specialist_model_id)
 
     def execute(self, context: dict[str, Any]):
         if not self.prompt_service:
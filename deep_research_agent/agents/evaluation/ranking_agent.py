@@ -5,6 +5,8 @@ from deep_research_agent.utils.logger import logger
 
 
 class RankingAgent(BaseAgent):
+    uses_model = False
+
     def __init__(self, *args, **kwargs):
         # This agent does not require prompt_service or a model, so we override __init__
         super().__init__()
@@ -5,17 +5,15 @@ from typing import Any
 from deep_research_agent.agents.base_agent import BaseAgent
 from deep_research_agent.common.config import settings
 from deep_research_agent.common.schemas import AgentType, UseCase, UseCases
-from deep_research_agent.core.agent_factory import AgentFactory
 from deep_research_agent.services.prompt_service import PromptService
 from deep_research_agent.utils.logger import logger
 
 
 class IdeationAgent(BaseAgent):
+    agent_type = AgentType.IDEATION
+
     def __init__(self, prompt_service: PromptService, model_id: str | None = None):
-        super().__init__(prompt_service)
-        self._agent = AgentFactory.create_agent(model_id or settings.claude_3_5_sonnet_model_id)
-        if self.prompt_service:
-            self._agent.system_prompt = self.prompt_service.get_system_prompt(AgentType.IDEATION)
+        super().__init__(prompt_service, model_id or settings.claude_3_5_sonnet_model_id)
 
     def execute(self, context: dict[str, Any]):
         if not self.prompt_service:
@@ -32,7 +30,7 @@ class IdeationAgent(BaseAgent):
                 creative_brief=creative_brief,
                 feedback=feedback,
             )
-            result = self._agent(prompt)
+            result = self._invoke(prompt)
             # Parse JSON and convert to UseCases
             parsed_result = self._parse_json_to_usecases(str(result))
             context["refined_ideas"] = parsed_result
@@ -42,7 +40,7 @@ class IdeationAgent(BaseAgent):
             prompt = self.prompt_service.format_user_prompt(
                 AgentType.IDEATION, "generate_initial", creative_brief=creative_brief
             )
-            result = self._agent(prompt)
+            result = self._invoke(prompt)
             # Parse JSON and convert to UseCases
             parsed_result = self._parse_json_to_usecases(str(result))
             context["initial_ideas"] = parsed_result
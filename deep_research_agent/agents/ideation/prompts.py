@@ -2,6 +2,7 @@
 Prompts for ideation agents.
 """
 
+from deep_research_agent.common.prompt_cache import PROMPT_CACHE_BREAK
 from deep_research_agent.common.schemas import AgentType
 
 # System prompts for ideation agents
@@ -64,8 +65,11 @@ SYSTEM_PROMPTS = {
 # User prompt templates for ideation agents
 USER_PROMPT_TEMPLATES = {
     AgentType.IDEATION: {
+        # The creative brief is shared by both templates, so it comes first and ends the cached prefix
         "generate_initial": (
-            """You are given the following **Creative Brief**. Based on it, generate a list of **exactly 10 high-level and distinct use case ideas**.
+            "**Creative Brief**:\n{creative_brief}\n\n"
+            + PROMPT_CACHE_BREAK
+            + """Based on the **Creative Brief** above, generate a list of **exactly 10 high-level and distinct use case ideas**.
 
             Each use case must:
             - Be grounded in the content and goals of the brief.
@@ -73,14 +77,12 @@ USER_PROMPT_TEMPLATES = {
             - Align with the context, audience, and business intent described.
             - Be outputted in a structured JSON format as described previously.
 
-            **Creative Brief**:
-            {creative_brief}
-
             Please generate your response as a **valid JSON object** containing 10 items in the `use_cases` list, following the detailed formatting and verbosity instructions already provided."""
         ),
         "refine_with_feedback": (
-            "Here is the creative brief:\n\n{creative_brief}\n\n"
-            "We have received the following critical feedback on our initial ideas:\n"
+            "**Creative Brief**:\n{creative_brief}\n\n"
+            + PROMPT_CACHE_BREAK
+            + "We have received the following critical feedback on our initial ideas:\n"
             "{feedback}\n\nPlease generate a new, refined list of 10 use cases that address this feedback."
         ),
     },
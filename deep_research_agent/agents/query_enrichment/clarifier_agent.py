@@ -3,17 +3,15 @@ from typing import Any
 
 from deep_research_agent.agents.base_agent import BaseAgent
 from deep_research_agent.common.schemas import AgentType, AwaitingUserInputError
-from deep_research_agent.core.agent_factory import AgentFactory
 from deep_research_agent.services.prompt_service import PromptService
 from deep_research_agent.utils.logger import logger
 
 
 class ClarifierAgent(BaseAgent):
+    agent_type = AgentType.CLARIFIER
+
     def __init__(self, prompt_service: PromptService, model_id: str | None = None):
-        super().__init__(prompt_service)
-        self._agent = AgentFactory.create_agent(model_id)
-        if self.prompt_service:
-            self._agent.system_prompt = self.prompt_service.get_system_prompt(AgentType.CLARIFIER)
+        super().__init__(prompt_service, model_id)
 
     def execute(self, context: dict[str, Any]):
         if not self.prompt_service:
@@ -86,7 +84,7 @@ class ClarifierAgent(BaseAgent):
                 full_context=full_context,
             )
 
-        clarifying_questions = self._agent(prompt)
+        clarifying_questions = self._invoke(prompt)
         logger.info(f"🤔 {clarifying_questions}\n")
 
         raise AwaitingUserInputError(str(clarifying_questions))
@@ -1,3 +1,4 @@
+import functools
 import os
 import tempfile
 from typing import Any
@@ -11,25 +12,27 @@ from docx import Document
 from deep_research_agent.agents.base_agent import BaseAgent
 from deep_research_agent.common.config import settings
 from deep_research_agent.common.schemas import AgentType
-from deep_research_agent.core.agent_factory import AgentFactory
 from deep_research_agent.services.prompt_service import PromptService
 from deep_research_agent.utils.logger import logger
 
 
 class DocumentSummarizerAgent(BaseAgent):
+    agent_type = AgentType.DOCUMENT_SUMMARIZER
+
     def __init__(self, prompt_service: PromptService, model_id: str | None = None):
-        super().__init__(prompt_service)
-        self._agent = AgentFactory.create_agent(model_id or settings.claude_3_5_sonnet_model_id)
-        if self.prompt_service:
-            self._agent.system_prompt = self.prompt_service.get_system_prompt(AgentType.DOCUMENT_SUMMARIZER)
+        super().__init__(prompt_service, model_id or settings.claude_3_5_sonnet_model_id)
 
-        # Initialize S3 client using existing settings
-        self.s3_client = boto3.client("s3", region_name=settings.aws_region)
-        self.temp_files = []  # Track temporary files for cleanup
+    @functools.cached_property
+    def s3_client(self):
+        """S3 client, created on first download so runs without uploads never build one."""
+        return boto3.client("s3", region_name=settings.aws_region)
 
     def execute(self, context: dict[str, Any]):
         """
         Process uploaded files and create summaries.
+
+        The agent keeps no per-run state, so one instance can serve concurrent workflows;
+        temporary downloads are tracked per call.
         """
         if not self.prompt_service:
             raise ValueError("PromptService is not available for DocumentSummarizerAgent")
@@ -42,10 +45,11 @@ class DocumentSummarizerAgent(BaseAgent):
         logger.info(f"Processing {len(uploaded_files)} uploaded files...")
 
         document_summaries = []
+        temp_files: list[str] = []
         for file_url in uploaded_files:
             try:
                 # Download file from S3 if it's an S3 URL, otherwise use local path
-                local_file_path = self._download_file_if_s3(file_url)
+                local_file_path = self._download_file_if_s3(file_url, temp_files)
 
                 content = self._extract_content_from_file(local_file_path)
                 if content:
@@ -87,14 +91,14 @@ class DocumentSummarizerAgent(BaseAgent):
             logger.info("Document summaries added to conversation context.")
 
         # Clean up temporary files
-        self._cleanup_temp_files()
+        self._cleanup_temp_files(temp_files)
 
-    def _download_file_if_s3(self, file_url: str) -> str:
+    def _download_file_if_s3(self, file_url: str, temp_files: list[str]) -> str:
         """
         Download file from S3 if it's an S3 URL, otherwise return the original path.
         """
         if self._is_s3_url(file_url):
-            return self._download_from_s3(file_url)
+            return self._download_from_s3(file_url, temp_files)
         else:
             return file_url  # Assume it's a local file path
 
@@ -116,9 +120,9 @@ class DocumentSummarizerAgent(BaseAgent):
         else:
             return os.path.basename(url)
 
-    def _download_from_s3(self, s3_url: str) -> str:
+    def _download_from_s3(self, s3_url: str, temp_files: list[str]) -> str:
         """
-        Download file from S3 and return path to temporary local file.
+        Download file from S3 and return path to temporary local file, recorded in ``temp_files`` for cleanup.
         """
         try:
             # Parse S3 URL (supports both s3://bucket/key and https://bucket.s3.region.amazonaws.com/key formats)
@@ -138,7 +142,7 @@ class DocumentSummarizerAgent(BaseAgent):
             temp_file.close()
 
             # Track for cleanup
-            self.temp_files.append(temp_file.name)
+            temp_files.append(temp_file.name)
 
             # Download from S3
             logger.info(f"Downloading from S3: s3://{bucket}/{key}")
@@ -153,11 +157,11 @@ class DocumentSummarizerAgent(BaseAgent):
             logger.error(f"Error downloading file from S3 {s3_url}: {str(e)}")
             raise
 
-    def _cleanup_temp_files(self):
+    def _cleanup_temp_files(self, temp_files: list[str]):
         """
         Clean up temporary files downloaded from S3.
         """
-        for temp_file in self.temp_files:
+        for temp_file in temp_files:
             try:
                 if os.path.exists(temp_file):
                     os.unlink(temp_file)
@@ -165,7 +169,7 @@ class DocumentSummarizerAgent(BaseAgent):
             except Exception as e:
                 logger.warning(f"Failed to clean up temporary file {temp_file}: {str(e)}")
 
-        self.temp_files.clear()
+        temp_files.clear()
 
     def _extract_content_from_file(self, file_path: str) -> str:
         """
@@ -226,7 +230,7 @@ class DocumentSummarizerAgent(BaseAgent):
             prompt = self.prompt_service.format_user_prompt(
                 AgentType.DOCUMENT_SUMMARIZER, "summarize", content=content, file_name=file_name
             )
-            summary = self._agent(prompt)
+            summary = self._invoke(prompt)
             return str(summary)
         except Exception as e:
             logger.error(f"Error summarizing content for {file_url}: {str(e)}")
@@ -251,7 +255,7 @@ class DocumentSummarizerAgent(BaseAgent):
             prompt = self.prompt_service.format_user_prompt(
                 AgentType.DOCUMENT_SUMMARIZER, "consolidate", summaries=summaries_text
             )
-            consolidated = self._agent(prompt)
+            consolidated = self._invoke(prompt)
             return str(consolidated)
         except Exception as e:
             logger.error(f"Error creating consolidated summary: {str(e)}")
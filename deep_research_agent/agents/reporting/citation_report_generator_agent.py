@@ -46,19 +46,20 @@ The agent gracefully handles missing dependencies and will continue to function
 with reduced capabilities if optional tools are not available.
 """
 
+import functools
 import os
 import re
 from typing import Any
 
 import boto3
 import markdown
-import requests
 from dotenv import load_dotenv
 
 from deep_research_agent.agents.base_agent import BaseAgent
 from deep_research_agent.common.schemas import AgentType
-from deep_research_agent.core.agent_factory import AgentFactory
 from deep_research_agent.services.prompt_service import PromptService
+from deep_research_agent.services.search_client import get_search_backend
+from deep_research_agent.services.search_results import project_search_results
 from deep_research_agent.utils.logger import logger
 
 # Load .env variables
@@ -72,16 +73,19 @@ class CitationReportGeneratorAgent(BaseAgent):
     and uploads to S3.
     """
 
+    agent_type = AgentType.CITATION_REPORT_GENERATOR
+
     def __init__(self, prompt_service: PromptService, model_id: str | None = None):
-        super().__init__(prompt_service)
-        self._agent = AgentFactory.create_agent(model_id)
-        if self.prompt_service:
-            self._agent.system_prompt = self.prompt_service.get_system_prompt(AgentType.CITATION_REPORT_GENERATOR)
+        super().__init__(prompt_service, model_id)
 
         # Configuration
-        self.serper_api_key = os.getenv("SERPER_API_KEY")
         self.s3_bucket = os.getenv("S3_BUCKET", "deepresearch-qubitz-document-bucket")
 
+    @functools.cached_property
+    def s3_client(self):
+        """S3 client for report uploads, created on first upload and reused by later reports."""
+        return boto3.client("s3")
+
     def execute(self, context: dict[str, Any]):
         """Execute the citation report generation process"""
         try:
@@ -161,14 +165,21 @@ class CitationReportGeneratorAgent(BaseAgent):
     def _search_consolidated_citations(
         self, use_cases_list: list, max_results: int = 15
     ) -> list[tuple[str, str, str]]:
-        """Search for citations covering all use cases using Serper API"""
-        if not self.serper_api_key:
-            logger.warning("SERPER_API_KEY not found, skipping citation search")
+        """
+        Search for citations covering all use cases using Serper API.
+
+        All queries (three consolidated ones plus one per use case) are sent together through
+        SearchClient.search_many, so the search takes about as long as the slowest query.
+        """
+        backend = get_search_backend()
+        if not backend.available:
+            logger.warning(f"{backend.unavailable_reason}, skipping citation search")
             return []
 
         try:
             # Extract keywords from all use cases to create comprehensive search queries
             all_keywords = []
+            use_case_queries = []
             for use_case in use_cases_list:
                 if hasattr(use_case, "title"):
                     title = use_case.title
@@ -179,37 +190,35 @@ class CitationReportGeneratorAgent(BaseAgent):
 
                 keywords = self._extract_keywords(f"{title} {description}", max_words=10)
                 all_keywords.extend(keywords.split())
+                if keywords:
+                    use_case_queries.append(f"{keywords} AI business case study")
 
             # Create consolidated search queries focusing on AI, business strategy, and implementation
             search_queries = [
                 " ".join(list(dict.fromkeys(all_keywords))[:15]) + " AI business strategy",
                 " ".join(list(dict.fromkeys(all_keywords))[:15]) + " market analysis implementation",
                 " ".join(list(dict.fromkeys(all_keywords))[:10]) + " technology trends competitive advantage",
+                *use_case_queries,
             ]
+            num_per_query = max_results // 3 + 2
+            payloads = [{"q": query, "gl": "us", "hl": "en", "num": num_per_query} for query in search_queries]
+
+            logger.info(f"Searching citations with {len(payloads)} queries")
+            responses = self._search_all(payloads)
 
+            # Merge round-robin across queries (so every query contributes its best results) and
+            # remove duplicate URLs in the same pass
+            result_lists = [project_search_results(response) for response in responses]
             all_citations = []
             seen = set()
-
-            for query in search_queries:
-                headers = {"X-API-KEY": self.serper_api_key, "Content-Type": "application/json"}
-                payload = {"q": query, "gl": "us", "hl": "en", "num": max_results // len(search_queries) + 2}
-
-                logger.info(f"Searching citations for: {query}")
-
-                response = requests.post("https://google.serper.dev/search", headers=headers, json=payload)
-                response.raise_for_status()
-
-                serper_results = response.json().get("organic", [])
-
-                # Process results and remove duplicates
-                for result in serper_results:
-                    link = result.get("link") or result.get("url")
-                    title = result.get("title", "Untitled")
-                    snippet = result.get("snippet", "")
-
-                    if link and link not in seen and len(all_citations) < max_results:
-                        seen.add(link)
-                        all_citations.append((title, link, snippet))
+            for rank in range(max((len(results) for results in result_lists), default=0)):
+                for results in result_lists:
+                    if rank >= len(results) or len(all_citations) >= max_results:
+                        continue
+                    result = results[rank]
+                    if result.url not in seen:
+                        seen.add(result.url)
+                        all_citations.append((result.title, result.url, result.snippet))
 
             logger.info(f"Found {len(all_citations)} unique citations across all use cases")
             return all_citations
@@ -218,6 +227,16 @@ class CitationReportGeneratorAgent(BaseAgent):
             logger.error(f"Consolidated citation search failed: {e}")
             return []
 
+    def _search_all(self, payloads: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Run all citation queries at once, logging and skipping the ones that fail"""
+        responses = []
+        for payload, response in zip(payloads, get_search_backend().search_many(payloads), strict=True):
+            if isinstance(response, Exception):
+                logger.warning(f"Citation search failed for '{payload['q']}': {response}")
+                continue
+            responses.append(response)
+        return responses
+
     def _organize_use_cases_by_stages(self, use_cases_list: list) -> dict[str, list]:
         """Organize use cases by implementation stages based on priority and complexity"""
         stages = {
@@ -269,8 +288,8 @@ class CitationReportGeneratorAgent(BaseAgent):
             raise ValueError("PromptService is not available for CitationReportGeneratorAgent")
 
         # Get additional context data
-        research_summary = context.get("research_summary", "")
-        conversation_summary = context.get("conversation_summary", "")
+        research_summary = context.get("creative_brief", "")
+        conversation_summary = context.get("summary", "")
 
         # Format use cases by stage for the prompt
         use_cases_by_stage = {}
@@ -299,7 +318,7 @@ class CitationReportGeneratorAgent(BaseAgent):
             total_use_cases=sum(len(cases) for cases in organized_use_cases.values()),
         )
 
-        result = self._agent(prompt)
+        result = self._invoke(prompt)
         return str(result).strip()
 
     def _save_and_convert_files(self, markdown_content: str, use_case_id: str) -> dict[str, str]:
@@ -973,7 +992,7 @@ class CitationReportGeneratorAgent(BaseAgent):
         upload_urls = {}
 
         try:
-            s3_client = boto3.client("s3")
+            s3_client = self.s3_client
             # Organize files by conversation ID: conversations/{conversation_id}/reports/
             s3_prefix = f"conversations/{conversation_id}/reports/"
 
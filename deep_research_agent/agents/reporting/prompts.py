@@ -2,6 +2,7 @@
 Prompts for reporting agents.
 """
 
+from deep_research_agent.common.prompt_cache import PROMPT_CACHE_BREAK
 from deep_research_agent.common.schemas import AgentType
 
 # System prompts for reporting agents
@@ -34,18 +35,9 @@ USER_PROMPT_TEMPLATES = {
         )
     },
     AgentType.CITATION_REPORT_GENERATOR: {
+        # Static instructions first, so they form a prefix shared by every report; per-workflow data last
         "generate_consolidated_report": (
-            """Generate a comprehensive **Markdown-formatted business strategy report** that consolidates and analyzes **{total_use_cases} use cases** organized by implementation stages.
-
-                ## Use Cases by Implementation Stage
-                {use_cases_by_stage}
-
-                ## Research Context
-                ### Research Summary
-                {research_summary}
-
-                ### Conversation Summary
-                {conversation_summary}
+            """Generate a comprehensive **Markdown-formatted business strategy report** that consolidates and analyzes the use cases provided at the end of this message, organized by implementation stages.
 
                 ## Critical Citation Requirements:
                 **IMPORTANT**: Every factual claim, statistic, or strategic insight MUST include a numbered citation that references the source in the References section. Use this exact format:
@@ -119,10 +111,25 @@ USER_PROMPT_TEMPLATES = {
                 - [[2]] [Source Title](URL) - Brief description
                 - [[3]] [Source Title](URL) - Brief description
 
-                Use the provided citation block: {citation_block}
+                Use the sources from the citation block provided below.
 
                 **REMEMBER**: Every factual claim must use numbered citations [[1]](URL) that correspond to the References section formatted as bullet points. Bold all statistics and key metrics for emphasis. Generate the complete consolidated report following this structure and citation format exactly.
             """
+            + PROMPT_CACHE_BREAK
+            + """
+                ## Use Cases by Implementation Stage ({total_use_cases} use cases)
+                {use_cases_by_stage}
+
+                ## Research Context
+                ### Research Summary
+                {research_summary}
+
+                ### Conversation Summary
+                {conversation_summary}
+
+                ## Citation Block
+                {citation_block}
+            """
         )
     },
 }
@@ -3,16 +3,14 @@ from typing import Any
 
 from deep_research_agent.agents.base_agent import BaseAgent
 from deep_research_agent.common.schemas import AgentType
-from deep_research_agent.core.agent_factory import AgentFactory
 from deep_research_agent.services.prompt_service import PromptService
 
 
 class ReportSynthesizerAgent(BaseAgent):
+    agent_type = AgentType.REPORT_SYNTHESIZER
+
     def __init__(self, prompt_service: PromptService, model_id: str | None = None):
-        super().__init__(prompt_service)
-        self._agent = AgentFactory.create_agent(model_id)
-        if self.prompt_service:
-            self._agent.system_prompt = self.prompt_service.get_system_prompt(AgentType.REPORT_SYNTHESIZER)
+        super().__init__(prompt_service, model_id)
 
     def execute(self, context: dict[str, Any]):
         if not self.prompt_service:
@@ -26,7 +24,7 @@ class ReportSynthesizerAgent(BaseAgent):
             ranked_list_json=ranked_list_json,
             creative_brief=context["creative_brief"],
         )
-        result = self._agent(prompt)
+        result = self._invoke(prompt)
         context["final_report"] = str(result)
 
     def _serialize_ranked_ideas(self, ranked_ideas: list[tuple[str, list[Any]]]) -> list[dict[str, Any]]:
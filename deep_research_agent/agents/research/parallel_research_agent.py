@@ -1,21 +1,26 @@
 import asyncio
+from collections.abc import Awaitable
 from typing import Any
 
 from deep_research_agent.agents.base_agent import BaseAgent
-from deep_research_agent.agents.research.business_analysis_agent import business_analysis_async
-from deep_research_agent.agents.research.domain_search_agent import domain_search_async
-from deep_research_agent.agents.research.generic_search_agent import generic_search_async
-from deep_research_agent.agents.research.trend_spotter_agent import trend_spotter_async
-from deep_research_agent.agents.research.user_persona_agent import user_persona_agent_async
+from deep_research_agent.agents.research.research_engine import RESEARCH_SPECS, run_research_async
+from deep_research_agent.agents.research.search_summarizer_agent import condense_research_report_async
+from deep_research_agent.common.config import settings
 from deep_research_agent.common.schemas import MissionBrief
-from deep_research_agent.core.agent_factory import AgentFactory
+from deep_research_agent.core.async_agent import (
+    InvocationDeadline,
+    InvocationTimeoutError,
+    current_invocation_deadline,
+)
+from deep_research_agent.core.events import current_event_stream
 from deep_research_agent.utils.logger import logger
 
 
 class ParallelResearchAgent(BaseAgent):
-    def __init__(self, *args, **kwargs):
-        # This agent orchestrates other async functions and doesn't need its own prompt service or model
-        super().__init__()
+    def __init__(self, *args, model_id: str | None = None, **kwargs):
+        # This agent orchestrates the research lanes and doesn't need its own prompt service;
+        # lanes without a model route of their own run on its model
+        super().__init__(model_id=model_id)
 
     async def execute(self, context: dict[str, Any]):
         logger.info("--- Executing Step: Parallel Research ---")
@@ -23,41 +28,103 @@ class ParallelResearchAgent(BaseAgent):
         if not isinstance(mission_brief, MissionBrief):
             raise TypeError("Mission brief must be of type MissionBrief")
 
-        research_results = await self._run_research_agents_parallel(mission_brief)
+        research_results, research_summaries = await self._run_research_agents_parallel(mission_brief)
         context["research_results"] = research_results
+        if research_summaries:
+            context["research_summaries"] = research_summaries
 
-    async def _run_research_agents_parallel(self, mission_brief: MissionBrief):
+    async def _run_research_agents_parallel(self, mission_brief: MissionBrief) -> tuple[list[str], list[str]]:
         """
-        Run all research agents in parallel for faster execution.
+        Run all research lanes in RESEARCH_SPECS in parallel for faster execution.
+
+        Each agent runs under the research soft/hard deadlines; an agent that misses them
+        contributes its partial output, marked as timed out, instead of holding up the others.
+        With progressive summaries enabled, each report is condensed into a partial brief as
+        soon as its agent finishes, overlapping with the agents still running.
+
+        Returns:
+            The research results, and the partial briefs (empty when progressive summaries are off),
+            both in lane order
         """
         logger.info("Starting parallel research phase...")
-        shared_agent = AgentFactory.get_default_agent()
+        agent_names = [spec.name for spec in RESEARCH_SPECS]
+        research_coroutines = [
+            run_research_async(spec, mission_brief, self.effective_model_id) for spec in RESEARCH_SPECS
+        ]
+        # Research deadlines never extend past those of the enclosing workflow step
+        deadline = InvocationDeadline(
+            settings.research_soft_deadline_seconds, settings.research_hard_deadline_seconds
+        ).capped_by(current_invocation_deadline.get())
         research_tasks = [
-            generic_search_async(mission_brief.decomposed_tasks.generic_search_query, shared_agent),
-            business_analysis_async(mission_brief.decomposed_tasks.business_analysis_query, shared_agent),
-            domain_search_async(mission_brief.decomposed_tasks.domain_specific_query, shared_agent),
-            trend_spotter_async(mission_brief.decomposed_tasks.trend_spotter_query, shared_agent),
-            user_persona_agent_async(mission_brief, shared_agent),
+            asyncio.create_task(self._run_research_agent(index, coroutine, deadline))
+            for index, coroutine in enumerate(research_coroutines)
         ]
 
-        research_results = await asyncio.gather(*research_tasks, return_exceptions=True)
-
-        processed_results, agent_names = (
-            [],
-            [
-                "Generic Search",
-                "Business Analysis",
-                "Domain Search",
-                "Trend Spotter",
-                "User Persona",
-            ],
-        )
-        for i, result in enumerate(research_results):
-            if isinstance(result, Exception):
-                logger.warning(f"Warning: {agent_names[i]} agent failed with error: {result}")
-                processed_results.append(f"Error in {agent_names[i]}: {str(result)}")
+        processed_results: list[str] = [""] * len(research_tasks)
+        summary_tasks: dict[int, asyncio.Task[str]] = {}
+        try:
+            for next_completed in asyncio.as_completed(research_tasks):
+                index, result = await next_completed
+                processed_results[index] = self._process_result(agent_names[index], result)
+                has_content = not isinstance(result, Exception) or (
+                    isinstance(result, InvocationTimeoutError) and result.partial_text.strip()
+                )
+                if settings.research_progressive_summaries and has_content:
+                    # Summary tasks are created outside the research tasks, so they run under the enclosing
+                    # step's deadline (if any) rather than the research one; a summary cut short falls back
+                    # to the full report
+                    summary_tasks[index] = asyncio.create_task(
+                        condense_research_report_async(agent_names[index], processed_results[index])
+                    )
+            summaries = await asyncio.gather(*summary_tasks.values(), return_exceptions=True)
+        except BaseException:
+            for task in [*research_tasks, *summary_tasks.values()]:
+                task.cancel()
+            raise
+
+        research_summaries = list(processed_results) if summary_tasks else []
+        for index, summary in zip(summary_tasks, summaries, strict=True):
+            if isinstance(summary, Exception):
+                # Fall back to the full report for the final synthesis
+                logger.warning(f"Warning: condensing the {agent_names[index]} report failed: {summary}")
             else:
-                processed_results.append(str(result))
+                research_summaries[index] = f"## {agent_names[index]}\n{summary}"
 
         logger.info("Parallel research phase completed!")
-        return processed_results
+        return processed_results, research_summaries
+
+    @staticmethod
+    async def _run_research_agent(
+        index: int, coroutine: Awaitable[str], deadline: InvocationDeadline
+    ) -> tuple[int, str | Exception]:
+        # Each task runs in its own copy of the context, so the deadline only applies to research agents
+        current_invocation_deadline.set(deadline)
+        try:
+            return index, await coroutine
+        except Exception as e:  # noqa: BLE001 - reported per agent in the research results
+            return index, e
+
+    def _process_result(self, agent_name: str, result: str | Exception) -> str:
+        if isinstance(result, InvocationTimeoutError):
+            logger.warning(f"Warning: {agent_name} agent timed out: {result}")
+            self._publish_timeout(agent_name, result)
+            if result.partial_text.strip():
+                return f"Timed out in {agent_name} (partial results):\n{result.partial_text}"
+            return f"Timed out in {agent_name}: no results before the deadline"
+        if isinstance(result, Exception):
+            logger.warning(f"Warning: {agent_name} agent failed with error: {result}")
+            return f"Error in {agent_name}: {str(result)}"
+        return str(result)
+
+    @staticmethod
+    def _publish_timeout(agent_name: str, error: InvocationTimeoutError) -> None:
+        stream = current_event_stream.get()
+        if stream is not None:
+            stream.publish(
+                "research_agent_timed_out",
+                {
+                    "agent": agent_name,
+                    "deadline": "hard" if error.hard else "soft",
+                    "partial": bool(error.partial_text),
+                },
+            )
@@ -46,7 +46,22 @@ USER_PROMPT_TEMPLATES = {
             "Please synthesize the following research reports into a single, "
             "cohesive 'Creative Brief' in Markdown format.\n\n"
             "Reports:\n{reports_str}"
-        )
+        ),
+        "condense_report": (
+            "Condense the following {source} research report into a partial brief in Markdown format. "
+            "Keep every key finding, figure, trend, persona detail and source URL; drop repetition and filler.\n\n"
+            "Report:\n{report}"
+        ),
+        "merge_partial_briefs": (
+            "Please merge the following partial briefs, each condensed from one research report, into a single, "
+            "cohesive 'Creative Brief' in Markdown format. Combine overlapping findings instead of repeating them.\n\n"
+            "Partial briefs:\n{briefs_str}"
+        ),
+        "summarize_chunk": (
+            "The following is part {part} of {total} of a set of research reports. Condense it into a partial "
+            "brief in Markdown format, keeping every key finding, figure, trend, persona detail and source URL.\n\n"
+            "Reports (part {part} of {total}):\n{chunk}"
+        ),
     },
     AgentType.GENERIC_SEARCH: {"search": "Research the following topic: {topic}"},
     AgentType.BUSINESS_ANALYSIS: {"analyze": "Analyze the business potential of: {query}"},
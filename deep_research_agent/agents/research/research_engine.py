@@ -0,0 +1,110 @@
+import threading
+from operator import attrgetter
+
+from strands import Agent
+from strands.telemetry.metrics import EventLoopMetrics
+
+from deep_research_agent.agents.research.tools import websearch
+from deep_research_agent.common.config import settings
+from deep_research_agent.common.schemas import AgentType, MissionBrief
+from deep_research_agent.core.agent_factory import AgentFactory
+from deep_research_agent.core.async_agent import invoke_agent_async, research_semaphore
+from deep_research_agent.core.model_routing import resolve_model_id
+from deep_research_agent.services.prompt_service import get_prompt_service
+from deep_research_agent.utils.logger import logger
+
+
+class ResearchSpec:
+    """
+    One research lane: the agent type whose prompts it uses, its user prompt template, and the
+    mission brief fields (dotted attribute paths) that fill the template's placeholders.
+    """
+
+    def __init__(self, name: str, agent_type: AgentType, template_name: str, inputs: dict[str, str]):
+        self.name = name
+        self.agent_type = agent_type
+        self.template_name = template_name
+        self.inputs = inputs
+
+    def format_prompt(self, mission_brief: MissionBrief) -> str:
+        values = {placeholder: attrgetter(path)(mission_brief) for placeholder, path in self.inputs.items()}
+        return get_prompt_service().format_user_prompt(self.agent_type, self.template_name, **values)
+
+
+# Research lanes run by the parallel research step, in report order
+RESEARCH_SPECS: tuple[ResearchSpec, ...] = (
+    ResearchSpec(
+        "Generic Search", AgentType.GENERIC_SEARCH, "search", {"topic": "decomposed_tasks.generic_search_query"}
+    ),
+    ResearchSpec(
+        "Business Analysis",
+        AgentType.BUSINESS_ANALYSIS,
+        "analyze",
+        {"query": "decomposed_tasks.business_analysis_query"},
+    ),
+    ResearchSpec(
+        "Domain Search", AgentType.DOMAIN_SEARCH, "search", {"topic": "decomposed_tasks.domain_specific_query"}
+    ),
+    ResearchSpec(
+        "Trend Spotter", AgentType.TREND_SPOTTER, "spot_trends", {"topic": "decomposed_tasks.trend_spotter_query"}
+    ),
+    ResearchSpec(
+        "User Persona", AgentType.USER_PERSONA, "create_persona", {"topic": "main_topic", "industry": "industry"}
+    ),
+)
+
+
+class ResearchAgentPool:
+    """
+    Idle tool-bound research agents, kept per (agent type, model) and reused across invocations.
+
+    Building a strands Agent registers its tools and sets up its tool executor; leasing an idle one
+    only clears its conversation. An agent is returned to the pool only after an invocation that
+    completed, so an abandoned invocation still running on its thread never shares its agent.
+    """
+
+    def __init__(self, max_idle_per_key: int = 16):
+        self.max_idle_per_key = max_idle_per_key
+        self._idle: dict[tuple[AgentType, str], list[Agent]] = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, agent_type: AgentType, model_id: str) -> Agent:
+        with self._lock:
+            idle = self._idle.get((agent_type, model_id))
+            if idle:
+                return idle.pop()
+        return AgentFactory.create_agent(
+            model_id,
+            system_prompt=get_prompt_service().get_system_prompt(agent_type),
+            tools=[websearch],
+        )
+
+    def release(self, agent_type: AgentType, model_id: str, agent: Agent) -> None:
+        agent.messages = []
+        agent.event_loop_metrics = EventLoopMetrics()
+        with self._lock:
+            idle = self._idle.setdefault((agent_type, model_id), [])
+            if len(idle) < self.max_idle_per_key:
+                idle.append(agent)
+
+
+research_agent_pool = ResearchAgentPool(max_idle_per_key=settings.research_executor_workers)
+
+
+async def run_research_async(spec: ResearchSpec, mission_brief: MissionBrief, model_id: str | None = None) -> str:
+    """
+    Run one research lane on the research executor.
+
+    Args:
+        spec: The research lane
+        mission_brief: Mission brief providing the lane's prompt inputs
+        model_id: Model of the parallel research step, used when the lane's agent type has no route
+    """
+    model_id = resolve_model_id(spec.agent_type) or model_id or settings.claude_3_5_sonnet_model_id
+    prompt = spec.format_prompt(mission_brief)
+    logger.info(f"Executing {spec.name} with prompt: {prompt}")
+
+    agent = research_agent_pool.acquire(spec.agent_type, model_id)
+    result = await invoke_agent_async(agent, prompt, research_semaphore())
+    research_agent_pool.release(spec.agent_type, model_id, agent)
+    return result
@@ -1,30 +1,88 @@
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 from deep_research_agent.agents.base_agent import BaseAgent
 from deep_research_agent.common.config import settings
 from deep_research_agent.common.schemas import AgentType
-from deep_research_agent.core.agent_factory import AgentFactory
-from deep_research_agent.services.prompt_service import PromptService
+from deep_research_agent.core.async_agent import research_semaphore
+from deep_research_agent.core.model_routing import resolve_model_id
+from deep_research_agent.services.prompt_service import PromptService, get_prompt_service
 from deep_research_agent.utils.logger import logger
+from deep_research_agent.utils.text import chunk_by_token_budget, estimate_tokens
+
+# Separator between reports or briefs in a summarizer prompt
+REPORT_SEPARATOR = "\n\n---\n\n"
+# Reduce rounds after which the remaining briefs are merged regardless of their size
+MAX_REDUCE_ROUNDS = 3
 
 
 class SearchSummarizerAgent(BaseAgent):
+    agent_type = AgentType.SEARCH_SUMMARIZER
+
     def __init__(self, prompt_service: PromptService, model_id: str | None = None):
-        super().__init__(prompt_service)
-        self._agent = AgentFactory.create_agent(model_id or settings.claude_3_5_sonnet_model_id)
-        if self.prompt_service:
-            self._agent.system_prompt = self.prompt_service.get_system_prompt(AgentType.SEARCH_SUMMARIZER)
+        super().__init__(prompt_service, model_id or settings.claude_3_5_sonnet_model_id)
 
     def execute(self, context: dict[str, Any]):
         if not self.prompt_service:
             raise ValueError("PromptService is not available for SearchSummarizerAgent")
 
-        reports_str = "\n\n---\n\n".join(context["research_results"])
+        # Merge the partial briefs condensed during research when available; otherwise
+        # synthesize the full reports
+        research_summaries = context.get("research_summaries")
+        documents = research_summaries or context["research_results"]
+        if research_summaries:
+            template_name, key = "merge_partial_briefs", "briefs_str"
+        else:
+            template_name, key = "summarize_reports", "reports_str"
+
+        # Input too large for one call: condense chunks concurrently (map) until the briefs fit (reduce)
+        reduce_round = 0
+        while (
+            estimate_tokens(REPORT_SEPARATOR.join(documents)) > settings.summarizer_map_reduce_threshold_tokens
+            and reduce_round < MAX_REDUCE_ROUNDS
+        ):
+            reduce_round += 1
+            documents = self._summarize_chunks(documents)
+            template_name, key = "merge_partial_briefs", "briefs_str"
+
         prompt = self.prompt_service.format_user_prompt(
-            AgentType.SEARCH_SUMMARIZER,
-            "summarize_reports",
-            reports_str=reports_str,
+            AgentType.SEARCH_SUMMARIZER, template_name, **{key: REPORT_SEPARATOR.join(documents)}
         )
-        result = self._agent(prompt)
+        result = self._invoke(prompt)
         context["creative_brief"] = str(result)
         logger.info(f"Creative Brief:\n{result}\n")
+
+    def _summarize_chunks(self, documents: list[str]) -> list[str]:
+        """Condense documents, packed into token-budgeted chunks, into one partial brief per chunk."""
+        chunks = chunk_by_token_budget(documents, settings.summarizer_chunk_tokens, REPORT_SEPARATOR)
+        logger.info(f"Summarizing research input in {len(chunks)} chunks")
+        prompts = [
+            self.prompt_service.format_user_prompt(
+                AgentType.SEARCH_SUMMARIZER, "summarize_chunk", part=part, total=len(chunks), chunk=chunk
+            )
+            for part, chunk in enumerate(chunks, start=1)
+        ]
+        # Each call runs in its own copy of the step's context, so token usage and streamed
+        # tokens are still attributed to this step
+        with ThreadPoolExecutor(max_workers=min(settings.summarizer_max_concurrency, len(prompts))) as executor:
+            futures = [executor.submit(contextvars.copy_context().run, self._invoke, prompt) for prompt in prompts]
+            return [future.result() for future in futures]
+
+
+async def condense_research_report_async(source: str, report: str) -> str:
+    """
+    Condense one research report into a partial brief for the final creative brief.
+
+    Runs on the summarizer's model, through its response cache and model fallback, while the
+    remaining research agents are still working.
+
+    Args:
+        source: Name of the research agent that produced the report
+        report: The report text
+    """
+    summarizer = SearchSummarizerAgent(get_prompt_service(), resolve_model_id(AgentType.SEARCH_SUMMARIZER))
+    prompt = summarizer.prompt_service.format_user_prompt(
+        AgentType.SEARCH_SUMMARIZER, "condense_report", source=source, report=report
+    )
+    return await summarizer._invoke_async(prompt, research_semaphore())
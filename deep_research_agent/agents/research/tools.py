@@ -1,10 +1,16 @@
-import json
 import logging
 
 import requests
 from strands import tool
 
 from deep_research_agent.common.config import settings
+from deep_research_agent.services.page_fetcher import page_fetcher
+from deep_research_agent.services.search_client import DEFAULT_RESULT_COUNT, get_search_backend
+from deep_research_agent.services.search_results import (
+    format_search_results,
+    project_search_results,
+    rerank_search_results,
+)
 
 # Configure logging
 logging.getLogger("strands").setLevel(logging.INFO)
@@ -19,13 +25,12 @@ def websearch(keywords: str, region: str = "us-en", max_results: int | None = No
         region (str): The search region, e.g., 'us-en' for USA with English.
         max_results (int | None): The maximum number of results to return.
     Returns:
-        String with search results.
+        String with the most relevant search results: title, source, URL and snippet of each,
+            plus the page text of the top results when page fetching is enabled.
     """
-    url = "https://google.serper.dev/search"
-    api_key = settings.serper_api_key
-
-    if not api_key:
-        return "Error: SERPER_API_KEY environment variable is not set. Please set it to use the websearch tool."
+    backend = get_search_backend()
+    if not backend.available:
+        return f"Error: the websearch tool is unavailable: {backend.unavailable_reason}"
 
     payload = {"q": keywords}
     if region:
@@ -35,16 +40,20 @@ def websearch(keywords: str, region: str = "us-en", max_results: int | None = No
             payload["gl"] = country
         if lang:
             payload["hl"] = lang
-    if max_results:
-        payload["num"] = str(max_results)
-
-    headers = {"X-API-KEY": api_key, "Content-Type": "application/json"}
+    # Fetch at least a default page of candidates so reranking has something to choose from
+    top_k = max_results or settings.search_top_k
+    if top_k > DEFAULT_RESULT_COUNT:
+        payload["num"] = top_k
 
     try:
-        response = requests.post(url, headers=headers, data=json.dumps(payload))
-        response.raise_for_status()  # Raise an exception for bad status codes
-        results = response.json()
-        return str(results) if results else "No results found."
+        results = project_search_results(backend.search(payload))
+        results = rerank_search_results(keywords, results)[:top_k]
+        if settings.search_fetch_content:
+            fetched = results[: settings.page_fetch_top_n]
+            contents = page_fetcher.fetch_contents([result.url for result in fetched])
+            for result in fetched:
+                result.content = contents.get(result.url)
+        return format_search_results(results, settings.search_snippet_max_chars)
     except requests.exceptions.RequestException as e:
         return f"RequestException: {e}"
     except Exception as e:
@@ -1,61 +0,0 @@
-import asyncio
-
-from strands import Agent, tool
-
-from deep_research_agent.agents.research.tools import websearch
-from deep_research_agent.common.schemas import AgentType
-from deep_research_agent.services.prompt_service import PromptService
-from deep_research_agent.utils.logger import logger
-
-
-@tool
-def trend_spotter(query: str, agent: Agent | None = None) -> str:
-    """
-    Identifies emerging trends for a given topic.
-
-    Args:
-        query: The topic to spot trends for
-        agent: Shared Agent instance (if None, creates a new one)
-    """
-    logger.info(f"Executing Trend Spotter with query: {query}")
-
-    if agent is None:
-        from strands.models import BedrockModel
-
-        from deep_research_agent.common.config import settings
-
-        model = BedrockModel(
-            model_id="anthropic.claude-3-sonnet-20240229-v1:0",
-            region_name=settings.aws_region,
-        )
-        agent = Agent(model=model)
-
-    # Initialize prompt service to access system and user prompts
-    prompt_service = PromptService()
-
-    # Create a trend-spotting agent with the websearch tool
-    trend_spotter_agent = Agent(
-        model=agent.model,
-        tools=[websearch],
-        system_prompt=prompt_service.get_system_prompt(AgentType.TREND_SPOTTER),
-    )
-
-    # Build the user prompt using the template
-    user_prompt = prompt_service.format_user_prompt(AgentType.TREND_SPOTTER, "spot_trends", topic=query)
-
-    # Call the agent and return its response
-    result = trend_spotter_agent(user_prompt)
-    return str(result)
-
-
-async def trend_spotter_async(query: str, agent: Agent | None = None) -> str:
-    """
-    Async version of trend_spotter for parallel execution.
-
-    Args:
-        query: The topic to spot trends for
-        agent: Shared Agent instance (if None, creates a new one)
-    """
-    # Run the synchronous function in a thread pool to avoid blocking
-    loop = asyncio.get_event_loop()
-    return await loop.run_in_executor(None, trend_spotter, query, agent)
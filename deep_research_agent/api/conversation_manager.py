@@ -9,9 +9,16 @@ class ConversationManager:
 
     def create_conversation(self) -> str:
         conversation_id = str(uuid.uuid4())
-        self.conversations[conversation_id] = OrchestratorAgent()
+        self.conversations[conversation_id] = OrchestratorAgent(workflow_id=conversation_id)
         return conversation_id
 
+    def restore_conversation(self, conversation_id: str) -> OrchestratorAgent | None:
+        """Load a conversation that is no longer in memory (e.g. after a restart) from its workflow checkpoint."""
+        orchestrator = OrchestratorAgent.from_checkpoint(conversation_id)
+        if orchestrator:
+            self.conversations[conversation_id] = orchestrator
+        return orchestrator
+
     def get_conversation(self, conversation_id: str) -> OrchestratorAgent | None:
         return self.conversations.get(conversation_id)
 
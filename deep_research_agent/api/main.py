@@ -1,15 +1,38 @@
+import asyncio
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI, HTTPException
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, StreamingResponse
 from pydantic import BaseModel
 
 from deep_research_agent.api.conversation_manager import conversation_manager
+from deep_research_agent.common.config import settings
 from deep_research_agent.common.schemas import AwaitingUserInputError
+from deep_research_agent.core.agent_pool import step_agent_pool
+from deep_research_agent.core.jobs import Job, job_runner
 from deep_research_agent.core.workflow import DEFAULT_WORKFLOW, get_workflow_metadata
+from deep_research_agent.services.page_fetcher import page_fetcher
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    if settings.agent_pool_warmup:
+        # Build step agents and Bedrock clients up front so the first conversation doesn't pay for them
+        await asyncio.to_thread(step_agent_pool.warm, DEFAULT_WORKFLOW)
+    if settings.background_jobs_enabled:
+        job_runner.start()
+    yield
+    await job_runner.stop()
+    await asyncio.to_thread(page_fetcher.close)
+
 
 app = FastAPI(
     title="Deep Research Agent API",
     description="API for orchestrating a multi-agent deep research workflow.",
     version="0.1.0",
     root_path="/deepresearch-api-stage",
+    lifespan=lifespan,
 )
 
 
@@ -57,7 +80,34 @@ async def get_workflow_status(conversation_id: str):
     if not orchestrator:
         raise HTTPException(status_code=404, detail="Conversation not found")
 
-    return {"conversation_id": conversation_id, "workflow_status": orchestrator.get_workflow_status()}
+    job = job_runner.latest_job(conversation_id)
+    return {
+        "conversation_id": conversation_id,
+        "workflow_status": orchestrator.get_workflow_status(),
+        "job": job.as_dict() if job else None,
+    }
+
+
+@app.get("/research/{conversation_id}/stream")
+async def stream_workflow_events(conversation_id: str):
+    """
+    Stream workflow progress as Server-Sent Events.
+
+    Replays the step events so far, then pushes live events until the workflow completes or fails:
+    - workflow_started / workflow_completed / workflow_failed
+    - step_started / step_completed / step_failed
+    - awaiting_input, with the clarifying questions
+    - token: incremental model output of the running step (live only, not replayed)
+    """
+    orchestrator = conversation_manager.get_conversation(conversation_id)
+    if not orchestrator:
+        raise HTTPException(status_code=404, detail="Conversation not found")
+
+    return StreamingResponse(
+        orchestrator.events.sse(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
 
 
 @app.get("/research/{conversation_id}/context")
@@ -113,10 +163,100 @@ async def list_conversations():
     return {"conversations": conversations}
 
 
+@app.get("/jobs/{job_id}")
+async def get_job(job_id: str):
+    """
+    Get a background job: its status and, once finished, the outcome of the workflow run
+    (use cases or the next clarifying questions) or its error.
+    """
+    job = job_runner.get(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job.as_dict()
+
+
+async def _run_conversation(conversation_id: str, run, completed_status: str) -> dict:
+    """Run a workflow call of a conversation, reporting a pause for clarifying questions as an outcome."""
+    orchestrator = conversation_manager.get_conversation(conversation_id)
+    if not orchestrator:
+        raise LookupError(f"Conversation not found: {conversation_id}")
+    try:
+        result = await run(orchestrator)
+        return {"status": completed_status, "conversation_id": conversation_id, "result": result}
+    except AwaitingUserInputError as e:
+        # Update status to awaiting_input
+        orchestrator._update_status("awaiting_input")
+        return {"status": "awaiting_input", "conversation_id": conversation_id, "questions": e.questions}
+
+
+async def _start_job(payload: dict) -> dict:
+    # This path should not complete if ClarifierAgent is first
+    return await _run_conversation(
+        payload["conversation_id"], lambda orchestrator: orchestrator.start_workflow(payload["prompt"]), "completed"
+    )
+
+
+async def _respond_job(payload: dict) -> dict:
+    return await _run_conversation(
+        payload["conversation_id"],
+        lambda orchestrator: orchestrator.continue_workflow(payload["response"]),
+        "use_cases_generated",
+    )
+
+
+async def _resume_job(payload: dict) -> dict:
+    return await _run_conversation(
+        payload["conversation_id"], lambda orchestrator: orchestrator.resume_workflow(), "use_cases_generated"
+    )
+
+
+job_runner.register("start", _start_job)
+job_runner.register("respond", _respond_job)
+job_runner.register("resume", _resume_job)
+
+
+async def _submit_conversation_job(kind: str, conversation_id: str, payload: dict) -> Job:
+    # Without background jobs (e.g. on Lambda) the workflow call finishes before the response is sent
+    submit = job_runner.submit if settings.background_jobs_enabled else job_runner.run
+    try:
+        return await submit(kind, {"conversation_id": conversation_id, **payload}, key=conversation_id)
+    except RuntimeError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+
+
+def _job_response(job: Job):
+    """The outcome of a finished job (500 if it failed), or a 202 with its handle while it runs."""
+    if not job.done.is_set():
+        return _accepted(job)
+    if job.status == "failed":
+        raise HTTPException(status_code=500, detail=job.error)
+    return JSONResponse(content=jsonable_encoder(job.result))
+
+
+def _accepted(job: Job) -> JSONResponse:
+    """202 response with the handle of a job still running; progress is read from the status endpoint."""
+    conversation_id = job.payload["conversation_id"]
+    return JSONResponse(
+        status_code=202,
+        content={
+            "status": "accepted",
+            "conversation_id": conversation_id,
+            "job_id": job.id,
+            "job_status": job.status,
+            "status_url": f"/research/{conversation_id}/status",
+            "job_url": f"/jobs/{job.id}",
+        },
+    )
+
+
 @app.post("/research")
 async def start_research(request: StartRequest):
     """
     Starts a new research conversation and returns the first set of questions.
+
+    The workflow runs as a background job. If the questions are not ready within
+    JOB_START_WAIT_SECONDS, responds 202 with the job handle instead. With
+    BACKGROUND_JOBS_ENABLED off, always waits for the questions.
     """
     if request.action != "start":
         raise HTTPException(status_code=400, detail=f"Invalid action: {request.action}")
@@ -132,31 +272,53 @@ async def start_research(request: StartRequest):
     if request.uploaded_files:
         orchestrator.workflow_context["uploaded_files"] = request.uploaded_files
 
+    job = await _submit_conversation_job("start", conversation_id, {"prompt": initial_prompt})
     try:
-        result = await orchestrator.start_workflow(initial_prompt)
-        # This path should not be hit if ClarifierAgent is first
-        return {"status": "completed", "conversation_id": conversation_id, "result": result}
-    except AwaitingUserInputError as e:
-        # Update status to awaiting_input
-        orchestrator._update_status("awaiting_input")
-        return {"status": "awaiting_input", "conversation_id": conversation_id, "questions": e.questions}
+        await asyncio.wait_for(job.done.wait(), settings.job_start_wait_seconds)
+    except TimeoutError:
+        pass
+    return _job_response(job)
 
 
-@app.post("/research/{conversation_id}/respond")
+@app.post("/research/{conversation_id}/respond", status_code=202)
 async def respond(conversation_id: str, response: ConversationResponse):
     """
     Continues a conversation with a user's response.
+
+    The remaining steps run as a background job; responds 202 with the job handle right away.
+    Poll the status endpoint (or the job) for progress and the outcome: the use cases, or the
+    next clarifying questions. With BACKGROUND_JOBS_ENABLED off, responds with the outcome itself.
+    A conversation paused for questions before a restart is restored from its checkpoint when
+    WORKFLOW_CHECKPOINT_STORE is set.
     """
-    orchestrator = conversation_manager.get_conversation(conversation_id)
+    orchestrator = conversation_manager.get_conversation(conversation_id) or conversation_manager.restore_conversation(
+        conversation_id
+    )
     if not orchestrator:
         raise HTTPException(status_code=404, detail="Conversation not found")
 
-    try:
-        result = await orchestrator.continue_workflow(response.response)
-        if result.get("status") == "completed":
-            conversation_manager.end_conversation(conversation_id)
-        return {"status": "use_cases_generated", "result": result}
-    except AwaitingUserInputError as e:
-        # Update status to awaiting_input
-        orchestrator._update_status("awaiting_input")
-        return {"status": "awaiting_input", "questions": e.questions}
+    job = await _submit_conversation_job("respond", conversation_id, {"response": response.response})
+    return _job_response(job)
+
+
+@app.post("/research/{conversation_id}/resume", status_code=202)
+async def resume_research(conversation_id: str):
+    """
+    Resumes a failed or interrupted workflow from the step that did not finish, as a background job
+    (or, with BACKGROUND_JOBS_ENABLED off, before responding).
+
+    Steps that completed keep their outputs, so a retry only re-runs the failed steps. Conversations
+    no longer in memory are restored from their checkpoint when WORKFLOW_CHECKPOINT_STORE is set.
+    """
+    orchestrator = conversation_manager.get_conversation(conversation_id) or conversation_manager.restore_conversation(
+        conversation_id
+    )
+    if not orchestrator:
+        raise HTTPException(status_code=404, detail="Conversation not found")
+    if orchestrator.workflow_status["status"] in ("running", "completed"):
+        raise HTTPException(
+            status_code=409, detail=f"Workflow is {orchestrator.workflow_status['status']} and cannot be resumed"
+        )
+
+    job = await _submit_conversation_job("resume", conversation_id, {})
+    return _job_response(job)
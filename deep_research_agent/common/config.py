@@ -16,13 +16,144 @@ class Settings(BaseSettings):
     )
 
     deepseek_llm_r1_0528: str = Field(default="deepseek-llm-r1-0528", alias="DEEPSEEK_R1_MODEL_ID")
+    fast_model_id: str = Field(default="anthropic.claude-3-haiku-20240307-v1:0", alias="FAST_MODEL_ID")
+
+    # Model routing: comma-separated "agent_type=model" pairs, where model is a Bedrock model ID or a
+    # tier alias (fast, default, sonnet). Agent types without a route keep their own default model.
+    model_routing: str = Field(
+        default="clarifier=fast,conversation_summarizer=fast,query_understanding=fast",
+        alias="MODEL_ROUTING",
+    )
+    # Retry a model call on the default tier when the agent's own model is unavailable
+    # (unknown or not enabled in the account/region, not ready, or the service is down)
+    model_fallback_enabled: bool = Field(default=True, alias="MODEL_FALLBACK_ENABLED")
 
     # Boto3 Client Configuration
     boto_connect_timeout: int = Field(default=900, alias="BOTO_CONNECT_TIMEOUT")
     boto_read_timeout: int = Field(default=900, alias="BOTO_READ_TIMEOUT")
+    # Shared by every agent using a pooled Bedrock client; sized for the parallel research
+    # fan-out (5 research agents per conversation, each possibly running tools in parallel)
+    bedrock_max_pool_connections: int = Field(default=50, alias="BEDROCK_MAX_POOL_CONNECTIONS")
+
+    # Bedrock prompt caching: model IDs (without cross-region inference profile prefix) that support
+    # cache points. Models not listed never receive cache points; empty disables prompt caching.
+    prompt_cache_model_ids: str = Field(
+        default="anthropic.claude-3-7-sonnet-20250219-v1:0,anthropic.claude-3-5-haiku-20241022-v1:0",
+        alias="PROMPT_CACHE_MODEL_IDS",
+    )
+
+    # Adaptive (AIMD) limit on concurrent Bedrock calls across the process; shrinks on throttling,
+    # grows back on success. Throttled calls, and calls failing with a transient service or connection error
+    # before any output, are retried up to BEDROCK_THROTTLE_RETRIES times with jittered exponential backoff.
+    bedrock_initial_concurrency: int = Field(default=8, alias="BEDROCK_INITIAL_CONCURRENCY")
+    bedrock_min_concurrency: int = Field(default=1, alias="BEDROCK_MIN_CONCURRENCY")
+    bedrock_max_concurrency: int = Field(default=40, alias="BEDROCK_MAX_CONCURRENCY")
+    bedrock_throttle_retries: int = Field(default=4, alias="BEDROCK_THROTTLE_RETRIES")
+    bedrock_retry_base_delay: float = Field(default=1.0, alias="BEDROCK_RETRY_BASE_DELAY")
+    bedrock_retry_max_delay: float = Field(default=30.0, alias="BEDROCK_RETRY_MAX_DELAY")
+
+    # Upper bound on in-flight research agent invocations per event loop
+    research_max_concurrency: int = Field(default=10, alias="RESEARCH_MAX_CONCURRENCY")
+    # Size of the dedicated thread pool running research agent invocations (shared by all conversations)
+    research_executor_workers: int = Field(default=16, alias="RESEARCH_EXECUTOR_WORKERS")
+    # Per-agent research deadlines in seconds (0 disables): past the soft deadline an agent is stopped
+    # before its next tool call and its partial answer kept; at the hard deadline it is abandoned
+    research_soft_deadline_seconds: float = Field(default=180.0, alias="RESEARCH_SOFT_DEADLINE_SECONDS")
+    research_hard_deadline_seconds: float = Field(default=300.0, alias="RESEARCH_HARD_DEADLINE_SECONDS")
+    # Condense each research report into a partial brief as soon as its agent finishes, so the
+    # creative brief only merges partials and summarization overlaps with the slowest agent
+    research_progressive_summaries: bool = Field(default=True, alias="RESEARCH_PROGRESSIVE_SUMMARIES")
+    # Creative brief map-reduce: research input above the threshold (estimated tokens) is split into
+    # chunks of at most SUMMARIZER_CHUNK_TOKENS, condensed concurrently and then merged
+    summarizer_map_reduce_threshold_tokens: int = Field(default=24000, alias="SUMMARIZER_MAP_REDUCE_THRESHOLD_TOKENS")
+    summarizer_chunk_tokens: int = Field(default=8000, alias="SUMMARIZER_CHUNK_TOKENS")
+    summarizer_max_concurrency: int = Field(default=4, alias="SUMMARIZER_MAX_CONCURRENCY")
+
+    # Background jobs of the API: workflow runs execute on JOB_WORKERS in-process workers while requests
+    # return 202 with a job handle. POST /research waits up to JOB_START_WAIT_SECONDS for the first
+    # clarifying questions before answering 202; finished jobs can be polled for JOB_RETENTION_SECONDS
+    # With BACKGROUND_JOBS_ENABLED off, each request runs its workflow call to completion before responding.
+    # Off under AWS Lambda (set by lambda_function.py): the environment is frozen once the response is sent,
+    # so a job left running in the background would stall
+    background_jobs_enabled: bool = Field(default=True, alias="BACKGROUND_JOBS_ENABLED")
+    job_workers: int = Field(default=4, alias="JOB_WORKERS")
+    job_start_wait_seconds: float = Field(default=20.0, alias="JOB_START_WAIT_SECONDS")
+    job_retention_seconds: int = Field(default=3600, alias="JOB_RETENTION_SECONDS")
+
+    # Build the default workflow's step agents and their Bedrock clients when the API starts,
+    # instead of on the first request that reaches each step
+    agent_pool_warmup: bool = Field(default=True, alias="AGENT_POOL_WARMUP")
+
+    # Run-time budget of a workflow in seconds, excluding time spent waiting for the user (0 disables).
+    # Steps are abandoned when it runs out; optional steps are skipped when less than their soft timeout is left.
+    # Per-step soft/hard timeouts come from WORKFLOW_STEP_METADATA and can be turned off
+    workflow_budget_seconds: float = Field(default=1800.0, alias="WORKFLOW_BUDGET_SECONDS")
+    workflow_step_timeouts_enabled: bool = Field(default=True, alias="WORKFLOW_STEP_TIMEOUTS_ENABLED")
+
+    # Workflow checkpoints, saved after every finished step so a failed workflow resumes from the failed step:
+    # "file" (a pickle per workflow in the WORKFLOW_CHECKPOINT_PATH directory), "sqlite" (WORKFLOW_CHECKPOINT_PATH
+    # is the database file) or empty to keep no durable checkpoints (in-process resume still works)
+    workflow_checkpoint_store: str = Field(default="", alias="WORKFLOW_CHECKPOINT_STORE")
+    workflow_checkpoint_path: str = Field(default="checkpoints", alias="WORKFLOW_CHECKPOINT_PATH")
+
+    # LLM response cache (opt-in per AgentType, e.g. "ideation,search_summarizer")
+    llm_cache_agent_types: str = Field(default="", alias="LLM_CACHE_AGENT_TYPES")
+    llm_cache_max_entries: int = Field(default=256, alias="LLM_CACHE_MAX_ENTRIES")
+    llm_cache_ttl_seconds: int = Field(default=86400, alias="LLM_CACHE_TTL_SECONDS")
+    llm_cache_dir: str = Field(default="", alias="LLM_CACHE_DIR")  # empty disables the disk tier
+    llm_cache_max_disk_mb: int = Field(default=512, alias="LLM_CACHE_MAX_DISK_MB")
 
     # Serper API Key
     serper_api_key: str = Field(default="", alias="SERPER_API_KEY")
 
+    # Search backend: "serper" (live API) or "local" (offline BM25 index built with ingest-search-index)
+    search_backend: str = Field(default="serper", alias="SEARCH_BACKEND")
+    local_search_index_path: str = Field(default="search_index/index.json", alias="LOCAL_SEARCH_INDEX_PATH")
+    # If set, live Serper responses are saved here as JSON for ingestion into the local index
+    search_record_dir: str = Field(default="", alias="SEARCH_RECORD_DIR")
+
+    # Search client: shared keep-alive session with timeouts and bounded retries (backoff in seconds)
+    search_connect_timeout: float = Field(default=5.0, alias="SEARCH_CONNECT_TIMEOUT")
+    search_read_timeout: float = Field(default=20.0, alias="SEARCH_READ_TIMEOUT")
+    search_max_retries: int = Field(default=3, alias="SEARCH_MAX_RETRIES")
+    search_retry_backoff: float = Field(default=0.5, alias="SEARCH_RETRY_BACKOFF")
+    search_pool_maxsize: int = Field(default=20, alias="SEARCH_POOL_MAXSIZE")
+    # Multi-query searches: sent as Serper batch requests of up to SEARCH_BATCH_SIZE queries, or as
+    # concurrent single requests (at most SEARCH_MAX_CONCURRENCY at a time) when batching is disabled
+    search_batch_enabled: bool = Field(default=True, alias="SEARCH_BATCH_ENABLED")
+    search_batch_size: int = Field(default=20, alias="SEARCH_BATCH_SIZE")
+    search_max_concurrency: int = Field(default=8, alias="SEARCH_MAX_CONCURRENCY")
+    # Request rate limits per search backend: comma-separated "backend=rate:burst" pairs, in queries
+    # per second and bucket size. Callers queue for tokens instead of failing; unlisted backends are unlimited
+    search_rate_limits: str = Field(default="serper=5:10", alias="SEARCH_RATE_LIMITS")
+
+    # Number of reranked search results returned to the model per websearch call, and snippet length cap
+    search_top_k: int = Field(default=5, alias="SEARCH_TOP_K")
+    search_snippet_max_chars: int = Field(default=300, alias="SEARCH_SNIPPET_MAX_CHARS")
+
+    # Search result cache shared by websearch and the citation search, keyed by normalized query
+    search_cache_enabled: bool = Field(default=True, alias="SEARCH_CACHE_ENABLED")
+    search_cache_max_entries: int = Field(default=1024, alias="SEARCH_CACHE_MAX_ENTRIES")
+    search_cache_ttl_seconds: int = Field(default=86400, alias="SEARCH_CACHE_TTL_SECONDS")
+    search_cache_dir: str = Field(default="", alias="SEARCH_CACHE_DIR")  # empty disables the disk tier
+    search_cache_max_disk_mb: int = Field(default=256, alias="SEARCH_CACHE_MAX_DISK_MB")
+
+    # Page fetching: when enabled, websearch downloads the top results and fills in their main text.
+    # Downloads run concurrently (bounded overall and per host) and are capped in size; pages are
+    # cached by URL and revalidated with ETag/Last-Modified once older than PAGE_CACHE_FRESH_SECONDS
+    search_fetch_content: bool = Field(default=False, alias="SEARCH_FETCH_CONTENT")
+    page_fetch_top_n: int = Field(default=3, alias="PAGE_FETCH_TOP_N")
+    page_fetch_max_concurrency: int = Field(default=8, alias="PAGE_FETCH_MAX_CONCURRENCY")
+    page_fetch_per_host_limit: int = Field(default=2, alias="PAGE_FETCH_PER_HOST_LIMIT")
+    page_fetch_timeout: float = Field(default=10.0, alias="PAGE_FETCH_TIMEOUT")
+    page_fetch_max_bytes: int = Field(default=2_000_000, alias="PAGE_FETCH_MAX_BYTES")
+    page_fetch_user_agent: str = Field(default="deep-research-agent/1.0", alias="PAGE_FETCH_USER_AGENT")
+    page_content_max_chars: int = Field(default=4000, alias="PAGE_CONTENT_MAX_CHARS")
+    page_cache_max_entries: int = Field(default=512, alias="PAGE_CACHE_MAX_ENTRIES")
+    page_cache_ttl_seconds: int = Field(default=7 * 86400, alias="PAGE_CACHE_TTL_SECONDS")
+    page_cache_fresh_seconds: int = Field(default=3600, alias="PAGE_CACHE_FRESH_SECONDS")
+    page_cache_dir: str = Field(default="", alias="PAGE_CACHE_DIR")  # empty disables the disk tier
+    page_cache_max_disk_mb: int = Field(default=512, alias="PAGE_CACHE_MAX_DISK_MB")
+
 
 settings = Settings()
@@ -0,0 +1,4 @@
+# Boundary between the reusable prefix of a user prompt template (static instructions, shared
+# context) and its per-call content. The model layer turns it into a Bedrock cache point when
+# prompt caching is enabled for the model, and strips it otherwise.
+PROMPT_CACHE_BREAK = "<cache_point/>"
@@ -1,39 +1,240 @@
+import itertools
+import threading
+import time
+from collections.abc import Iterable
+from typing import Any
+
 from botocore.config import Config
+from botocore.exceptions import ClientError, HTTPClientError
+from botocore.exceptions import ConnectionError as BotocoreConnectionError
 from strands import Agent
 from strands.models import BedrockModel
+from strands.types.content import Messages
+from strands.types.exceptions import ModelThrottledException
+from strands.types.streaming import StreamEvent
+from strands.types.tools import ToolSpec
 
 from deep_research_agent.common.config import settings
+from deep_research_agent.common.prompt_cache import PROMPT_CACHE_BREAK
+from deep_research_agent.core.async_agent import deadline_callback_handler
+from deep_research_agent.core.concurrency import AdaptiveConcurrencyLimiter, jittered_backoff
+from deep_research_agent.core.usage import record_token_usage
+from deep_research_agent.utils.logger import logger
+
+# Shared by every pooled model, since Bedrock throttles per account and region rather than per model handle
+bedrock_limiter = AdaptiveConcurrencyLimiter(
+    initial_limit=settings.bedrock_initial_concurrency,
+    min_limit=settings.bedrock_min_concurrency,
+    max_limit=settings.bedrock_max_concurrency,
+)
+
+
+# Bedrock error codes of calls that failed on the service side rather than because of the request
+_TRANSIENT_ERROR_CODES = frozenset({"InternalServerException", "ServiceUnavailableException"})
+
+
+class BedrockThrottledError(Exception):
+    """A Bedrock call was still throttled after the limiter's retries."""
+
+
+def supports_prompt_caching(model_id: str) -> bool:
+    """Whether prompt caching is enabled for a model (directly or through a cross-region inference profile)."""
+    cache_models = {item.strip() for item in settings.prompt_cache_model_ids.split(",") if item.strip()}
+    return model_id in cache_models or model_id.split(".", 1)[-1] in cache_models
+
+
+class LimitedBedrockModel(BedrockModel):
+    """
+    BedrockModel whose calls run under the process-wide adaptive concurrency limit.
+
+    Also places prompt cache points in the conversation (when the model is configured with
+    ``cache_prompt``) and reports token usage of every call to the current workflow step.
+    """
+
+    def format_request(
+        self,
+        messages: Messages,
+        tool_specs: list[ToolSpec] | None = None,
+        system_prompt: str | None = None,
+    ) -> dict[str, Any]:
+        request = super().format_request(messages, tool_specs, system_prompt)
+        request["messages"] = self._format_cache_points(messages)
+        return request
+
+    def _format_cache_points(self, messages: Messages) -> Messages:
+        """
+        Turn the template cache break of the latest user prompt into a cache point and add a rolling
+        cache point after the conversation so far, so each tool-loop cycle re-reads the previous one.
+
+        The system prompt and tool cache points come from the model config, which keeps the total
+        within Bedrock's limit of four cache points per request. Messages are copied, never mutated:
+        they belong to the agent's history.
+        """
+        caching = bool(self.config.get("cache_prompt"))
+        formatted: Messages = []
+        for index, message in enumerate(messages):
+            is_latest = index == len(messages) - 1
+            content = []
+            for block in message["content"]:
+                if "text" not in block or PROMPT_CACHE_BREAK not in block["text"]:
+                    content.append(block)
+                    continue
+                prefix, _, suffix = block["text"].rpartition(PROMPT_CACHE_BREAK)
+                prefix = prefix.replace(PROMPT_CACHE_BREAK, "")
+                # Bedrock rejects empty text blocks, and a cache point needs content before it
+                if caching and is_latest and prefix:
+                    content.extend([{"text": prefix}, {"cachePoint": {"type": "default"}}])
+                    if suffix:
+                        content.append({"text": suffix})
+                elif prefix + suffix:
+                    content.append({"text": prefix + suffix})
+            formatted.append({**message, "content": content})
+
+        if caching and len(formatted) > 1:
+            last = formatted[-1]
+            formatted[-1] = {**last, "content": [*last["content"], {"cachePoint": {"type": "default"}}]}
+        return formatted
+
+    def stream(self, request: dict[str, Any]) -> Iterable[StreamEvent]:
+        # The only retry layer for throttles and transient service errors: the boto client does not retry,
+        # and the final throttle is raised as BedrockThrottledError rather than ModelThrottledException,
+        # which strands' event loop would otherwise retry again (up to 6 times, from a 4s delay) outside
+        # the limiter. Calls are only retried before their first event, so no output is ever repeated
+        retries = settings.bedrock_throttle_retries
+        model_id = self.config.get("model_id")
+        for attempt in range(retries + 1):
+            streaming = False
+            try:
+                with bedrock_limiter.slot() as slot:
+                    events = iter(super().stream(request))
+                    try:
+                        # Throttling is reported when the stream is opened, before any event is produced
+                        first_event = next(events)
+                    except StopIteration:
+                        return
+                    except ModelThrottledException as e:
+                        slot.mark_throttled()
+                        if attempt == retries:
+                            raise BedrockThrottledError(
+                                f"Bedrock throttled {model_id} on all {retries + 1} attempts"
+                            ) from e
+                    else:
+                        streaming = True
+                        try:
+                            for event in itertools.chain([first_event], events):
+                                if "metadata" in event and "usage" in event["metadata"]:
+                                    record_token_usage(event["metadata"]["usage"])
+                                yield event
+                        except ModelThrottledException:
+                            # Too late to retry here: the limit still shrinks, and strands' event loop retries
+                            # the whole model turn, which comes back through this method and the limiter
+                            slot.mark_throttled()
+                            raise
+                        return
+            except Exception as e:
+                if streaming or attempt == retries or not _is_transient_error(e):
+                    raise
+                delay = jittered_backoff(attempt, settings.bedrock_retry_base_delay, settings.bedrock_retry_max_delay)
+                logger.warning(
+                    f"Bedrock call to {model_id} failed ({e}); retrying in {delay:.1f}s "
+                    f"(attempt {attempt + 2}/{retries + 1})"
+                )
+            else:
+                bedrock_limiter.record_retry()
+                delay = jittered_backoff(attempt, settings.bedrock_retry_base_delay, settings.bedrock_retry_max_delay)
+                logger.warning(
+                    f"Bedrock throttled {model_id}; retrying in {delay:.1f}s "
+                    f"(attempt {attempt + 2}/{retries + 1}, concurrency limit now {bedrock_limiter.limit})"
+                )
+            time.sleep(delay)
+
+
+def _is_transient_error(error: Exception) -> bool:
+    """Whether a Bedrock call failed on the service or connection side, so the same call may succeed if retried."""
+    if isinstance(error, ClientError):
+        return error.response.get("Error", {}).get("Code") in _TRANSIENT_ERROR_CODES
+    return isinstance(error, (BotocoreConnectionError, HTTPClientError))
 
 
 class AgentFactory:
-    _default_agent: Agent | None = None
+    # Process-wide pool of Bedrock models (and therefore boto clients / connection pools),
+    # keyed by (model_id, region, connect_timeout, read_timeout)
+    _models: dict[tuple[str, str, int, int], LimitedBedrockModel] = {}
+    _models_lock = threading.Lock()
 
     @classmethod
-    def get_default_agent(cls) -> Agent:
-        if cls._default_agent is None:
-            config = Config(
-                connect_timeout=settings.boto_connect_timeout,
-                read_timeout=settings.boto_read_timeout,
-            )
-            model = BedrockModel(
-                model_id=settings.default_model_id,
-                region_name=settings.aws_region,
-                boto_client_config=config,
-            )
-            cls._default_agent = Agent(model=model)
-        return cls._default_agent
+    def get_model(cls, model_id: str | None = None) -> LimitedBedrockModel:
+        """
+        Get the pooled BedrockModel for a model ID, creating it on first use.
+
+        Every agent built by the factory (and every research tool agent) shares the returned
+        model, so the underlying bedrock-runtime client and its TLS connections are reused, and
+        every call goes through the adaptive concurrency limiter.
+
+        Args:
+            model_id: Bedrock model ID. Defaults to settings.default_model_id.
+        """
+        key = (
+            model_id or settings.default_model_id,
+            settings.aws_region,
+            settings.boto_connect_timeout,
+            settings.boto_read_timeout,
+        )
+        model = cls._models.get(key)
+        if model is None:
+            with cls._models_lock:
+                model = cls._models.get(key)
+                if model is None:
+                    config = Config(
+                        connect_timeout=settings.boto_connect_timeout,
+                        read_timeout=settings.boto_read_timeout,
+                        max_pool_connections=settings.bedrock_max_pool_connections,
+                        # Throttles must reach LimitedBedrockModel.stream, which retries them (and transient
+                        # service errors) under the concurrency limiter; botocore's own retries would hide them
+                        retries={"mode": "standard", "total_max_attempts": 1},
+                    )
+                    # Cache points after the system prompt and tool specs; message cache points are
+                    # placed by LimitedBedrockModel.format_request
+                    cache_config = (
+                        {"cache_prompt": "default", "cache_tools": "default"}
+                        if supports_prompt_caching(key[0])
+                        else {}
+                    )
+                    model = LimitedBedrockModel(
+                        model_id=key[0],
+                        region_name=settings.aws_region,
+                        boto_client_config=config,
+                        **cache_config,
+                    )
+                    cls._models[key] = model
+        return model
 
     @classmethod
-    def create_agent(cls, model_id: str | None = None) -> Agent:
-        config = Config(
-            connect_timeout=settings.boto_connect_timeout,
-            read_timeout=settings.boto_read_timeout,
+    def create_agent(
+        cls,
+        model_id: str | None = None,
+        system_prompt: str | None = None,
+        tools: list | None = None,
+    ) -> Agent:
+        """
+        Create a new agent handle on top of the pooled model.
+
+        Handles are cheap: the model client is shared, while the system prompt and message
+        history belong to the handle. Never mutate a handle shared with another workflow;
+        create a new one per call instead.
+
+        Args:
+            model_id: Bedrock model ID. Defaults to settings.default_model_id.
+            system_prompt: System prompt for this handle.
+            tools: Tools to bind to this handle.
+        """
+        return Agent(
+            model=cls.get_model(model_id),
+            system_prompt=system_prompt,
+            tools=tools,
+            # Stream tokens to the running workflow's event stream instead of printing them, and stop
+            # at the hard deadline of the step (or research invocation) that made the call
+            callback_handler=deadline_callback_handler,
+            # Tool hot-reloading registers every agent with a process-wide directory watcher
+            load_tools_from_directory=False,
         )
-        if model_id:
-            model = BedrockModel(
-                model_id=model_id,
-                region_name=settings.aws_region,
-                boto_client_config=config,
-            )
-            return Agent(model=model)
-        return cls.get_default_agent()
@@ -0,0 +1,92 @@
+import functools
+import inspect
+import threading
+from collections.abc import Iterable
+from typing import Any
+
+from deep_research_agent.agents.base_agent import BaseAgent
+from deep_research_agent.common.schemas import AgentType
+from deep_research_agent.core.agent_factory import AgentFactory
+from deep_research_agent.core.agent_registry import AGENT_REGISTRY
+from deep_research_agent.core.model_routing import resolve_model_id
+from deep_research_agent.services.prompt_service import get_prompt_service
+from deep_research_agent.utils.logger import logger
+
+
+@functools.cache
+def _init_parameters(agent_class: type) -> frozenset[str]:
+    """Names of the keyword arguments an agent class's constructor accepts."""
+    return frozenset(inspect.signature(agent_class.__init__).parameters)
+
+
+class StepAgentPool:
+    """
+    Process-wide instances of the workflow step agents, keyed by (agent type, agent class, model).
+
+    Step agents keep no per-run state (each model call runs on a fresh strands handle over the pooled
+    Bedrock model), so a single instance per key serves every step of every conversation, including
+    concurrent ones. Building an instance (constructor introspection, clients, sub-agents) happens
+    once, at warm-up or on first use.
+    """
+
+    def __init__(self, registry: dict[AgentType, type]):
+        self.registry = registry
+        self._agents: dict[tuple[AgentType, type, str | None], BaseAgent] = {}
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "created": 0}
+
+    def get(self, agent_type: AgentType) -> BaseAgent:
+        """Get the agent for a step type, on its routed model; raises ValueError for unregistered types."""
+        agent_class = self.registry.get(agent_type)
+        if not agent_class:
+            raise ValueError(f"No agent found for agent type: {agent_type.value}")
+
+        model_id = resolve_model_id(agent_type)
+        key = (agent_type, agent_class, model_id)
+        agent = self._agents.get(key)
+        if agent is not None:
+            with self._lock:
+                self._stats["hits"] += 1
+            return agent
+
+        with self._lock:
+            agent = self._agents.get(key)
+            if agent is None:
+                agent = self._create(agent_class, model_id)
+                self._agents[key] = agent
+                self._stats["created"] += 1
+            else:
+                self._stats["hits"] += 1
+        return agent
+
+    def warm(self, agent_types: Iterable[AgentType]) -> None:
+        """Build the agents of the given step types and the Bedrock models they run on."""
+        for agent_type in dict.fromkeys(agent_types):
+            try:
+                agent = self.get(agent_type)
+                if agent.effective_model_id:
+                    AgentFactory.get_model(agent.effective_model_id)
+            except Exception as e:  # noqa: BLE001 - the step retries on first use and reports the error then
+                logger.warning(f"Failed to warm up the {agent_type.value} agent: {e}")
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {**self._stats, "agents": len(self._agents)}
+
+    @staticmethod
+    def _create(agent_class: type, model_id: str | None) -> BaseAgent:
+        # Pass prompt_service and the routed model if the constructor accepts them
+        parameters = _init_parameters(agent_class)
+        init_kwargs = {}
+        if "prompt_service" in parameters:
+            init_kwargs["prompt_service"] = get_prompt_service()
+        if model_id and "model_id" in parameters:
+            init_kwargs["model_id"] = model_id
+        try:
+            return agent_class(**init_kwargs)
+        except Exception as e:
+            logger.error(f"Failed to instantiate agent {agent_class.__name__}: {e}")
+            raise
+
+
+step_agent_pool = StepAgentPool(AGENT_REGISTRY)
@@ -0,0 +1,208 @@
+import asyncio
+import contextvars
+import threading
+import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+from strands import Agent
+
+from deep_research_agent.common.config import settings
+from deep_research_agent.core.events import stream_callback_handler
+from deep_research_agent.utils.logger import logger
+
+
+class InvocationCancelledError(Exception):
+    """Raised inside an agent's event loop to abandon an invocation whose caller went away."""
+
+
+class InvocationTimeoutError(Exception):
+    """Raised to the caller when an agent invocation misses its deadline; carries the text streamed so far."""
+
+    def __init__(self, message: str, partial_text: str = "", hard: bool = False):
+        super().__init__(message)
+        self.partial_text = partial_text
+        self.hard = hard
+
+
+class InvocationDeadline:
+    """
+    Soft and hard deadlines (monotonic clock) for the agent invocations started in a context.
+
+    Past the soft deadline an agent is stopped at its next tool round trip and its partial answer
+    is kept; at the hard deadline it is abandoned immediately.
+    """
+
+    def __init__(self, soft_seconds: float | None, hard_seconds: float | None):
+        now = time.monotonic()
+        self.soft_at = now + soft_seconds if soft_seconds else None
+        self.hard_at = now + hard_seconds if hard_seconds else None
+
+    @staticmethod
+    def remaining(at: float | None) -> float | None:
+        return None if at is None else max(0.0, at - time.monotonic())
+
+    def hard_passed(self) -> bool:
+        return self.hard_at is not None and time.monotonic() >= self.hard_at
+
+    def capped_by(self, other: "InvocationDeadline | None") -> "InvocationDeadline":
+        """This deadline, brought forward to ``other``'s soft and hard deadlines where those come first."""
+        if other is None:
+            return self
+        capped = InvocationDeadline(None, None)
+        capped.soft_at = min((at for at in (self.soft_at, other.soft_at) if at is not None), default=None)
+        capped.hard_at = min((at for at in (self.hard_at, other.hard_at) if at is not None), default=None)
+        return capped
+
+
+# Deadlines applied to agent invocations started in this context
+current_invocation_deadline: contextvars.ContextVar[InvocationDeadline | None] = contextvars.ContextVar(
+    "current_invocation_deadline", default=None
+)
+
+
+def deadline_callback_handler(**kwargs: Any) -> None:
+    """
+    Default agent callback handler: streams tokens like ``stream_callback_handler``, and aborts the
+    invocation at its next event once the hard deadline in ``current_invocation_deadline`` has passed.
+
+    Agents called synchronously by a step see the step's deadline, so a step abandoned at its hard
+    timeout stops making model calls on the worker thread it leaves behind.
+    """
+    deadline = current_invocation_deadline.get()
+    if deadline is not None and deadline.hard_passed():
+        raise InvocationCancelledError("Agent invocation passed its hard deadline")
+    stream_callback_handler(**kwargs)
+
+
+# Dedicated threads for research agent invocations, so long agent runs never occupy the event
+# loop's default executor
+research_executor = ThreadPoolExecutor(
+    max_workers=settings.research_executor_workers, thread_name_prefix="research-agent"
+)
+
+
+_research_semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def research_semaphore() -> asyncio.Semaphore:
+    """
+    Get the semaphore bounding in-flight research model invocations on the running event loop.
+
+    One semaphore per loop, because asyncio primitives cannot be shared between loops.
+    """
+    loop = asyncio.get_running_loop()
+    semaphore = _research_semaphores.get(loop)
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(settings.research_max_concurrency)
+        _research_semaphores[loop] = semaphore
+    return semaphore
+
+
+async def invoke_agent_async(agent: Agent, prompt: str, semaphore: asyncio.Semaphore | None = None) -> str:
+    """
+    Invoke an agent without blocking the event loop or borrowing default-executor threads.
+
+    The agent runs on the research executor and reports back through its callback handler,
+    which also forwards streamed tokens to the current workflow's event stream. If the awaiting
+    task is cancelled, queued work is dropped and running work is aborted at its next streamed
+    event, so abandoned work stops instead of running to completion.
+
+    Deadlines from ``current_invocation_deadline`` apply: past the soft deadline the agent is
+    stopped before its next tool round trip, and at the hard deadline the caller stops waiting.
+    Either way ``InvocationTimeoutError`` is raised with the text streamed so far.
+
+    Args:
+        agent: A private agent handle (never one shared with another caller)
+        prompt: The user prompt
+        semaphore: Optional semaphore bounding concurrent invocations
+
+    Raises:
+        InvocationTimeoutError: If the invocation missed its soft or hard deadline
+    """
+    if semaphore is None:
+        return await _run_agent(agent, prompt)
+    async with semaphore:
+        return await _run_agent(agent, prompt)
+
+
+async def _run_agent(agent: Agent, prompt: str) -> str:
+    loop = asyncio.get_running_loop()
+    done: asyncio.Future[str] = loop.create_future()
+    cancelled = threading.Event()
+    wrap_up = threading.Event()
+    streamed: list[str] = []
+
+    def callback_handler(**kwargs: Any) -> None:
+        if cancelled.is_set():
+            raise InvocationCancelledError("Agent invocation was cancelled by its caller")
+        if wrap_up.is_set() and _starts_tool_round_trip(kwargs.get("message")):
+            raise InvocationCancelledError("Agent invocation passed its soft deadline")
+        if "data" in kwargs:
+            streamed.append(str(kwargs["data"]))
+        stream_callback_handler(**kwargs)
+
+    def settle(result: str | None, error: BaseException | None) -> None:
+        if done.done():
+            return
+        if error is not None:
+            done.set_exception(error)
+        else:
+            done.set_result(result or "")
+
+    def run() -> None:
+        result, error = None, None
+        try:
+            result = str(agent(prompt, callback_handler=callback_handler))
+        except BaseException as e:  # noqa: BLE001 - surfaced to the awaiting task
+            error = e
+        if wrap_up.is_set() and _caused_by_cancellation(error):
+            error = InvocationTimeoutError("Agent invocation passed its soft deadline", "".join(streamed))
+        if cancelled.is_set():
+            return
+        try:
+            loop.call_soon_threadsafe(settle, result, error)
+        except RuntimeError:
+            pass  # event loop already closed
+
+    # Run in a copy of the caller's context so callbacks see the workflow's event stream
+    context = contextvars.copy_context()
+    work = research_executor.submit(context.run, run)
+    deadline = current_invocation_deadline.get()
+    try:
+        if deadline is None:
+            return await done
+        soft_remaining = InvocationDeadline.remaining(deadline.soft_at)
+        if soft_remaining is not None:
+            await asyncio.wait([done], timeout=soft_remaining)
+            if not done.done():
+                logger.info("Agent invocation passed its soft deadline; stopping at the next tool round trip")
+                wrap_up.set()
+        await asyncio.wait([done], timeout=InvocationDeadline.remaining(deadline.hard_at))
+        if not done.done():
+            raise InvocationTimeoutError("Agent invocation passed its hard deadline", "".join(streamed), hard=True)
+        return done.result()
+    except BaseException:
+        # Abandon the invocation: drop it if still queued, otherwise abort it at its next event
+        cancelled.set()
+        work.cancel()
+        raise
+
+
+def _caused_by_cancellation(error: BaseException | None) -> bool:
+    """Whether an error is, or wraps, an InvocationCancelledError raised from the callback handler."""
+    while error is not None:
+        if isinstance(error, InvocationCancelledError):
+            return True
+        error = error.__cause__ or error.__context__
+    return False
+
+
+def _starts_tool_round_trip(message: dict[str, Any] | None) -> bool:
+    """Whether a message added to the conversation leads to more tool calls (tool use or tool results)."""
+    if not message:
+        return False
+    return any("toolUse" in block or "toolResult" in block for block in message.get("content", []))
@@ -0,0 +1,132 @@
+import functools
+import os
+import pickle
+import re
+import sqlite3
+import tempfile
+import threading
+import time
+from abc import ABC, abstractmethod
+from contextlib import closing
+from typing import Any
+
+from deep_research_agent.common.config import settings
+from deep_research_agent.utils.logger import logger
+
+# Workflow ids become file names, so they are limited to characters that are safe in a path
+_WORKFLOW_ID_PATTERN = re.compile(r"^[A-Za-z0-9_-]{1,128}$")
+
+
+def _validate_workflow_id(workflow_id: str) -> str:
+    if not _WORKFLOW_ID_PATTERN.match(workflow_id):
+        raise ValueError(f"Invalid workflow id: {workflow_id!r}")
+    return workflow_id
+
+
+class CheckpointStore(ABC):
+    """
+    Durable store of workflow checkpoints, one per workflow id.
+
+    A checkpoint is a plain dict (workflow, context, step states and history) saved after every
+    finished step; the latest one replaces the previous. Values are pickled, so the workflow context
+    may hold the pydantic models the agents produce.
+    """
+
+    @abstractmethod
+    def save(self, workflow_id: str, checkpoint: dict[str, Any]) -> None:
+        """Save ``checkpoint`` as the latest checkpoint of ``workflow_id``."""
+
+    @abstractmethod
+    def load(self, workflow_id: str) -> dict[str, Any] | None:
+        """Return the latest checkpoint of ``workflow_id``, or None if there is none."""
+
+    @abstractmethod
+    def delete(self, workflow_id: str) -> None:
+        """Remove the checkpoint of ``workflow_id``, if any."""
+
+
+class FileCheckpointStore(CheckpointStore):
+    """Checkpoints as one pickle file per workflow in a local directory, replaced atomically on save."""
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        os.makedirs(self.directory, exist_ok=True)
+
+    def save(self, workflow_id: str, checkpoint: dict[str, Any]) -> None:
+        data = pickle.dumps(checkpoint)
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, self._path(workflow_id))
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def load(self, workflow_id: str) -> dict[str, Any] | None:
+        try:
+            with open(self._path(workflow_id), "rb") as f:
+                return pickle.load(f)
+        except FileNotFoundError:
+            return None
+
+    def delete(self, workflow_id: str) -> None:
+        try:
+            os.remove(self._path(workflow_id))
+        except FileNotFoundError:
+            pass
+
+    def _path(self, workflow_id: str) -> str:
+        return os.path.join(self.directory, f"{_validate_workflow_id(workflow_id)}.pkl")
+
+
+class SQLiteCheckpointStore(CheckpointStore):
+    """Checkpoints as rows of a local SQLite database, one row per workflow."""
+
+    def __init__(self, path: str):
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self._execute(
+            "CREATE TABLE IF NOT EXISTS checkpoints "
+            "(workflow_id TEXT PRIMARY KEY, data BLOB NOT NULL, saved_at REAL NOT NULL)"
+        )
+
+    def save(self, workflow_id: str, checkpoint: dict[str, Any]) -> None:
+        self._execute(
+            "INSERT OR REPLACE INTO checkpoints (workflow_id, data, saved_at) VALUES (?, ?, ?)",
+            (_validate_workflow_id(workflow_id), pickle.dumps(checkpoint), time.time()),
+        )
+
+    def load(self, workflow_id: str) -> dict[str, Any] | None:
+        rows = self._execute(
+            "SELECT data FROM checkpoints WHERE workflow_id = ?", (_validate_workflow_id(workflow_id),)
+        )
+        return pickle.loads(rows[0][0]) if rows else None
+
+    def delete(self, workflow_id: str) -> None:
+        self._execute("DELETE FROM checkpoints WHERE workflow_id = ?", (_validate_workflow_id(workflow_id),))
+
+    def _execute(self, sql: str, parameters: tuple = ()) -> list[tuple]:
+        # A connection per statement: saves run on worker threads, and sqlite3 connections are bound to theirs
+        with self._lock, closing(sqlite3.connect(self.path, timeout=30)) as connection, connection:
+            return connection.execute(sql, parameters).fetchall()
+
+
+@functools.cache
+def get_checkpoint_store() -> CheckpointStore | None:
+    """
+    Get the configured checkpoint store (WORKFLOW_CHECKPOINT_STORE), or None when checkpointing is disabled.
+    """
+    if settings.workflow_checkpoint_store == "file":
+        return FileCheckpointStore(settings.workflow_checkpoint_path)
+    if settings.workflow_checkpoint_store == "sqlite":
+        return SQLiteCheckpointStore(settings.workflow_checkpoint_path)
+    if settings.workflow_checkpoint_store:
+        logger.warning(
+            f"Unknown WORKFLOW_CHECKPOINT_STORE {settings.workflow_checkpoint_store!r}; checkpoints disabled"
+        )
+    return None
@@ -0,0 +1,214 @@
+import random
+import threading
+import time
+from collections import deque
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    Process-wide AIMD concurrency limit for calls to a rate-limited service.
+
+    Callers block in ``slot()`` while the number of in-flight calls is at the limit. Each successful
+    call grows the limit by roughly one per window of calls (additive increase); a throttled call
+    multiplies it by ``decrease_factor`` (multiplicative decrease). Throttles from calls that started
+    before the last decrease are ignored, so one burst of rejections only shrinks the limit once.
+    Thread-safe; model calls run on worker threads.
+    """
+
+    def __init__(
+        self,
+        initial_limit: int,
+        min_limit: int = 1,
+        max_limit: int = 64,
+        decrease_factor: float = 0.5,
+    ):
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.decrease_factor = decrease_factor
+
+        self._limit = float(min(max(initial_limit, min_limit), max_limit))
+        self._in_flight = 0
+        self._waiting = 0
+        self._last_decrease = 0.0
+        self._condition = threading.Condition()
+        self._stats = {
+            "acquired": 0,
+            "throttled": 0,
+            "retries": 0,
+            "limit_decreases": 0,
+            "max_waiting": 0,
+            "total_wait_seconds": 0.0,
+        }
+
+    @property
+    def limit(self) -> int:
+        return int(self._limit)
+
+    @contextmanager
+    def slot(self) -> Iterator["_Slot"]:
+        """
+        Hold one unit of concurrency for the duration of a call.
+
+        Call ``mark_throttled()`` on the yielded slot if the service rejected the call;
+        otherwise the call counts as a success when the block exits without an error.
+        """
+        wait_started = time.monotonic()
+        with self._condition:
+            self._waiting += 1
+            self._stats["max_waiting"] = max(self._stats["max_waiting"], self._waiting)
+            try:
+                while self._in_flight >= self.limit:
+                    self._condition.wait()
+            finally:
+                self._waiting -= 1
+            self._in_flight += 1
+            self._stats["acquired"] += 1
+            self._stats["total_wait_seconds"] += time.monotonic() - wait_started
+
+        slot = _Slot(started_at=time.monotonic())
+        success = False
+        try:
+            yield slot
+            success = not slot.throttled
+        finally:
+            with self._condition:
+                self._in_flight -= 1
+                if slot.throttled:
+                    self._on_throttle(slot.started_at)
+                elif success:
+                    self._on_success()
+                self._condition.notify_all()
+
+    def record_retry(self) -> None:
+        with self._condition:
+            self._stats["retries"] += 1
+
+    def stats(self) -> dict[str, Any]:
+        with self._condition:
+            acquired = self._stats["acquired"]
+            return {
+                **self._stats,
+                "limit": self.limit,
+                "in_flight": self._in_flight,
+                "waiting": self._waiting,
+                "avg_wait_seconds": round(self._stats["total_wait_seconds"] / acquired, 4) if acquired else 0.0,
+                "total_wait_seconds": round(self._stats["total_wait_seconds"], 3),
+            }
+
+    def _on_success(self) -> None:
+        # Caller must hold self._condition
+        self._limit = min(self.max_limit, self._limit + 1 / self._limit)
+
+    def _on_throttle(self, started_at: float) -> None:
+        # Caller must hold self._condition
+        self._stats["throttled"] += 1
+        if started_at < self._last_decrease:
+            return
+        self._limit = max(self.min_limit, self._limit * self.decrease_factor)
+        self._last_decrease = time.monotonic()
+        self._stats["limit_decreases"] += 1
+
+
+class _Slot:
+    def __init__(self, started_at: float):
+        self.started_at = started_at
+        self.throttled = False
+
+    def mark_throttled(self) -> None:
+        self.throttled = True
+
+
+class TokenBucketRateLimiter:
+    """
+    Process-wide token bucket limiting the request rate to a metered service.
+
+    The bucket holds up to ``capacity`` tokens (the allowed burst) and refills at ``rate`` tokens
+    per second. ``acquire()`` blocks until enough tokens are available instead of failing; waiting
+    callers are served strictly in arrival order, so a caller needing many tokens is not starved by
+    a stream of small requests. A request larger than the bucket proceeds once the bucket is full
+    and leaves it in debt, which later callers wait out. Thread-safe.
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        if rate <= 0 or capacity <= 0:
+            raise ValueError(f"Token bucket rate and capacity must be positive, got {rate} and {capacity}")
+        self.rate = rate
+        self.capacity = max(capacity, 1.0)
+
+        self._tokens = self.capacity
+        self._updated_at = time.monotonic()
+        self._queue: deque[object] = deque()
+        self._condition = threading.Condition()
+        self._stats = {
+            "acquired": 0,
+            "tokens_acquired": 0.0,
+            "delayed": 0,
+            "max_waiting": 0,
+            "total_wait_seconds": 0.0,
+            "max_wait_seconds": 0.0,
+        }
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        """
+        Take ``tokens`` from the bucket, blocking until they are available.
+
+        Returns:
+            Seconds spent waiting
+        """
+        required = min(tokens, self.capacity)
+        ticket = object()
+        started = time.monotonic()
+        with self._condition:
+            self._queue.append(ticket)
+            self._stats["max_waiting"] = max(self._stats["max_waiting"], len(self._queue))
+            try:
+                while True:
+                    self._refill()
+                    if self._queue[0] is ticket:
+                        if self._tokens >= required:
+                            break
+                        self._condition.wait((required - self._tokens) / self.rate)
+                    else:
+                        self._condition.wait()
+                self._tokens -= tokens
+            finally:
+                self._queue.remove(ticket)
+                self._condition.notify_all()
+
+            waited = time.monotonic() - started
+            self._stats["acquired"] += 1
+            self._stats["tokens_acquired"] += tokens
+            self._stats["total_wait_seconds"] += waited
+            self._stats["max_wait_seconds"] = max(self._stats["max_wait_seconds"], waited)
+            if waited > 0.001:
+                self._stats["delayed"] += 1
+        return waited
+
+    def stats(self) -> dict[str, Any]:
+        with self._condition:
+            self._refill()
+            acquired = self._stats["acquired"]
+            return {
+                **self._stats,
+                "rate": self.rate,
+                "capacity": self.capacity,
+                "available_tokens": round(self._tokens, 2),
+                "waiting": len(self._queue),
+                "avg_wait_seconds": round(self._stats["total_wait_seconds"] / acquired, 4) if acquired else 0.0,
+                "total_wait_seconds": round(self._stats["total_wait_seconds"], 3),
+                "max_wait_seconds": round(self._stats["max_wait_seconds"], 3),
+            }
+
+    def _refill(self) -> None:
+        # Caller must hold self._condition
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.rate)
+        self._updated_at = now
+
+
+def jittered_backoff(attempt: int, base_delay: float, max_delay: float) -> float:
+    """Exponential backoff with full jitter: a random delay in [0, min(max_delay, base_delay * 2**attempt)]."""
+    return random.uniform(0, min(max_delay, base_delay * 2**attempt))
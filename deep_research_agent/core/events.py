@@ -0,0 +1,135 @@
+import asyncio
+import contextvars
+import json
+import threading
+from collections import deque
+from collections.abc import AsyncIterator
+from datetime import datetime
+from typing import Any
+
+# Event stream of the workflow currently executing in this context. Set by the orchestrator
+# around each step; copied into worker threads so model callbacks can publish tokens.
+current_event_stream: contextvars.ContextVar["WorkflowEventStream | None"] = contextvars.ContextVar(
+    "current_event_stream", default=None
+)
+
+# Seconds of silence after which an SSE comment is sent to keep proxies from closing the connection
+SSE_KEEPALIVE_SECONDS = 15.0
+
+
+class WorkflowEventStream:
+    """
+    Fan-out of workflow progress events to any number of async subscribers.
+
+    ``publish`` is thread-safe and may be called from agent worker threads. Progress events are
+    kept in a bounded history and replayed to late subscribers; model tokens are delivered live only.
+    """
+
+    def __init__(self, history_size: int = 200):
+        self._lock = threading.Lock()
+        self._history: deque[dict[str, Any]] = deque(maxlen=history_size)
+        self._subscribers: list[tuple[asyncio.AbstractEventLoop, asyncio.Queue]] = []
+        self._next_id = 0
+        self.closed = False
+        # Agent type of the step currently running, attached to token events
+        self.current_agent: str | None = None
+
+    def publish(self, event: str, data: dict[str, Any] | None = None, replay: bool = True) -> None:
+        """
+        Publish an event to all current subscribers.
+
+        Args:
+            event: Event name (e.g. "step_started", "token")
+            data: JSON-serializable payload
+            replay: Whether the event is kept for subscribers that connect later
+        """
+        with self._lock:
+            if self.closed:
+                return
+            self._next_id += 1
+            message = {
+                "id": self._next_id,
+                "event": event,
+                "data": {**(data or {}), "timestamp": datetime.utcnow().isoformat()},
+            }
+            if replay:
+                self._history.append(message)
+            subscribers = list(self._subscribers)
+        for loop, queue in subscribers:
+            self._deliver(loop, queue, message)
+
+    def close(self) -> None:
+        """Stop accepting events and end every subscription once its queue drains."""
+        with self._lock:
+            if self.closed:
+                return
+            self.closed = True
+            subscribers = list(self._subscribers)
+        for loop, queue in subscribers:
+            self._deliver(loop, queue, None)
+
+    async def subscribe(self, idle_timeout: float | None = None) -> AsyncIterator[dict[str, Any] | None]:
+        """
+        Yield replayed history followed by live events until the stream is closed.
+
+        Args:
+            idle_timeout: If set, yield None whenever no event arrived for this many seconds
+        """
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue()
+        with self._lock:
+            backlog = list(self._history)
+            closed = self.closed
+            if not closed:
+                self._subscribers.append((loop, queue))
+        try:
+            for message in backlog:
+                yield message
+            if closed:
+                return
+            while True:
+                try:
+                    message = await asyncio.wait_for(queue.get(), idle_timeout)
+                except TimeoutError:
+                    yield None
+                    continue
+                if message is None:
+                    return
+                yield message
+        finally:
+            with self._lock:
+                if (loop, queue) in self._subscribers:
+                    self._subscribers.remove((loop, queue))
+
+    async def sse(self) -> AsyncIterator[str]:
+        """Render the subscription as a text/event-stream body, with periodic keep-alive comments."""
+        async for message in self.subscribe(idle_timeout=SSE_KEEPALIVE_SECONDS):
+            yield format_sse(message) if message is not None else ": keep-alive\n\n"
+
+    def _deliver(self, loop: asyncio.AbstractEventLoop, queue: asyncio.Queue, message: dict | None) -> None:
+        try:
+            loop.call_soon_threadsafe(queue.put_nowait, message)
+        except RuntimeError:
+            # Subscriber's event loop is gone
+            with self._lock:
+                if (loop, queue) in self._subscribers:
+                    self._subscribers.remove((loop, queue))
+
+
+def format_sse(message: dict[str, Any]) -> str:
+    """Format an event as a Server-Sent Events frame."""
+    data = json.dumps(message["data"], default=str, ensure_ascii=False)
+    return f"id: {message['id']}\nevent: {message['event']}\ndata: {data}\n\n"
+
+
+def publish_token(text: str) -> None:
+    """Publish an incremental model token to the current workflow's event stream, if any."""
+    stream = current_event_stream.get()
+    if stream is not None and text:
+        stream.publish("token", {"agent_type": stream.current_agent, "text": text}, replay=False)
+
+
+def stream_callback_handler(**kwargs: Any) -> None:
+    """Agent callback handler that forwards streamed model text to the current workflow's event stream."""
+    if "data" in kwargs:
+        publish_token(kwargs["data"])
@@ -0,0 +1,214 @@
+import asyncio
+import time
+import uuid
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from datetime import datetime
+from typing import Any
+
+from deep_research_agent.common.config import settings
+from deep_research_agent.utils.logger import logger
+
+# Handler of one kind of job: receives the job's payload and returns its JSON-serializable result
+JobHandler = Callable[[dict[str, Any]], Awaitable[Any]]
+
+
+class Job:
+    """A unit of background work: a handler kind, its payload, and its outcome once run."""
+
+    def __init__(self, kind: str, payload: dict[str, Any], key: str | None = None):
+        self.id = uuid.uuid4().hex
+        self.kind = kind
+        self.payload = payload
+        # Jobs sharing a key (e.g. a conversation id) never run concurrently
+        self.key = key
+        self.status = "queued"  # queued, running, succeeded, failed
+        self.result: Any = None
+        self.error: str | None = None
+        self.created_at = datetime.utcnow().isoformat()
+        self.started_at: str | None = None
+        self.finished_at: str | None = None
+        self.done = asyncio.Event()
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "job_id": self.id,
+            "kind": self.kind,
+            "key": self.key,
+            "status": self.status,
+            "result": self.result,
+            "error": self.error,
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+        }
+
+
+class JobQueue(ABC):
+    """Queue feeding the job runner's workers; replaceable by an external queue service."""
+
+    @abstractmethod
+    async def put(self, job: Job) -> None:
+        """Enqueue a job."""
+
+    @abstractmethod
+    async def get(self) -> Job:
+        """Wait for and dequeue the next job."""
+
+    @abstractmethod
+    def qsize(self) -> int:
+        """Number of jobs waiting."""
+
+
+class InMemoryJobQueue(JobQueue):
+    """FIFO queue of jobs in the process's event loop."""
+
+    def __init__(self):
+        self._queue: asyncio.Queue[Job] | None = None
+
+    async def put(self, job: Job) -> None:
+        await self._get_queue().put(job)
+
+    async def get(self) -> Job:
+        return await self._get_queue().get()
+
+    def qsize(self) -> int:
+        return self._queue.qsize() if self._queue else 0
+
+    def _get_queue(self) -> asyncio.Queue[Job]:
+        # Created on first use so the queue belongs to the server's event loop
+        if self._queue is None:
+            self._queue = asyncio.Queue()
+        return self._queue
+
+
+class JobRunner:
+    """
+    In-process background job runner: a pool of worker tasks consuming a job queue.
+
+    Handlers are registered per job kind. Finished jobs are kept for ``retention_seconds`` so
+    their outcome can be polled. Jobs with the same key are refused while one of them is active,
+    which keeps a conversation's workflow from running twice at once.
+    """
+
+    def __init__(self, queue: JobQueue, workers: int = 4, retention_seconds: float = 3600):
+        self.queue = queue
+        self.workers = workers
+        self.retention_seconds = retention_seconds
+        self._handlers: dict[str, JobHandler] = {}
+        self._jobs: OrderedDict[str, Job] = OrderedDict()
+        self._active_keys: dict[str, str] = {}
+        self._worker_tasks: list[asyncio.Task] = []
+        self._finished_at: dict[str, float] = {}
+
+    def register(self, kind: str, handler: JobHandler) -> None:
+        self._handlers[kind] = handler
+
+    def start(self) -> None:
+        """Start the worker tasks in the running event loop (no-op if already started)."""
+        if self._worker_tasks:
+            return
+        self._worker_tasks = [
+            asyncio.create_task(self._work(), name=f"job-worker-{index}") for index in range(self.workers)
+        ]
+
+    async def stop(self) -> None:
+        """
+        Cancel the worker tasks; running jobs are interrupted and queued ones fail without running.
+
+        Either way the jobs finish, releasing their keys, so a restarted runner accepts new jobs for them.
+        """
+        for task in self._worker_tasks:
+            task.cancel()
+        await asyncio.gather(*self._worker_tasks, return_exceptions=True)
+        self._worker_tasks = []
+        for job in [job for job in self._jobs.values() if job.status == "queued"]:
+            job.status = "failed"
+            job.error = "Job cancelled: the job runner stopped"
+            self._finish(job)
+
+    async def submit(self, kind: str, payload: dict[str, Any], key: str | None = None) -> Job:
+        """
+        Enqueue a job and return it immediately.
+
+        Raises:
+            KeyError: No handler is registered for ``kind``
+            RuntimeError: Another job with the same key is still queued or running
+        """
+        self.start()
+        job = self._create(kind, payload, key)
+        await self.queue.put(job)
+        return job
+
+    async def run(self, kind: str, payload: dict[str, Any], key: str | None = None) -> Job:
+        """
+        Run a job to completion in the calling task, bypassing the queue, and return it.
+
+        For hosts where work cannot outlive the request (e.g. AWS Lambda); the job is still
+        recorded, so it can be polled like a queued one. Raises like ``submit``.
+        """
+        job = self._create(kind, payload, key)
+        await self._run(job)
+        return job
+
+    def _create(self, kind: str, payload: dict[str, Any], key: str | None) -> Job:
+        if kind not in self._handlers:
+            raise KeyError(f"No handler registered for job kind: {kind}")
+        if key is not None and key in self._active_keys:
+            raise RuntimeError(f"Job {self._active_keys[key]} is already active for {key}")
+        self._prune()
+
+        job = Job(kind, payload, key)
+        self._jobs[job.id] = job
+        if key is not None:
+            self._active_keys[key] = job.id
+        return job
+
+    def get(self, job_id: str) -> Job | None:
+        return self._jobs.get(job_id)
+
+    def latest_job(self, key: str) -> Job | None:
+        return next((job for job in reversed(self._jobs.values()) if job.key == key), None)
+
+    async def _work(self) -> None:
+        while True:
+            job = await self.queue.get()
+            if job.status == "queued":  # Jobs failed by stop() may still be in the queue
+                await self._run(job)
+
+    async def _run(self, job: Job) -> None:
+        job.status = "running"
+        job.started_at = datetime.utcnow().isoformat()
+        try:
+            job.result = await self._handlers[job.kind](job.payload)
+            job.status = "succeeded"
+        except asyncio.CancelledError:
+            job.status = "failed"
+            job.error = "Job cancelled"
+            raise
+        except Exception as e:
+            logger.error(f"Job {job.id} ({job.kind}) failed: {e}")
+            job.status = "failed"
+            job.error = str(e)
+        finally:
+            self._finish(job)
+
+    def _finish(self, job: Job) -> None:
+        job.finished_at = datetime.utcnow().isoformat()
+        self._finished_at[job.id] = time.monotonic()
+        if job.key is not None and self._active_keys.get(job.key) == job.id:
+            del self._active_keys[job.key]
+        job.done.set()
+
+    def _prune(self) -> None:
+        """Forget finished jobs older than the retention period."""
+        cutoff = time.monotonic() - self.retention_seconds
+        for job_id in [job_id for job_id, finished in self._finished_at.items() if finished < cutoff]:
+            del self._finished_at[job_id]
+            self._jobs.pop(job_id, None)
+
+
+job_runner = JobRunner(
+    InMemoryJobQueue(), workers=settings.job_workers, retention_seconds=settings.job_retention_seconds
+)
@@ -0,0 +1,118 @@
+import threading
+from typing import Any
+
+from botocore.exceptions import ClientError
+
+from deep_research_agent.common.config import settings
+from deep_research_agent.common.schemas import AgentType
+from deep_research_agent.utils.logger import logger
+
+
+def _model_tiers() -> dict[str, str]:
+    """Tier aliases usable in the routing table instead of full Bedrock model IDs."""
+    return {
+        "fast": settings.fast_model_id,
+        "default": settings.default_model_id,
+        "sonnet": settings.claude_3_5_sonnet_model_id,
+    }
+
+
+def _parse_routing(value: str) -> dict[AgentType, str]:
+    routes = {}
+    for item in value.split(","):
+        if not item.strip():
+            continue
+        agent_type, _, model = item.partition("=")
+        try:
+            routes[AgentType(agent_type.strip())] = model.strip()
+        except ValueError:
+            logger.warning(f"Ignoring model route for unknown agent type: {agent_type.strip()!r}")
+    return routes
+
+
+MODEL_ROUTES = _parse_routing(settings.model_routing)
+
+# Bedrock error codes meaning the requested model cannot serve calls right now, rather than a bad request
+_MODEL_UNAVAILABLE_CODES = frozenset(
+    {
+        "AccessDeniedException",
+        "ModelNotReadyException",
+        "ResourceNotFoundException",
+        "ServiceUnavailableException",
+        "ValidationException",
+    }
+)
+
+
+def resolve_model_id(agent_type: AgentType) -> str | None:
+    """
+    Resolve the model an agent type should run on.
+
+    Returns the routed model (tier aliases expanded), or None when the agent type has no route,
+    in which case the agent falls back to its own default model.
+    """
+    model = MODEL_ROUTES.get(agent_type)
+    if not model:
+        return None
+    return _model_tiers().get(model, model)
+
+
+def is_model_unavailable(error: BaseException) -> bool:
+    """
+    Whether a failed model call means its model is unavailable (the call may succeed on another model).
+
+    Strands wraps Bedrock errors in its own exceptions, so the whole cause chain is inspected.
+    A ValidationException only counts when it is about the model identifier.
+    """
+    seen = set()
+    current: BaseException | None = error
+    while current is not None and id(current) not in seen:
+        seen.add(id(current))
+        if isinstance(current, ClientError):
+            error_info = current.response.get("Error", {})
+            code = error_info.get("Code")
+            if code == "ValidationException":
+                message = error_info.get("Message", "").lower()
+                return "model identifier" in message or "model id" in message
+            return code in _MODEL_UNAVAILABLE_CODES
+        current = current.__cause__ or current.__context__
+    return False
+
+
+class ModelLatencyStats:
+    """Process-wide step latency per (agent type, model), used to tune the routing table"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stats: dict[tuple[str, str], dict[str, float]] = {}
+
+    def record(self, agent_type: AgentType, model_id: str, duration_seconds: float, success: bool = True) -> None:
+        with self._lock:
+            entry = self._stats.setdefault(
+                (agent_type.value, model_id),
+                {"count": 0, "errors": 0, "total_seconds": 0.0, "min_seconds": float("inf"), "max_seconds": 0.0},
+            )
+            entry["count"] += 1
+            if not success:
+                entry["errors"] += 1
+            entry["total_seconds"] += duration_seconds
+            entry["min_seconds"] = min(entry["min_seconds"], duration_seconds)
+            entry["max_seconds"] = max(entry["max_seconds"], duration_seconds)
+
+    def stats(self) -> list[dict[str, Any]]:
+        with self._lock:
+            return [
+                {
+                    "agent_type": agent_type,
+                    "model_id": model_id,
+                    "count": entry["count"],
+                    "errors": entry["errors"],
+                    "avg_seconds": round(entry["total_seconds"] / entry["count"], 3),
+                    "min_seconds": round(entry["min_seconds"], 3),
+                    "max_seconds": round(entry["max_seconds"], 3),
+                }
+                for (agent_type, model_id), entry in sorted(self._stats.items())
+            ]
+
+
+model_latency = ModelLatencyStats()
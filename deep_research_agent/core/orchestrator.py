@@ -1,27 +1,86 @@
+import asyncio
+import copy
 import inspect
+import time
+import uuid
+from collections.abc import Awaitable, Iterable
 from datetime import datetime
 from typing import Any
 
-from deep_research_agent.common.schemas import AgentType
-from deep_research_agent.core.agent_registry import AGENT_REGISTRY
-from deep_research_agent.core.workflow import DEFAULT_WORKFLOW, WORKFLOW_STEP_METADATA, get_workflow_metadata
-from deep_research_agent.services.prompt_service import PromptService
+from deep_research_agent.common.config import settings
+from deep_research_agent.common.schemas import AgentType, AwaitingUserInputError
+from deep_research_agent.core.agent_factory import bedrock_limiter
+from deep_research_agent.core.agent_pool import step_agent_pool
+from deep_research_agent.core.async_agent import InvocationDeadline, current_invocation_deadline
+from deep_research_agent.core.checkpoints import CheckpointStore, get_checkpoint_store
+from deep_research_agent.core.events import WorkflowEventStream, current_event_stream
+from deep_research_agent.core.model_routing import model_latency
+from deep_research_agent.core.usage import TokenUsage, current_token_usage
+from deep_research_agent.core.workflow import (
+    DEFAULT_WORKFLOW,
+    WORKFLOW_STEP_METADATA,
+    build_workflow_graph,
+    find_dead_steps,
+    find_unproduced_inputs,
+    get_workflow_metadata,
+    missing_required_inputs,
+    step_context_keys,
+    step_timeouts,
+)
+from deep_research_agent.services.prompt_service import get_prompt_service
+from deep_research_agent.services.response_cache import current_llm_cache_stats, response_cache
+from deep_research_agent.services.search_client import current_search_stats, get_search_backend
+from deep_research_agent.utils.cache import CacheLookupStats
 from deep_research_agent.utils.logger import logger
 
+# Step statuses that satisfy the dependencies of later steps
+_DONE_STATUSES = ("completed", "skipped")
+
+_MISSING = object()
+
+
+class StepTimeoutError(Exception):
+    """Raised when a workflow step runs past its hard timeout or the workflow's remaining time budget."""
+
 
 class OrchestratorAgent:
-    def __init__(self, workflow: list | None = None):
-        self.prompt_service = PromptService()
+    def __init__(
+        self,
+        workflow: list | None = None,
+        workflow_id: str | None = None,
+        checkpoint_store: CheckpointStore | None = None,
+    ):
+        self.prompt_service = get_prompt_service()
+        # Checkpoints of this workflow are saved under workflow_id after every finished step
+        self.workflow_id = workflow_id or uuid.uuid4().hex
+        self.checkpoint_store = checkpoint_store or get_checkpoint_store()
         self.workflow_context = {}  # Stores the outputs of each step
         self.workflow = workflow if workflow else DEFAULT_WORKFLOW
-        self.current_step = 0
+        self.current_step = 0  # First step that has not completed yet
+        # Steps run as soon as the steps they depend on have completed
+        self.step_dependencies = build_workflow_graph(self.workflow)
+        # Steps whose outputs nothing reads are skipped without running
+        self.dead_steps = find_dead_steps(self.workflow)
+        self._check_workflow()
+        # Per-step status: pending, running, completed, skipped, awaiting_input, error or cancelled
+        self.step_status = self._initial_step_status()
+        # Step progress and model tokens, consumed by the SSE endpoint
+        self.events = WorkflowEventStream()
+        # Search cache hits/misses of this run, across all steps
+        self.search_cache_stats = CacheLookupStats()
+        self.llm_cache_stats = CacheLookupStats()
+        # Run-time budget in seconds; time spent waiting for the user is not counted
+        self.budget_seconds = settings.workflow_budget_seconds or None
+        self.budget_used = 0.0
+        self._budget_started: float | None = None
 
         # Enhanced progress tracking
         self.workflow_status = {
-            "status": "initialized",  # initialized, running, completed, error, awaiting_input
+            "status": "initialized",  # initialized, running, completed, error, awaiting_input, interrupted
             "current_step": 0,
             "total_steps": len(self.workflow),
             "current_agent": None,
+            "running_agents": [],
             "started_at": None,
             "completed_at": None,
             "step_history": [],
@@ -30,6 +89,22 @@ class OrchestratorAgent:
             "workflow_metadata": get_workflow_metadata(self.workflow),
         }
 
+    def _check_workflow(self):
+        """Log steps that will not run: dead steps, and steps whose required inputs no step produces."""
+        for index in sorted(self.dead_steps):
+            logger.info(f"Skipping step {index} ({self.workflow[index].value}): its outputs are never used")
+        for index, keys in find_unproduced_inputs(self.workflow).items():
+            required = WORKFLOW_STEP_METADATA[self.workflow[index]].get("requires", [])
+            missing_required = [key for key in keys if key in required]
+            if missing_required:
+                logger.warning(
+                    f"Step {index} ({self.workflow[index].value}) will be skipped unless the context provides "
+                    f"{', '.join(missing_required)}: no earlier step produces them"
+                )
+
+    def _initial_step_status(self) -> list[str]:
+        return ["skipped" if index in self.dead_steps else "pending" for index in range(len(self.workflow))]
+
     def get_workflow_status(self) -> dict[str, Any]:
         """Get the current workflow status and progress"""
         current_step_metadata = None
@@ -42,8 +117,42 @@ class OrchestratorAgent:
             "workflow_context_keys": list(self.workflow_context.keys()),
             "context_summary": self._get_context_summary(),
             "current_step_metadata": current_step_metadata,
+            "steps": [
+                {
+                    "step": index,
+                    "agent_type": agent_type.value,
+                    "status": self.step_status[index],
+                    "depends_on": self.step_dependencies[index],
+                }
+                for index, agent_type in enumerate(self.workflow)
+            ],
+            # Cache lookups made by this workflow's steps
+            "llm_cache": self.llm_cache_stats.as_dict(),
+            "search_cache": self.search_cache_stats.as_dict(),
+            # Totals shared by every workflow in this process
+            "process_totals": {
+                "llm_cache": response_cache.stats(),
+                "model_latency": model_latency.stats(),
+                "agent_pool": step_agent_pool.stats(),
+                "bedrock_concurrency": bedrock_limiter.stats(),
+                "search_client": get_search_backend().stats(),
+            },
+            "time_budget": {
+                "budget_seconds": self.budget_seconds,
+                "used_seconds": round(self._budget_spent(), 3),
+                "remaining_seconds": self._remaining_budget(),
+            },
         }
 
+    def _budget_spent(self) -> float:
+        running = time.monotonic() - self._budget_started if self._budget_started is not None else 0.0
+        return self.budget_used + running
+
+    def _remaining_budget(self) -> float | None:
+        if self.budget_seconds is None:
+            return None
+        return max(0.0, self.budget_seconds - self._budget_spent())
+
     def _get_context_summary(self) -> dict[str, Any]:
         """Get a summary of the current workflow context"""
         summary = {}
@@ -60,12 +169,22 @@ class OrchestratorAgent:
 
     def _update_status(self, status: str, agent_type: AgentType | None = None):
         """Update the workflow status"""
+        self.current_step = next(
+            (index for index, step_status in enumerate(self.step_status) if step_status not in _DONE_STATUSES),
+            len(self.workflow),
+        )
+        completed = sum(step_status in _DONE_STATUSES for step_status in self.step_status)
         self.workflow_status.update(
             {
                 "status": status,
                 "current_step": self.current_step,
                 "current_agent": agent_type.value if agent_type else None,
-                "progress_percentage": (self.current_step / self.workflow_status["total_steps"]) * 100,
+                "running_agents": [
+                    self.workflow[index].value
+                    for index, step_status in enumerate(self.step_status)
+                    if step_status == "running"
+                ],
+                "progress_percentage": (completed / self.workflow_status["total_steps"]) * 100,
                 "last_updated": datetime.utcnow().isoformat(),
             }
         )
@@ -77,71 +196,245 @@ class OrchestratorAgent:
 
         self.workflow_context["conversation_history"] = [initial_prompt]
         self.current_step = 0
+        self.step_status = self._initial_step_status()
+        self.search_cache_stats = CacheLookupStats()
+        self.llm_cache_stats = CacheLookupStats()
+        self.budget_used = 0.0
 
         # Initialize workflow tracking
         self.workflow_status.update(
             {"status": "running", "started_at": datetime.utcnow().isoformat(), "step_history": []}
         )
         self._update_status("running")
+        self.events.publish("workflow_started", {"total_steps": len(self.workflow)})
 
         return await self.run_next_step()
 
     async def continue_workflow(self, user_response: str):
         self.workflow_context["conversation_history"].append(user_response)
+        self.workflow_status.pop("pending_questions", None)
         self._update_status("running")
         return await self.run_next_step()
 
     async def run_next_step(self):
-        if self.current_step >= len(self.workflow):
-            # Get use cases from ideation agent (initial_ideas or refined_ideas)
-            use_cases = self.workflow_context.get("refined_ideas") or self.workflow_context.get("initial_ideas")
-            serialized_use_cases = self._serialize_use_cases(use_cases)
+        """Run the remaining steps, concurrently where their dependencies allow, and finish the workflow."""
+        await self._run_ready_steps()
+        # Get use cases from ideation agent (initial_ideas or refined_ideas)
+        use_cases = self.workflow_context.get("refined_ideas") or self.workflow_context.get("initial_ideas")
+        serialized_use_cases = self._serialize_use_cases(use_cases)
 
-            # Mark workflow as completed
-            self.workflow_status.update(
-                {"status": "completed", "completed_at": datetime.utcnow().isoformat(), "progress_percentage": 100.0}
-            )
-            self._update_status("completed")
+        # Mark workflow as completed
+        self.workflow_status.update(
+            {"status": "completed", "completed_at": datetime.utcnow().isoformat(), "progress_percentage": 100.0}
+        )
+        self._update_status("completed")
+        self._publish_completion()
+        await self._delete_checkpoint()
+
+        logger.info("\n--- END OF WORKFLOW ---")
+        logger.info(f"Use Cases from Ideation Agent:\n{use_cases}")
+        return {"use_cases": serialized_use_cases}
 
-            logger.info("\n--- END OF WORKFLOW ---")
-            logger.info(f"Use Cases from Ideation Agent:\n{use_cases}")
-            return {"use_cases": serialized_use_cases}
+    async def _run_ready_steps(self):
+        """
+        Run steps as their dependencies complete, each ready step concurrently with the others.
 
-        agent_type = self.workflow[self.current_step]
+        If a step fails, running steps are cancelled and the error is raised. If a step pauses
+        for user input, no new steps start, running steps are allowed to finish, and the paused
+        step runs again when the workflow continues.
+        """
+        running: dict[asyncio.Task, int] = {}
+        failure: tuple[int, Exception] | None = None
+        self._budget_started = time.monotonic()
         try:
-            await self._execute_step(agent_type)
-        except Exception as e:
+            while True:
+                if failure is None:
+                    for index in self._ready_steps():
+                        self.step_status[index] = "running"
+                        running[asyncio.create_task(self._execute_step(index))] = index
+                if not running:
+                    break
+                done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    index = running.pop(task)
+                    error = task.exception()
+                    if error is None:
+                        self.step_status[index] = task.result()
+                        await self._save_checkpoint()
+                        continue
+                    paused = isinstance(error, AwaitingUserInputError)
+                    self.step_status[index] = "awaiting_input" if paused else "error"
+                    if failure is None or isinstance(failure[1], AwaitingUserInputError):
+                        failure = (index, error)
+                if failure is not None and not isinstance(failure[1], AwaitingUserInputError):
+                    await self._cancel_steps(running)
+                    break
+                self._update_status("running")
+        except asyncio.CancelledError:
+            await self._cancel_steps(running)
+            raise
+        finally:
+            self.budget_used = self._budget_spent()
+            self._budget_started = None
+
+        if failure is not None:
+            index, error = failure
+            agent_type = self.workflow[index]
+            if isinstance(error, AwaitingUserInputError):
+                # A pause, not a failure: the checkpoint keeps the questions so a restored conversation can continue
+                self.workflow_status["pending_questions"] = error.questions
+                self._update_status("awaiting_input", agent_type)
+                await self._save_checkpoint()
+                raise error
             # Record the error in workflow status
             self.workflow_status.update(
-                {"status": "error", "error": str(e), "error_step": self.current_step, "error_agent": agent_type.value}
+                {"status": "error", "error": str(error), "error_step": index, "error_agent": agent_type.value}
             )
             self._update_status("error", agent_type)
-            raise
+            await self._save_checkpoint()
+            self.events.publish("workflow_failed", {"agent_type": agent_type.value, "error": str(error)})
+            self.events.close()
+            raise error
 
-        self.current_step += 1
+    async def resume_workflow(self):
+        """
+        Resume a failed or interrupted workflow from the steps that did not finish.
+
+        Completed and skipped steps keep their outputs in the workflow context; failed, cancelled
+        and interrupted steps run again, so a retry costs the failed steps instead of the whole run.
+        """
+        if self.workflow_status["status"] in ("running", "completed"):
+            raise ValueError(f"Workflow is {self.workflow_status['status']} and cannot be resumed")
+        for index, step_status in enumerate(self.step_status):
+            if step_status in ("running", "error", "cancelled"):
+                self.step_status[index] = "pending"
+        for key in ("error", "error_step", "error_agent", "pending_questions"):
+            self.workflow_status.pop(key, None)
+        # A resumed run gets a fresh time budget
+        self.budget_used = 0.0
+        if self.events.closed:
+            # The failed run ended its event stream; subscribers of the resumed run get a new one
+            self.events = WorkflowEventStream()
+        self._update_status("running")
+        self.events.publish("workflow_resumed", {"total_steps": len(self.workflow), "from_step": self.current_step})
         return await self.run_next_step()
 
+    @classmethod
+    def from_checkpoint(
+        cls, workflow_id: str, checkpoint_store: CheckpointStore | None = None
+    ) -> "OrchestratorAgent | None":
+        """
+        Rebuild a workflow from its latest checkpoint, ready for ``resume_workflow``.
+
+        Returns None if checkpointing is disabled or the workflow has no checkpoint.
+        """
+        checkpoint_store = checkpoint_store or get_checkpoint_store()
+        if checkpoint_store is None:
+            return None
+        checkpoint = checkpoint_store.load(workflow_id)
+        if checkpoint is None:
+            return None
+
+        orchestrator = cls(
+            workflow=[AgentType(agent_type) for agent_type in checkpoint["workflow"]],
+            workflow_id=workflow_id,
+            checkpoint_store=checkpoint_store,
+        )
+        orchestrator.workflow_context = checkpoint["workflow_context"]
+        # A step still running when the checkpoint was saved was interrupted along with the process
+        orchestrator.step_status = [
+            "cancelled" if step_status == "running" else step_status for step_status in checkpoint["step_status"]
+        ]
+        orchestrator.workflow_status.update(
+            {
+                "started_at": checkpoint["started_at"],
+                "step_history": checkpoint["step_history"],
+                **checkpoint.get("error", {}),
+            }
+        )
+        if checkpoint.get("pending_questions") is not None:
+            orchestrator.workflow_status["pending_questions"] = checkpoint["pending_questions"]
+        # A checkpoint saved while running means the process stopped mid-run
+        orchestrator._update_status("interrupted" if checkpoint["status"] == "running" else checkpoint["status"])
+        logger.info(f"Restored workflow {workflow_id} from its checkpoint saved at {checkpoint['saved_at']}")
+        return orchestrator
+
+    async def _save_checkpoint(self):
+        """Save the workflow context and step states; failures are logged and never fail the workflow."""
+        if self.checkpoint_store is None:
+            return
+        checkpoint = {
+            "workflow": [agent_type.value for agent_type in self.workflow],
+            # Shallow copies: steps still running may add to the context while the checkpoint is written
+            "workflow_context": dict(self.workflow_context),
+            "step_status": list(self.step_status),
+            "step_history": list(self.workflow_status["step_history"]),
+            "status": self.workflow_status["status"],
+            "error": {
+                key: self.workflow_status[key]
+                for key in ("error", "error_step", "error_agent")
+                if key in self.workflow_status
+            },
+            "pending_questions": self.workflow_status.get("pending_questions"),
+            "started_at": self.workflow_status["started_at"],
+            "saved_at": datetime.utcnow().isoformat(),
+        }
+        try:
+            await asyncio.to_thread(self.checkpoint_store.save, self.workflow_id, checkpoint)
+        except Exception as e:  # noqa: BLE001 - a lost checkpoint only costs a longer retry
+            logger.warning(f"Failed to save checkpoint of workflow {self.workflow_id}: {e}")
+
+    async def _delete_checkpoint(self):
+        if self.checkpoint_store is None:
+            return
+        try:
+            await asyncio.to_thread(self.checkpoint_store.delete, self.workflow_id)
+        except Exception as e:  # noqa: BLE001
+            logger.warning(f"Failed to delete checkpoint of workflow {self.workflow_id}: {e}")
+
+    def _ready_steps(self) -> list[int]:
+        """Steps not yet run (or paused for user input) whose dependencies have all completed or been skipped."""
+        return [
+            index
+            for index, step_status in enumerate(self.step_status)
+            if step_status in ("pending", "awaiting_input")
+            and all(self.step_status[dependency] in _DONE_STATUSES for dependency in self.step_dependencies[index])
+        ]
+
+    async def _cancel_steps(self, running: dict[asyncio.Task, int]):
+        for task in running:
+            task.cancel()
+        await asyncio.gather(*running, return_exceptions=True)
+        for index in running.values():
+            self.step_status[index] = "cancelled"
+        running.clear()
+
     async def run_workflow_from_conversation(self, conversation_history: list):
         """
         Run the complete, dynamically configured workflow using conversation history.
         """
         self.workflow_context = {"conversation_history": conversation_history}
+        self.step_status = self._initial_step_status()
+        self.search_cache_stats = CacheLookupStats()
+        self.llm_cache_stats = CacheLookupStats()
+        self.budget_used = 0.0
 
         # Initialize workflow tracking
         self.workflow_status.update(
             {"status": "running", "started_at": datetime.utcnow().isoformat(), "step_history": []}
         )
         self._update_status("running")
+        self.events.publish("workflow_started", {"total_steps": len(self.workflow)})
 
-        for step_index, step in enumerate(self.workflow):
-            self.current_step = step_index
-            await self._execute_step(step)
+        await self._run_ready_steps()
 
         # Mark workflow as completed
         self.workflow_status.update(
             {"status": "completed", "completed_at": datetime.utcnow().isoformat(), "progress_percentage": 100.0}
         )
         self._update_status("completed")
+        self._publish_completion()
+        await self._delete_checkpoint()
 
         # Get use cases from ideation agent (initial_ideas or refined_ideas)
         use_cases = self.workflow_context.get("refined_ideas") or self.workflow_context.get("initial_ideas")
@@ -150,66 +443,199 @@ class OrchestratorAgent:
         logger.info(f"Use Cases from Ideation Agent:\n{use_cases}")
         return serialized_use_cases
 
-    async def _execute_step(self, agent_type: AgentType):
+    async def _execute_step(self, step_index: int) -> str:
+        """Run one step and return its final status: completed, or skipped if its required inputs are absent."""
+        agent_type = self.workflow[step_index]
         step_start_time = datetime.utcnow()
 
+        step_metadata = WORKFLOW_STEP_METADATA.get(agent_type, {})
+        missing_inputs = missing_required_inputs(agent_type, self.workflow_context)
+        if missing_inputs:
+            return self._skip_step(step_index, f"missing {', '.join(missing_inputs)}", missing_inputs=missing_inputs)
+
+        soft_timeout, hard_timeout = (
+            step_timeouts(agent_type) if settings.workflow_step_timeouts_enabled else (None, None)
+        )
+        remaining_budget = self._remaining_budget()
+        if step_metadata.get("optional") and remaining_budget is not None and remaining_budget < (soft_timeout or 0):
+            return self._skip_step(step_index, f"only {remaining_budget:.0f}s of the workflow time budget left")
+        budget_bound = remaining_budget is not None and (hard_timeout is None or remaining_budget < hard_timeout)
+        if budget_bound:
+            hard_timeout = remaining_budget
+            soft_timeout = min(soft_timeout, hard_timeout) if soft_timeout is not None else None
+
         logger.info(f"--- Executing Step: {agent_type.value} ---")
         self._update_status("running", agent_type)
 
-        agent_class = AGENT_REGISTRY.get(agent_type)
-        if not agent_class:
-            raise ValueError(f"No agent found for agent type: {agent_type.value}")
+        # Step agents are stateless and shared across workflows, built once per process
+        agent_instance = step_agent_pool.get(agent_type)
 
-        # Instantiate the agent, passing prompt_service if it's a required parameter
-        try:
-            # Check if the agent's __init__ accepts 'prompt_service'
-            sig = inspect.signature(agent_class.__init__)
-            if "prompt_service" in sig.parameters:
-                agent_instance = agent_class(prompt_service=self.prompt_service)
-            else:
-                agent_instance = agent_class()
-        except Exception as e:
-            logger.error(f"Failed to instantiate agent {agent_class.__name__}: {e}")
-            raise
+        model_id = agent_instance.effective_model_id
+        self.events.current_agent = agent_type.value
+        self.events.publish(
+            "step_started",
+            {
+                "step": step_index,
+                "total_steps": len(self.workflow),
+                "agent_type": agent_type.value,
+                "model_id": model_id,
+                "name": step_metadata.get("name"),
+                "estimated_duration": step_metadata.get("estimated_duration"),
+            },
+        )
+        # Model callbacks (including those on worker threads) publish tokens to this workflow's stream,
+        # and model calls add their token usage (including prompt cache reads) to this step
+        stream_token = current_event_stream.set(self.events)
+        token_usage = TokenUsage()
+        usage_token = current_token_usage.set(token_usage)
+        search_stats_token = current_search_stats.set(self.search_cache_stats)
+        llm_cache_stats_token = current_llm_cache_stats.set(self.llm_cache_stats)
+        # Research agents started by the step wrap up at its soft timeout and stop at its hard timeout
+        deadline_token = current_invocation_deadline.set(InvocationDeadline(soft_timeout, hard_timeout))
+        # The step works on its own copy of the context, in which the keys it declares are deep copies (agents
+        # mutate values in place, e.g. the conversation history), and its changes are merged back only if it
+        # succeeds, so a step abandoned at its hard timeout cannot change the workflow while its worker thread
+        # winds down. A step without declared inputs may touch any key, so it gets a deep copy of everything
+        initial_context = dict(self.workflow_context)
+        declared_keys = step_context_keys(agent_type)
+        copied_keys = initial_context.keys() if declared_keys is None else declared_keys & initial_context.keys()
+        step_context = {
+            key: copy.deepcopy(value) if key in copied_keys else value for key, value in initial_context.items()
+        }
 
         try:
             if inspect.iscoroutinefunction(agent_instance.execute):
-                await agent_instance.execute(self.workflow_context)
+                run = agent_instance.execute(step_context)
             else:
-                agent_instance.execute(self.workflow_context)
+                # Run blocking agents off the event loop so concurrent workflows keep making progress
+                run = asyncio.to_thread(agent_instance.execute, step_context)
+            try:
+                await self._run_with_timeouts(step_index, run, soft_timeout, hard_timeout)
+            except TimeoutError as e:
+                limit = "the workflow's time budget" if budget_bound else f"its {hard_timeout:g}s hard timeout"
+                raise StepTimeoutError(f"{agent_type.value} step exceeded {limit}") from e
+            self._merge_step_context(initial_context, step_context, copied_keys)
 
             # Record successful step completion
             step_end_time = datetime.utcnow()
             step_duration = (step_end_time - step_start_time).total_seconds()
 
             step_record = {
-                "step": self.current_step,
+                "step": step_index,
                 "agent_type": agent_type.value,
+                "model_id": model_id,
                 "status": "completed",
                 "started_at": step_start_time.isoformat(),
                 "completed_at": step_end_time.isoformat(),
                 "duration_seconds": step_duration,
+                "token_usage": token_usage.as_dict(),
             }
 
             self.workflow_status["step_history"].append(step_record)
+            if model_id:
+                model_latency.record(agent_type, model_id, step_duration)
+            self.events.publish("step_completed", step_record)
+            return "completed"
 
         except Exception as e:
+            if isinstance(e, StepTimeoutError) and step_metadata.get("optional"):
+                # Degrade instead of failing: the workflow completes without this step's output
+                logger.warning(f"Skipping optional step {agent_type.value}: {e}")
+                return self._skip_step(step_index, str(e))
+
             # Record failed step
             step_end_time = datetime.utcnow()
             step_duration = (step_end_time - step_start_time).total_seconds()
 
             step_record = {
-                "step": self.current_step,
+                "step": step_index,
                 "agent_type": agent_type.value,
+                "model_id": model_id,
                 "status": "error",
                 "started_at": step_start_time.isoformat(),
                 "error_at": step_end_time.isoformat(),
                 "duration_seconds": step_duration,
+                "token_usage": token_usage.as_dict(),
                 "error": str(e),
             }
 
             self.workflow_status["step_history"].append(step_record)
+            if model_id:
+                # Pausing for user input is a normal outcome of the step's model call
+                model_latency.record(agent_type, model_id, step_duration, isinstance(e, AwaitingUserInputError))
+            if isinstance(e, AwaitingUserInputError):
+                self.events.publish("awaiting_input", {"step": step_index, "questions": e.questions})
+            else:
+                self.events.publish("step_failed", step_record)
             raise
+        finally:
+            current_event_stream.reset(stream_token)
+            current_token_usage.reset(usage_token)
+            current_search_stats.reset(search_stats_token)
+            current_llm_cache_stats.reset(llm_cache_stats_token)
+            current_invocation_deadline.reset(deadline_token)
+            if self.events.current_agent == agent_type.value:
+                self.events.current_agent = None
+
+    def _merge_step_context(self, initial_context: dict, step_context: dict, copied_keys: Iterable[str]):
+        """Apply the keys a finished step added, changed or removed in its copy of the context to the workflow."""
+        for key, value in step_context.items():
+            original = initial_context.get(key, _MISSING)
+            # Copied values are compared by value, shared ones by identity
+            changed = original != value if key in copied_keys else original is not value
+            if changed:
+                self.workflow_context[key] = value
+        for key in initial_context.keys() - step_context.keys():
+            self.workflow_context.pop(key, None)
+
+    async def _run_with_timeouts(
+        self, step_index: int, run: Awaitable, soft_timeout: float | None, hard_timeout: float | None
+    ):
+        """Await a step, reporting it as slow past the soft timeout and cancelling it at the hard timeout."""
+        slow_handle = None
+        if soft_timeout is not None and (hard_timeout is None or soft_timeout < hard_timeout):
+            slow_handle = asyncio.get_running_loop().call_later(
+                soft_timeout, self._report_slow_step, step_index, soft_timeout
+            )
+        try:
+            await asyncio.wait_for(run, hard_timeout)
+        finally:
+            if slow_handle is not None:
+                slow_handle.cancel()
+
+    def _report_slow_step(self, step_index: int, soft_timeout: float):
+        agent_type = self.workflow[step_index]
+        logger.warning(f"Step {agent_type.value} is still running after its {soft_timeout:.0f}s soft timeout")
+        self.events.publish("step_slow", {"step": step_index, "agent_type": agent_type.value, "after": soft_timeout})
+
+    def _skip_step(self, step_index: int, reason: str, **details: Any) -> str:
+        """Record a step that does not run (or whose output is dropped) and return its "skipped" status."""
+        agent_type = self.workflow[step_index]
+        logger.info(f"--- Skipping Step: {agent_type.value} ({reason}) ---")
+        step_record = {
+            "step": step_index,
+            "agent_type": agent_type.value,
+            "status": "skipped",
+            "reason": reason,
+            **details,
+            "skipped_at": datetime.utcnow().isoformat(),
+        }
+        self.workflow_status["step_history"].append(step_record)
+        self.events.publish("step_skipped", step_record)
+        return "skipped"
+
+    def _publish_completion(self):
+        """Publish the final workflow event and end all event stream subscriptions"""
+        self.events.publish(
+            "workflow_completed",
+            {
+                "completed_at": self.workflow_status["completed_at"],
+                "step_history": self.workflow_status["step_history"],
+                "llm_cache": self.llm_cache_stats.as_dict(),
+                "search_cache": self.search_cache_stats.as_dict(),
+            },
+        )
+        self.events.close()
 
     def _serialize_use_cases(self, use_cases):
         """
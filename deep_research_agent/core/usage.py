@@ -0,0 +1,42 @@
+import contextvars
+import threading
+from typing import Any
+
+# Token usage accumulator of the workflow step currently executing in this context
+current_token_usage: contextvars.ContextVar["TokenUsage | None"] = contextvars.ContextVar(
+    "current_token_usage", default=None
+)
+
+
+class TokenUsage:
+    """Thread-safe token counters for the model calls made during one workflow step"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counts = {
+            "model_calls": 0,
+            "input_tokens": 0,
+            "output_tokens": 0,
+            "cache_read_input_tokens": 0,
+            "cache_write_input_tokens": 0,
+        }
+
+    def add(self, usage: dict[str, Any]) -> None:
+        """Add the ``usage`` block of a Bedrock stream metadata event."""
+        with self._lock:
+            self._counts["model_calls"] += 1
+            self._counts["input_tokens"] += usage.get("inputTokens", 0)
+            self._counts["output_tokens"] += usage.get("outputTokens", 0)
+            self._counts["cache_read_input_tokens"] += usage.get("cacheReadInputTokens", 0)
+            self._counts["cache_write_input_tokens"] += usage.get("cacheWriteInputTokens", 0)
+
+    def as_dict(self) -> dict[str, int]:
+        with self._lock:
+            return dict(self._counts)
+
+
+def record_token_usage(usage: dict[str, Any]) -> None:
+    """Add a model call's usage to the current step's counters, if a step is being tracked."""
+    token_usage = current_token_usage.get()
+    if token_usage is not None:
+        token_usage.add(usage)
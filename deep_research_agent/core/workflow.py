@@ -28,91 +28,165 @@ SIMPLE_WORKFLOW = [
     AgentType.PARALLEL_RESEARCH,
     AgentType.SEARCH_SUMMARIZER,
     AgentType.IDEATION,
+    AgentType.EVALUATION_COORDINATOR,  # Scores the ideas for ranking
     AgentType.RANKING,
     AgentType.REPORT_SYNTHESIZER,
 ]
 
-# Step metadata for better progress tracking and user display
+# Context keys supplied by the caller rather than produced by a step
+EXTERNAL_CONTEXT_KEYS = frozenset(
+    {"conversation_history", "uploaded_files", "project_id", "user_id", "conversation_id"}
+)
+
+# Context keys read after the workflow finishes (the workflow's results)
+WORKFLOW_RESULT_KEYS = frozenset({"initial_ideas", "refined_ideas", "citation_report", "final_report"})
+
+# Step metadata for progress tracking, user display and scheduling. "inputs" and "outputs" are the
+# workflow context keys a step reads and writes; the orchestrator derives step dependencies from them.
+# A step is skipped when any of its "requires" keys is missing or empty when it becomes ready.
+# Past "soft_timeout_seconds" a step is reported as slow and its research agents wrap up; at
+# "hard_timeout_seconds" it is abandoned. "optional" steps are skipped when the workflow's remaining time
+# budget is below their soft timeout, and skipped instead of failing the workflow when they time out.
 WORKFLOW_STEP_METADATA = {
     AgentType.DOCUMENT_SUMMARIZER: {
         "name": "Document Analysis",
         "description": "Analyzing uploaded documents and extracting key information",
         "estimated_duration": "30-60 seconds",
-        "outputs": ["document_summaries", "key_insights"],
+        "soft_timeout_seconds": 120,
+        "hard_timeout_seconds": 240,
+        "inputs": ["uploaded_files", "conversation_history"],
+        "requires": ["uploaded_files"],
+        "outputs": ["document_summaries", "conversation_history"],
     },
     AgentType.CLARIFIER: {
         "name": "Query Clarification",
         "description": "Asking clarifying questions to better understand the research objectives",
         "estimated_duration": "5-10 seconds",
-        "outputs": ["clarifying_questions"],
+        "soft_timeout_seconds": 60,
+        "hard_timeout_seconds": 120,
+        "inputs": ["conversation_history", "document_summaries"],
+        "outputs": ["conversation_history"],
         "user_interaction": True,
     },
     AgentType.CONVERSATION_SUMMARIZER: {
         "name": "Context Summarization",
         "description": "Summarizing conversation context and user inputs",
         "estimated_duration": "10-20 seconds",
-        "outputs": ["conversation_summary", "key_requirements"],
+        "soft_timeout_seconds": 60,
+        "hard_timeout_seconds": 120,
+        "inputs": ["conversation_history"],
+        "requires": ["conversation_history"],
+        "outputs": ["summary"],
     },
     AgentType.QUERY_ENHANCER: {
         "name": "Query Enhancement",
         "description": "Enhancing and expanding search queries for better research coverage",
         "estimated_duration": "15-30 seconds",
-        "outputs": ["enhanced_queries", "search_terms"],
+        "soft_timeout_seconds": 60,
+        "hard_timeout_seconds": 120,
+        "inputs": ["summary"],
+        "requires": ["summary"],
+        "outputs": ["enhanced_prompt"],
     },
     AgentType.QUERY_UNDERSTANDING: {
         "name": "Query Analysis",
         "description": "Analyzing and understanding the research intent and scope",
         "estimated_duration": "10-20 seconds",
-        "outputs": ["query_analysis", "research_scope"],
+        "soft_timeout_seconds": 60,
+        "hard_timeout_seconds": 120,
+        "inputs": ["enhanced_prompt"],
+        "requires": ["enhanced_prompt"],
+        "outputs": ["mission_brief"],
     },
     AgentType.PARALLEL_RESEARCH: {
         "name": "Multi-Agent Research",
         "description": "Running parallel research agents to gather comprehensive data",
         "estimated_duration": "2-5 minutes",
-        "outputs": ["research_results", "data_collection"],
+        "soft_timeout_seconds": 360,
+        "hard_timeout_seconds": 480,
+        "inputs": ["mission_brief"],
+        "requires": ["mission_brief"],
+        "outputs": ["research_results", "research_summaries"],
         "concurrent": True,
     },
     AgentType.SEARCH_SUMMARIZER: {
         "name": "Research Synthesis",
         "description": "Synthesizing and summarizing research findings",
         "estimated_duration": "30-60 seconds",
-        "outputs": ["research_summary", "key_findings"],
+        "soft_timeout_seconds": 180,
+        "hard_timeout_seconds": 300,
+        "inputs": ["research_results", "research_summaries"],
+        "requires": ["research_results"],
+        "outputs": ["creative_brief"],
     },
     AgentType.IDEATION: {
         "name": "Use Case Generation",
         "description": "Generating innovative use cases and opportunities",
         "estimated_duration": "45-90 seconds",
-        "outputs": ["use_cases", "opportunities"],
+        "soft_timeout_seconds": 180,
+        "hard_timeout_seconds": 300,
+        "inputs": ["creative_brief", "devils_advocate_feedback"],
+        "requires": ["creative_brief"],
+        "outputs": ["initial_ideas", "refined_ideas"],
     },
     AgentType.DEVILS_ADVOCATE: {
         "name": "Critical Analysis",
         "description": "Applying critical thinking and identifying potential challenges",
         "estimated_duration": "30-60 seconds",
-        "outputs": ["critical_feedback", "challenges"],
+        "soft_timeout_seconds": 120,
+        "hard_timeout_seconds": 180,
+        "optional": True,
+        "inputs": ["initial_ideas"],
+        "requires": ["initial_ideas"],
+        "outputs": ["devils_advocate_feedback"],
     },
     AgentType.EVALUATION_COORDINATOR: {
         "name": "Evaluation Coordination",
         "description": "Coordinating evaluation of generated use cases",
         "estimated_duration": "45-90 seconds",
-        "outputs": ["evaluation_results", "scores"],
+        "soft_timeout_seconds": 240,
+        "hard_timeout_seconds": 360,
+        "inputs": ["initial_ideas"],
+        "requires": ["initial_ideas"],
+        "outputs": ["scored_ideas"],
     },
     AgentType.RANKING: {
         "name": "Ranking & Prioritization",
         "description": "Ranking and prioritizing use cases based on multiple criteria",
         "estimated_duration": "30-45 seconds",
-        "outputs": ["ranked_use_cases", "priority_scores"],
+        "soft_timeout_seconds": 30,
+        "hard_timeout_seconds": 60,
+        "inputs": ["scored_ideas"],
+        "requires": ["scored_ideas"],
+        "outputs": ["ranked_ideas"],
     },
     AgentType.REPORT_SYNTHESIZER: {
         "name": "Report Generation",
         "description": "Generating comprehensive final report with recommendations",
         "estimated_duration": "60-120 seconds",
-        "outputs": ["final_report", "recommendations"],
+        "soft_timeout_seconds": 240,
+        "hard_timeout_seconds": 360,
+        "inputs": ["ranked_ideas", "creative_brief"],
+        "requires": ["ranked_ideas", "creative_brief"],
+        "outputs": ["final_report"],
     },
     AgentType.CITATION_REPORT_GENERATOR: {
         "name": "PDF Strategy Report with Citations",
         "description": "Generating a single comprehensive PDF business strategy report with clickable citation links, consolidating all use cases by implementation stages",
         "estimated_duration": "2-3 minutes",
-        "outputs": ["citation_report", "pdf_report_with_clickable_links", "staged_roadmap", "upload_urls"],
+        "soft_timeout_seconds": 300,
+        "hard_timeout_seconds": 420,
+        "optional": True,
+        "inputs": [
+            "initial_ideas",
+            "refined_ideas",
+            "creative_brief",
+            "summary",
+            "project_id",
+            "user_id",
+            "conversation_id",
+        ],
+        "outputs": ["citation_report"],
     },
 }
 
@@ -145,3 +219,98 @@ def get_workflow_metadata(workflow: list | None = None) -> list:
         workflow_meta.append({"step_number": i, "agent_type": agent_type.value, **step_meta})
 
     return workflow_meta
+
+
+def _step_io(agent_type: AgentType) -> tuple[set[str], set[str]] | None:
+    """Context keys read and written by a step, or None if the step does not declare them."""
+    step_meta = WORKFLOW_STEP_METADATA.get(agent_type, {})
+    if "inputs" not in step_meta:
+        return None
+    return set(step_meta["inputs"]), set(step_meta.get("outputs", []))
+
+
+def step_context_keys(agent_type: AgentType) -> set[str] | None:
+    """Context keys a step reads or writes, or None if the step does not declare them."""
+    step_io = _step_io(agent_type)
+    return None if step_io is None else step_io[0] | step_io[1]
+
+
+def build_workflow_graph(workflow: list) -> list[list[int]]:
+    """
+    Derive the dependency graph of a workflow from its steps' declared inputs and outputs.
+
+    A step depends on every earlier step that writes a key it reads, writes a key it also writes,
+    or reads a key it overwrites, so running ready steps concurrently gives the same result as
+    running the list in order. Steps without declared inputs are barriers: they depend on all
+    earlier steps and all later steps depend on them.
+
+    Returns:
+        For each step (by position), the sorted positions of the steps it depends on.
+    """
+    step_io = [_step_io(agent_type) for agent_type in workflow]
+    dependencies = []
+    for index, current in enumerate(step_io):
+        depends_on = []
+        for earlier_index, earlier in enumerate(step_io[:index]):
+            if current is None or earlier is None:
+                depends_on.append(earlier_index)
+                continue
+            inputs, outputs = current
+            earlier_inputs, earlier_outputs = earlier
+            if inputs & earlier_outputs or outputs & earlier_outputs or outputs & earlier_inputs:
+                depends_on.append(earlier_index)
+        dependencies.append(depends_on)
+    return dependencies
+
+
+def step_timeouts(agent_type: AgentType) -> tuple[float | None, float | None]:
+    """Soft and hard timeouts of a step in seconds (None where not configured)."""
+    step_meta = WORKFLOW_STEP_METADATA.get(agent_type, {})
+    return step_meta.get("soft_timeout_seconds"), step_meta.get("hard_timeout_seconds")
+
+
+def find_dead_steps(workflow: list) -> set[int]:
+    """
+    Steps whose outputs are never used: not read by any later live step and not a workflow result.
+
+    Steps that interact with the user are always kept, and so are a step that does not declare its
+    inputs and outputs and every step before it, since it may read any key.
+    """
+    dead: set[int] = set()
+    needed = set(WORKFLOW_RESULT_KEYS)
+    # Walk backwards so a step only feeding dead steps is dead too
+    for index in range(len(workflow) - 1, -1, -1):
+        step_meta = WORKFLOW_STEP_METADATA.get(workflow[index], {})
+        step_io = _step_io(workflow[index])
+        if step_io is None:
+            break
+        if step_meta.get("user_interaction"):
+            needed |= step_io[0]
+            continue
+        inputs, outputs = step_io
+        if outputs & needed:
+            needed |= inputs
+        else:
+            dead.add(index)
+    return dead
+
+
+def find_unproduced_inputs(workflow: list) -> dict[int, list[str]]:
+    """Declared inputs of each step that neither an earlier step nor the caller ever provides."""
+    produced = set(EXTERNAL_CONTEXT_KEYS)
+    unproduced = {}
+    for index, agent_type in enumerate(workflow):
+        step_io = _step_io(agent_type)
+        if step_io is None:
+            continue
+        inputs, outputs = step_io
+        missing = sorted(inputs - produced)
+        if missing:
+            unproduced[index] = missing
+        produced |= outputs
+    return unproduced
+
+
+def missing_required_inputs(agent_type: AgentType, context: dict) -> list[str]:
+    """Required inputs of a step that are missing or empty in the workflow context."""
+    return [key for key in WORKFLOW_STEP_METADATA.get(agent_type, {}).get("requires", []) if not context.get(key)]
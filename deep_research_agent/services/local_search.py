@@ -0,0 +1,232 @@
+import argparse
+import json
+import math
+import os
+import tempfile
+import threading
+import time
+from collections import Counter, deque
+from pathlib import Path
+from typing import Any
+
+from deep_research_agent.core.concurrency import TokenBucketRateLimiter
+from deep_research_agent.services.search_client import DEFAULT_RESULT_COUNT, SearchBackend
+from deep_research_agent.services.search_results import tokenize
+from deep_research_agent.utils.logger import logger
+
+# Characters of a document's text used as its snippet in search responses
+SNIPPET_CHARS = 300
+
+
+class LocalSearchIndex:
+    """
+    On-disk BM25 inverted index over documents with a title, URL and text.
+
+    The index is a single JSON file holding the documents, per-document term counts and the
+    postings lists; it is loaded into memory once, so queries take milliseconds.
+    """
+
+    def __init__(self, k1: float = 1.5, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+        self.documents: list[dict[str, str]] = []
+        self.doc_lengths: list[int] = []
+        self.postings: dict[str, list[tuple[int, int]]] = {}
+        self._urls: set[str] = set()
+        self._total_length = 0
+
+    def add_document(self, title: str, url: str, text: str) -> bool:
+        """Index a document; returns False if a document with the same URL is already indexed."""
+        if not url or url in self._urls:
+            return False
+        doc_id = len(self.documents)
+        # Title terms count twice, mirroring the weighting used when reranking live results
+        terms = tokenize(title) * 2 + tokenize(text)
+        for term, count in Counter(terms).items():
+            self.postings.setdefault(term, []).append((doc_id, count))
+        self.documents.append({"title": title, "url": url, "snippet": " ".join(text.split())[:SNIPPET_CHARS]})
+        self.doc_lengths.append(len(terms))
+        self._total_length += len(terms)
+        self._urls.add(url)
+        return True
+
+    def search(self, query: str, k: int = DEFAULT_RESULT_COUNT) -> list[tuple[dict[str, str], float]]:
+        """Return the top ``k`` documents for a query with their BM25 scores."""
+        if not self.documents:
+            return []
+        average_length = self._total_length / len(self.documents)
+        scores: dict[int, float] = {}
+        for term in set(tokenize(query)):
+            postings = self.postings.get(term)
+            if not postings:
+                continue
+            idf = math.log(1 + (len(self.documents) - len(postings) + 0.5) / (len(postings) + 0.5))
+            for doc_id, frequency in postings:
+                norm = self.k1 * (1 - self.b + self.b * self.doc_lengths[doc_id] / average_length)
+                scores[doc_id] = scores.get(doc_id, 0.0) + idf * frequency * (self.k1 + 1) / (frequency + norm)
+        ranked = sorted(scores.items(), key=lambda item: item[1], reverse=True)[:k]
+        return [(self.documents[doc_id], score) for doc_id, score in ranked]
+
+    def save(self, path: str) -> None:
+        """Write the index atomically to ``path``."""
+        data = {
+            "k1": self.k1,
+            "b": self.b,
+            "documents": self.documents,
+            "doc_lengths": self.doc_lengths,
+            "postings": self.postings,
+        }
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: str) -> "LocalSearchIndex":
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        index = cls(k1=data["k1"], b=data["b"])
+        index.documents = data["documents"]
+        index.doc_lengths = data["doc_lengths"]
+        index.postings = {
+            term: [tuple(posting) for posting in postings] for term, postings in data["postings"].items()
+        }
+        index._urls = {document["url"] for document in index.documents}
+        index._total_length = sum(index.doc_lengths)
+        return index
+
+
+class LocalSearchBackend(SearchBackend):
+    """
+    Search backend answering Serper-shaped requests from a LocalSearchIndex, without network access.
+
+    Given an index path, the index is loaded on the first search, so a missing index only fails
+    searches (with a pointer to ingest-search-index), never status reporting.
+    """
+
+    def __init__(
+        self,
+        index: LocalSearchIndex | None = None,
+        index_path: str | None = None,
+        rate_limiter: TokenBucketRateLimiter | None = None,
+    ):
+        if index is None and index_path is None:
+            raise ValueError("LocalSearchBackend needs an index or an index path")
+        self._index = index
+        self.index_path = index_path
+        self.rate_limiter = rate_limiter
+        self._lock = threading.Lock()
+        self._latencies: deque[float] = deque(maxlen=500)
+
+    @property
+    def index(self) -> LocalSearchIndex:
+        if self._index is None:
+            with self._lock:
+                if self._index is None:
+                    try:
+                        self._index = LocalSearchIndex.load(self.index_path)
+                    except FileNotFoundError as e:
+                        raise FileNotFoundError(self._missing_index_message()) from e
+        return self._index
+
+    @property
+    def available(self) -> bool:
+        return self._index is not None or os.path.exists(self.index_path)
+
+    @property
+    def unavailable_reason(self) -> str:
+        return "" if self.available else self._missing_index_message()
+
+    def _missing_index_message(self) -> str:
+        return f"Local search index not found at {self.index_path}; build it with ingest-search-index"
+
+    def search(self, payload: dict[str, Any]) -> dict[str, Any]:
+        index = self.index
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire()
+        started = time.monotonic()
+        hits = index.search(str(payload.get("q", "")), int(payload.get("num") or DEFAULT_RESULT_COUNT))
+        with self._lock:
+            self._latencies.append(time.monotonic() - started)
+        return {
+            "searchParameters": {**payload, "engine": "local"},
+            "organic": [
+                {"title": document["title"], "link": document["url"], "snippet": document["snippet"], "position": rank}
+                for rank, (document, _) in enumerate(hits, start=1)
+            ],
+        }
+
+    def search_many(self, payloads: list[dict[str, Any]]) -> list[dict[str, Any] | Exception]:
+        return [self.search(payload) for payload in payloads]
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            index = self._index
+            latencies = sorted(self._latencies)
+        if index is None:
+            return {"backend": "local", "loaded": False, "index_path": self.index_path}
+        return {
+            "backend": "local",
+            "loaded": True,
+            "documents": len(index.documents),
+            "terms": len(index.postings),
+            "requests": len(latencies),
+            "p50_seconds": round(latencies[len(latencies) // 2], 5) if latencies else 0.0,
+            "max_seconds": round(latencies[-1], 5) if latencies else 0.0,
+            "rate_limiter": self.rate_limiter.stats() if self.rate_limiter else None,
+        }
+
+
+def _iter_documents(path: Path):
+    """
+    Yield (title, url, text) from a corpus file.
+
+    Supported inputs: recorded Serper responses (.json, a response or a list of them), JSON lines
+    with title/url/text fields (.jsonl), and plain text or Markdown documents (.txt, .md).
+    """
+    if path.suffix == ".json":
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        for response in data if isinstance(data, list) else [data]:
+            for item in response.get("organic", []):
+                yield item.get("title", ""), item.get("link") or item.get("url", ""), item.get("snippet", "")
+    elif path.suffix == ".jsonl":
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    record = json.loads(line)
+                    text = record.get("text") or record.get("content") or record.get("snippet", "")
+                    yield record.get("title", ""), record.get("url") or record.get("link", ""), text
+    elif path.suffix in (".txt", ".md"):
+        yield path.stem.replace("_", " "), path.resolve().as_uri(), path.read_text(encoding="utf-8")
+
+
+def ingest():
+    """Bulk-ingest a corpus into the local search index (entry point of the ingest-search-index script)."""
+    from deep_research_agent.common.config import settings
+
+    parser = argparse.ArgumentParser(description="Build or extend the local BM25 search index.")
+    parser.add_argument("paths", nargs="+", help="Corpus files or directories (.json, .jsonl, .txt, .md)")
+    parser.add_argument("--index", default=settings.local_search_index_path, help="Index file to write")
+    parser.add_argument("--rebuild", action="store_true", help="Start from an empty index instead of extending")
+    args = parser.parse_args()
+
+    index = LocalSearchIndex() if args.rebuild or not os.path.exists(args.index) else LocalSearchIndex.load(args.index)
+    files = []
+    for raw_path in args.paths:
+        path = Path(raw_path)
+        files.extend(sorted(p for p in path.rglob("*") if p.is_file()) if path.is_dir() else [path])
+
+    added = 0
+    for path in files:
+        for title, url, text in _iter_documents(path):
+            added += index.add_document(title, url, text)
+
+    index.save(args.index)
+    logger.info(f"Indexed {added} new documents from {len(files)} files; {len(index.documents)} total in {args.index}")
+
+
+if __name__ == "__main__":
+    ingest()
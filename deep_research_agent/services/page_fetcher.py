@@ -0,0 +1,285 @@
+import asyncio
+import threading
+import time
+from html.parser import HTMLParser
+from typing import Any
+from urllib.parse import urlparse
+
+import httpx
+
+from deep_research_agent.common.config import settings
+from deep_research_agent.utils.cache import TieredCache, make_cache_key
+from deep_research_agent.utils.logger import logger
+
+# Elements whose text is never part of a page's main content
+_SKIPPED_TAGS = frozenset(
+    {"script", "style", "noscript", "svg", "nav", "header", "footer", "aside", "form", "button", "iframe", "template"}
+)
+# Elements after which a line break keeps extracted paragraphs apart
+_BLOCK_TAGS = frozenset(
+    {
+        "p",
+        "div",
+        "section",
+        "article",
+        "main",
+        "li",
+        "br",
+        "tr",
+        "h1",
+        "h2",
+        "h3",
+        "h4",
+        "h5",
+        "h6",
+        "blockquote",
+        "pre",
+    }
+)
+# Elements that, when present, hold the main content of the page
+_MAIN_TAGS = ("article", "main")
+
+
+class _TextExtractor(HTMLParser):
+    """Collect visible text, separately for the whole page and for <article>/<main> elements"""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.page_parts: list[str] = []
+        self.main_parts: list[str] = []
+        self._skip_depth = 0
+        self._main_depth = 0
+
+    def handle_starttag(self, tag: str, attrs) -> None:
+        if tag in _SKIPPED_TAGS:
+            self._skip_depth += 1
+        elif tag in _MAIN_TAGS:
+            self._main_depth += 1
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag in _SKIPPED_TAGS:
+            self._skip_depth = max(0, self._skip_depth - 1)
+        elif tag in _MAIN_TAGS:
+            self._main_depth = max(0, self._main_depth - 1)
+        if tag in _BLOCK_TAGS:
+            self._append("\n")
+
+    def handle_data(self, data: str) -> None:
+        if self._skip_depth == 0 and data.strip():
+            self._append(" ".join(data.split()) + " ")
+
+    def _append(self, text: str) -> None:
+        self.page_parts.append(text)
+        if self._main_depth:
+            self.main_parts.append(text)
+
+
+def extract_main_text(html: str, max_chars: int) -> str:
+    """
+    Extract the readable main text of an HTML page, capped at ``max_chars``.
+
+    Prefers <article>/<main> content when the page has a substantial amount of it, and drops
+    scripts, styles and page chrome (navigation, header, footer, asides, forms).
+    """
+    extractor = _TextExtractor()
+    try:
+        extractor.feed(html)
+        extractor.close()
+    except Exception as e:  # noqa: BLE001 - malformed markup; keep whatever was parsed
+        logger.debug(f"HTML parsing stopped early: {e}")
+    main_text = "".join(extractor.main_parts)
+    text = main_text if len(main_text.strip()) >= 200 else "".join(extractor.page_parts)
+    lines = (line.strip() for line in text.splitlines())
+    text = "\n".join(line for line in lines if line)
+    if len(text) > max_chars:
+        text = text[:max_chars].rsplit(" ", 1)[0] + "..."
+    return text
+
+
+class PageFetcher:
+    """
+    Concurrent fetcher of web page text for search results.
+
+    Pages are downloaded with a bounded async pool (overall and per host), truncated to
+    ``max_bytes``, reduced to their main text and cached by URL. Cached pages younger than
+    ``fresh_seconds`` are served as is; older ones are revalidated with If-None-Match /
+    If-Modified-Since, so unchanged pages cost a 304 instead of a download.
+
+    All fetches run on one event loop in a dedicated daemon thread, started on first use, with a
+    single long-lived HTTP client. Its keep-alive connections and the concurrency limits are shared
+    by every caller in the process, whichever thread or event loop the call comes from.
+    """
+
+    def __init__(
+        self,
+        cache: TieredCache,
+        max_concurrency: int = 8,
+        per_host_limit: int = 2,
+        timeout: float = 10.0,
+        max_bytes: int = 2_000_000,
+        max_chars: int = 4000,
+        fresh_seconds: float = 3600,
+    ):
+        self.cache = cache
+        self.max_concurrency = max_concurrency
+        self.per_host_limit = per_host_limit
+        self.timeout = timeout
+        self.max_bytes = max_bytes
+        self.max_chars = max_chars
+        self.fresh_seconds = fresh_seconds
+
+        self._lock = threading.Lock()
+        self._stats = {"fetched": 0, "fresh_hits": 0, "revalidated": 0, "failed": 0, "skipped": 0}
+        # Owned by the fetch loop; created there on first use
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._client: httpx.AsyncClient | None = None
+        self._pool: asyncio.Semaphore | None = None
+        # Per-host semaphores with the number of fetches holding or waiting on each; dropped when idle
+        self._host_limits: dict[str, asyncio.Semaphore] = {}
+        self._host_fetches: dict[str, int] = {}
+
+    def fetch_contents(self, urls: list[str]) -> dict[str, str | None]:
+        """Fetch the main text of each URL (None where unavailable); blocks until all are done."""
+        return asyncio.run_coroutine_threadsafe(self._fetch_all(urls), self._get_loop()).result()
+
+    async def fetch_all(self, urls: list[str]) -> dict[str, str | None]:
+        """Fetch the main text of each URL concurrently (None where unavailable)."""
+        return await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(self._fetch_all(urls), self._get_loop()))
+
+    def close(self) -> None:
+        """Close the HTTP client and stop the fetch loop; a later fetch starts a new one."""
+        with self._lock:
+            loop, self._loop = self._loop, None
+        if loop is None:
+            return
+        asyncio.run_coroutine_threadsafe(self._close_client(), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
+
+    def _get_loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                threading.Thread(target=self._run_loop, args=(loop,), name="page-fetcher", daemon=True).start()
+                self._loop = loop
+            return self._loop
+
+    @staticmethod
+    def _run_loop(loop: asyncio.AbstractEventLoop) -> None:
+        asyncio.set_event_loop(loop)
+        try:
+            loop.run_forever()
+        finally:
+            loop.close()
+
+    async def _close_client(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+        self._client = None
+        self._pool = None
+        self._host_limits = {}
+        self._host_fetches = {}
+
+    async def _fetch_all(self, urls: list[str]) -> dict[str, str | None]:
+        # Runs on the fetch loop, so the client and semaphores are only ever touched from its thread
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                timeout=self.timeout,
+                follow_redirects=True,
+                headers={"User-Agent": settings.page_fetch_user_agent},
+                limits=httpx.Limits(max_connections=self.max_concurrency),
+            )
+            self._pool = asyncio.Semaphore(self.max_concurrency)
+
+        async def fetch_one(url: str) -> str | None:
+            host = urlparse(url).netloc
+            host_limit = self._host_limits.setdefault(host, asyncio.Semaphore(self.per_host_limit))
+            self._host_fetches[host] = self._host_fetches.get(host, 0) + 1
+            try:
+                async with self._pool, host_limit:
+                    return await self._fetch(self._client, url)
+            finally:
+                self._host_fetches[host] -= 1
+                if not self._host_fetches[host]:
+                    del self._host_fetches[host], self._host_limits[host]
+
+        urls = list(dict.fromkeys(urls))
+        contents = await asyncio.gather(*(fetch_one(url) for url in urls))
+        return dict(zip(urls, contents, strict=True))
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {**self._stats, "cache": self.cache.stats()}
+
+    async def _fetch(self, client: httpx.AsyncClient, url: str) -> str | None:
+        if urlparse(url).scheme not in ("http", "https"):
+            self._count("skipped")
+            return None
+
+        key = make_cache_key("page", url)
+        cached = self.cache.get(key)
+        if cached is not None and time.time() - cached["checked_at"] < self.fresh_seconds:
+            self._count("fresh_hits")
+            return cached["content"]
+
+        headers = {}
+        if cached is not None:
+            if cached.get("etag"):
+                headers["If-None-Match"] = cached["etag"]
+            if cached.get("last_modified"):
+                headers["If-Modified-Since"] = cached["last_modified"]
+
+        try:
+            async with client.stream("GET", url, headers=headers) as response:
+                if response.status_code == 304 and cached is not None:
+                    self.cache.set(key, {**cached, "checked_at": time.time()})
+                    self._count("revalidated")
+                    return cached["content"]
+                response.raise_for_status()
+                content_type = response.headers.get("content-type", "")
+                if "html" not in content_type and "text/plain" not in content_type:
+                    self._count("skipped")
+                    return None
+                body = bytearray()
+                async for chunk in response.aiter_bytes():
+                    body.extend(chunk)
+                    if len(body) >= self.max_bytes:
+                        break
+                raw_text = bytes(body[: self.max_bytes]).decode(response.encoding or "utf-8", errors="replace")
+        except (httpx.HTTPError, UnicodeError, LookupError) as e:
+            logger.debug(f"Failed to fetch {url}: {e}")
+            self._count("failed")
+            return None
+
+        content = extract_main_text(raw_text, self.max_chars) if "html" in content_type else raw_text[: self.max_chars]
+        self.cache.set(
+            key,
+            {
+                "content": content,
+                "etag": response.headers.get("etag"),
+                "last_modified": response.headers.get("last-modified"),
+                "checked_at": time.time(),
+            },
+        )
+        self._count("fetched")
+        return content
+
+    def _count(self, outcome: str) -> None:
+        with self._lock:
+            self._stats[outcome] += 1
+
+
+page_fetcher = PageFetcher(
+    TieredCache(
+        "page",
+        max_entries=settings.page_cache_max_entries,
+        ttl_seconds=settings.page_cache_ttl_seconds,
+        disk_dir=settings.page_cache_dir or None,
+        max_disk_bytes=settings.page_cache_max_disk_mb * 1024 * 1024,
+    ),
+    max_concurrency=settings.page_fetch_max_concurrency,
+    per_host_limit=settings.page_fetch_per_host_limit,
+    timeout=settings.page_fetch_timeout,
+    max_bytes=settings.page_fetch_max_bytes,
+    max_chars=settings.page_content_max_chars,
+    fresh_seconds=settings.page_cache_fresh_seconds,
+)
@@ -1,3 +1,5 @@
+import functools
+
 # Explicit imports for all prompts modules
 from deep_research_agent.agents.evaluation import prompts as evaluation_prompts
 from deep_research_agent.agents.ideation import prompts as ideation_prompts
@@ -93,3 +95,9 @@ class PromptService:
         if agent_type not in self._user_prompt_templates:
             self._user_prompt_templates[agent_type] = {}
         self._user_prompt_templates[agent_type][template_name] = template
+
+
+@functools.cache
+def get_prompt_service() -> PromptService:
+    """Get the process-wide PromptService, so prompts are loaded and validated only once."""
+    return PromptService()
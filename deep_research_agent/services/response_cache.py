@@ -0,0 +1,108 @@
+import contextvars
+from collections.abc import Awaitable, Callable
+from typing import Any, TypeVar
+
+from pydantic import BaseModel
+
+from deep_research_agent.common.config import settings
+from deep_research_agent.common.schemas import AgentType
+from deep_research_agent.utils.cache import CacheLookupStats, TieredCache, make_cache_key
+
+T = TypeVar("T")
+
+# Response cache counters of the workflow run executing in this context
+current_llm_cache_stats: contextvars.ContextVar[CacheLookupStats | None] = contextvars.ContextVar(
+    "current_llm_cache_stats", default=None
+)
+
+
+class ResponseCache:
+    """Content-addressed cache for model responses, enabled per AgentType"""
+
+    def __init__(self, cache: TieredCache, enabled_agent_types: set[AgentType]):
+        self._cache = cache
+        self.enabled_agent_types = enabled_agent_types
+
+    def is_enabled_for(self, agent_type: AgentType | None) -> bool:
+        return agent_type is not None and agent_type in self.enabled_agent_types
+
+    def get_or_call(
+        self,
+        agent_type: AgentType | None,
+        model_id: str,
+        system_prompt: str | None,
+        prompt: str,
+        output_model: type[BaseModel] | None,
+        call: Callable[[], T],
+    ) -> T:
+        """
+        Return the cached response for this model invocation, or run ``call`` and cache its result.
+
+        The key covers everything that determines the response: model, system prompt,
+        user prompt and (for structured output) the output schema.
+        """
+        if not self.is_enabled_for(agent_type):
+            return call()
+
+        key, cached = self._lookup(model_id, system_prompt, prompt, output_model)
+        if cached is not None:
+            return cached
+
+        result = call()
+        self._cache.set(key, result)
+        return result
+
+    async def get_or_call_async(
+        self,
+        agent_type: AgentType | None,
+        model_id: str,
+        system_prompt: str | None,
+        prompt: str,
+        output_model: type[BaseModel] | None,
+        call: Callable[[], Awaitable[T]],
+    ) -> T:
+        """``get_or_call`` for a model invocation awaited on the event loop."""
+        if not self.is_enabled_for(agent_type):
+            return await call()
+
+        key, cached = self._lookup(model_id, system_prompt, prompt, output_model)
+        if cached is not None:
+            return cached
+
+        result = await call()
+        self._cache.set(key, result)
+        return result
+
+    def _lookup(
+        self, model_id: str, system_prompt: str | None, prompt: str, output_model: type[BaseModel] | None
+    ) -> tuple[str, Any]:
+        """The cache key of a model invocation and its cached response (None on a miss), counted in run stats."""
+        schema = output_model.model_json_schema() if output_model else None
+        key = make_cache_key(model_id, system_prompt, prompt, schema)
+        cached = self._cache.get(key)
+        run_stats = current_llm_cache_stats.get()
+        if run_stats is not None:
+            run_stats.record(cached is not None)
+        return key, cached
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            **self._cache.stats(),
+            "enabled_agent_types": sorted(agent_type.value for agent_type in self.enabled_agent_types),
+        }
+
+
+def _parse_agent_types(value: str) -> set[AgentType]:
+    return {AgentType(item.strip()) for item in value.split(",") if item.strip()}
+
+
+response_cache = ResponseCache(
+    TieredCache(
+        "llm_response",
+        max_entries=settings.llm_cache_max_entries,
+        ttl_seconds=settings.llm_cache_ttl_seconds,
+        disk_dir=settings.llm_cache_dir or None,
+        max_disk_bytes=settings.llm_cache_max_disk_mb * 1024 * 1024,
+    ),
+    _parse_agent_types(settings.llm_cache_agent_types),
+)
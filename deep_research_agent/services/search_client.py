@@ -0,0 +1,376 @@
+import contextvars
+import copy
+import json
+import os
+import re
+import threading
+import time
+import uuid
+from abc import ABC, abstractmethod
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from deep_research_agent.common.config import settings
+from deep_research_agent.core.concurrency import TokenBucketRateLimiter
+from deep_research_agent.utils.cache import CacheLookupStats, TieredCache, make_cache_key
+from deep_research_agent.utils.logger import logger
+
+# Serper returns this many organic results when "num" is not given
+DEFAULT_RESULT_COUNT = 10
+
+
+# Search cache counters of the workflow run executing in this context
+current_search_stats: contextvars.ContextVar[CacheLookupStats | None] = contextvars.ContextVar(
+    "current_search_stats", default=None
+)
+
+
+def normalize_search_payload(payload: dict[str, Any]) -> dict[str, Any]:
+    """
+    Normalize a Serper request so near-identical searches share a cache entry.
+
+    Keywords are lower-cased with whitespace and surrounding punctuation collapsed; region and
+    language are lower-cased; the result count is an int, defaulting to Serper's default.
+    """
+    query = re.sub(r"\s+", " ", str(payload.get("q", ""))).strip().strip(".,;:!?\"'").lower()
+    normalized = {
+        "q": query,
+        "gl": str(payload.get("gl", "")).lower(),
+        "hl": str(payload.get("hl", "")).lower(),
+        "num": int(payload.get("num") or DEFAULT_RESULT_COUNT),
+    }
+    extra = {key: value for key, value in payload.items() if key not in normalized}
+    return {**normalized, **extra}
+
+
+def _parse_rate_limits(value: str) -> dict[str, TokenBucketRateLimiter]:
+    limiters = {}
+    for item in value.split(","):
+        if not item.strip():
+            continue
+        backend, _, limit = item.partition("=")
+        rate, _, burst = limit.partition(":")
+        try:
+            limiters[backend.strip()] = TokenBucketRateLimiter(float(rate), float(burst or rate))
+        except ValueError:
+            logger.warning(f"Ignoring invalid search rate limit: {item.strip()!r}")
+    return limiters
+
+
+# One limiter per backend, shared by every agent and conversation in the process
+SEARCH_RATE_LIMITERS = _parse_rate_limits(settings.search_rate_limits)
+
+
+class SearchBackend(ABC):
+    """Search engine behind websearch and the citation search; requests and responses use Serper's format"""
+
+    # Whether the backend is configured and can serve searches, and what is missing when it cannot
+    available: bool = True
+    unavailable_reason: str = ""
+
+    @abstractmethod
+    def search(self, payload: dict[str, Any]) -> dict[str, Any]:
+        """Run one search and return its response."""
+
+    @abstractmethod
+    def search_many(self, payloads: list[dict[str, Any]]) -> list[dict[str, Any] | Exception]:
+        """Run several searches; results (or exceptions) match ``payloads`` by position."""
+
+    @abstractmethod
+    def stats(self) -> dict[str, Any]:
+        """Request counts and latency."""
+
+
+class SearchClient(SearchBackend):
+    """
+    Pooled HTTP client for the Serper search API.
+
+    One ``requests.Session`` is shared by every caller, so TLS connections to the API are kept
+    alive and reused across tool calls. Every request attempt first takes tokens from the
+    process-wide rate limiter (one per query), so bursts queue instead of being rejected.
+    Requests have connect/read timeouts and their latency is recorded. Connection errors and
+    5xx responses are retried with exponential backoff by the session. A 429 is retried here,
+    honouring Retry-After, and each retry goes back through the rate limiter.
+
+    Successful responses are cached by normalized query, and concurrent identical searches are
+    coalesced into one request, so repeated queries within and across runs cost nothing.
+    """
+
+    SEARCH_URL = "https://google.serper.dev/search"
+
+    def __init__(
+        self,
+        api_key: str,
+        connect_timeout: float = 5.0,
+        read_timeout: float = 20.0,
+        max_retries: int = 3,
+        backoff_factor: float = 0.5,
+        pool_maxsize: int = 20,
+        cache: TieredCache | None = None,
+        batch_enabled: bool = True,
+        batch_size: int = 20,
+        max_concurrency: int = 8,
+        record_dir: str | None = None,
+        rate_limiter: TokenBucketRateLimiter | None = None,
+    ):
+        self.api_key = api_key
+        self.available = bool(api_key)
+        self.unavailable_reason = "" if api_key else "SERPER_API_KEY environment variable is not set"
+        self.record_dir = record_dir
+        self.timeout = (connect_timeout, read_timeout)
+        self.cache = cache
+        self.batch_enabled = batch_enabled
+        self.batch_size = batch_size
+        self.max_concurrency = max_concurrency
+        self.rate_limiter = rate_limiter
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+
+        retry = Retry(
+            total=max_retries,
+            backoff_factor=backoff_factor,
+            # 429 is retried by _post, so that every attempt goes through the rate limiter
+            status_forcelist=(500, 502, 503, 504),
+            # Search requests are POSTs but have no side effects, so they are safe to retry
+            allowed_methods=frozenset({"POST"}),
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        self.session = requests.Session()
+        self.session.headers.update({"X-API-KEY": api_key, "Content-Type": "application/json"})
+        self.session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=pool_maxsize, max_retries=retry))
+
+        self._lock = threading.Lock()
+        self._in_flight: dict[str, Future] = {}
+        self._latencies: deque[float] = deque(maxlen=500)
+        self._stats = {"requests": 0, "errors": 0, "retries": 0, "total_seconds": 0.0, "max_seconds": 0.0}
+
+    def search(self, payload: dict[str, Any]) -> dict[str, Any]:
+        """
+        Run a search (or serve it from the cache) and return the decoded JSON response.
+
+        Raises:
+            requests.exceptions.RequestException: If the request fails after all retries
+        """
+        if self.cache is None:
+            return self._post(payload)
+
+        key = make_cache_key("serper", normalize_search_payload(payload))
+        cached = self.cache.get(key)
+        if cached is not None:
+            self._record_cache_lookup(hit=True)
+            return cached
+
+        with self._lock:
+            pending = self._in_flight.get(key)
+            is_owner = pending is None
+            if is_owner:
+                pending = self._in_flight[key] = Future()
+        if not is_owner:
+            # An identical search is already running; share its response
+            self._record_cache_lookup(hit=True)
+            return copy.deepcopy(pending.result())
+
+        self._record_cache_lookup(hit=False)
+        try:
+            results = self._post(payload)
+        except BaseException as e:
+            pending.set_exception(e)
+            raise
+        else:
+            self.cache.set(key, results)
+            pending.set_result(results)
+            return copy.deepcopy(results)
+        finally:
+            with self._lock:
+                del self._in_flight[key]
+
+    def search_many(self, payloads: list[dict[str, Any]]) -> list[dict[str, Any] | Exception]:
+        """
+        Run several searches at once; the result list matches ``payloads`` by position.
+
+        Cached queries are served locally. The rest go out as Serper batch requests (one HTTP
+        round trip per ``batch_size`` queries) or, with batching disabled, as concurrent single
+        requests bounded by ``max_concurrency``. A failed search yields its exception in place of
+        a response, so one bad query does not discard the others.
+        """
+        results: list[dict[str, Any] | Exception | None] = [None] * len(payloads)
+        keys = [make_cache_key("serper", normalize_search_payload(payload)) for payload in payloads]
+
+        # Serve cached queries and send each distinct remaining query once
+        pending: dict[str, list[int]] = {}
+        for index, key in enumerate(keys):
+            cached = self.cache.get(key) if self.cache is not None else None
+            if cached is not None:
+                self._record_cache_lookup(hit=True)
+                results[index] = cached
+            else:
+                self._record_cache_lookup(hit=key in pending)
+                pending.setdefault(key, []).append(index)
+
+        misses = [(key, payloads[indexes[0]]) for key, indexes in pending.items()]
+        if self.batch_enabled:
+            chunks = [misses[i : i + self.batch_size] for i in range(0, len(misses), self.batch_size)]
+            fetched = self._map_concurrently(lambda chunk: self._post_batch([payload for _, payload in chunk]), chunks)
+            responses = []
+            for chunk, chunk_responses in zip(chunks, fetched, strict=True):
+                if isinstance(chunk_responses, Exception):
+                    chunk_responses = [chunk_responses] * len(chunk)
+                responses.extend(chunk_responses)
+        else:
+            responses = self._map_concurrently(lambda miss: self._post(miss[1]), misses)
+
+        for (key, _), response in zip(misses, responses, strict=True):
+            if self.cache is not None and not isinstance(response, Exception):
+                self.cache.set(key, response)
+            for index in pending[key]:
+                results[index] = response if isinstance(response, Exception) else copy.deepcopy(response)
+        return results
+
+    def _map_concurrently(self, fn, items: list) -> list:
+        """Apply ``fn`` to every item on up to ``max_concurrency`` threads, returning results or exceptions."""
+
+        def call(item):
+            try:
+                return fn(item)
+            except Exception as e:  # noqa: BLE001 - returned to the caller in place of the result
+                return e
+
+        if len(items) <= 1:
+            return [call(item) for item in items]
+        with ThreadPoolExecutor(max_workers=min(self.max_concurrency, len(items))) as executor:
+            return list(executor.map(call, items))
+
+    def _post_batch(self, payloads: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        responses = self._post(payloads)
+        if not isinstance(responses, list) or len(responses) != len(payloads):
+            raise ValueError(f"Unexpected batch search response for {len(payloads)} queries")
+        return responses
+
+    def _post(self, payload: dict[str, Any] | list[dict[str, Any]]) -> Any:
+        started = time.monotonic()
+        retries = 0
+        try:
+            for attempt in range(self.max_retries + 1):
+                if self.rate_limiter is not None:
+                    self.rate_limiter.acquire(len(payload) if isinstance(payload, list) else 1)
+                response = self.session.post(self.SEARCH_URL, json=payload, timeout=self.timeout)
+                if response.raw is not None and response.raw.retries is not None:
+                    retries += len(response.raw.retries.history)
+                if response.status_code != 429 or attempt == self.max_retries:
+                    break
+                retries += 1
+                time.sleep(self._retry_delay(response, attempt))
+            response.raise_for_status()
+            results = response.json()
+        except requests.exceptions.RequestException:
+            self._record(time.monotonic() - started, retries, error=True)
+            raise
+        self._record(time.monotonic() - started, retries, error=False)
+        if self.record_dir:
+            self._record_response(results)
+        return results
+
+    def _retry_delay(self, response: requests.Response, attempt: int) -> float:
+        """Seconds to wait before retrying a rate-limited request: Retry-After if given, else exponential backoff."""
+        retry_after = response.headers.get("Retry-After", "")
+        if retry_after.isdigit():
+            return float(retry_after)
+        return self.backoff_factor * 2**attempt
+
+    def stats(self) -> dict[str, Any]:
+        """Request counts and latency (seconds, over the most recent requests for percentiles)."""
+        with self._lock:
+            latencies = sorted(self._latencies)
+            requests_made = self._stats["requests"]
+            return {
+                "backend": "serper",
+                **self._stats,
+                "cache": self.cache.stats() if self.cache else None,
+                "rate_limiter": self.rate_limiter.stats() if self.rate_limiter else None,
+                "total_seconds": round(self._stats["total_seconds"], 3),
+                "max_seconds": round(self._stats["max_seconds"], 3),
+                "avg_seconds": round(self._stats["total_seconds"] / requests_made, 3) if requests_made else 0.0,
+                "p50_seconds": round(latencies[len(latencies) // 2], 3) if latencies else 0.0,
+                "p95_seconds": round(latencies[int(len(latencies) * 0.95)], 3) if latencies else 0.0,
+            }
+
+    def _record_response(self, results: Any) -> None:
+        """Save a live response for later ingestion into the local search index."""
+        path = os.path.join(self.record_dir or "", f"{time.strftime('%Y%m%d-%H%M%S')}-{uuid.uuid4().hex[:8]}.json")
+        try:
+            os.makedirs(self.record_dir or "", exist_ok=True)
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(results, f, ensure_ascii=False)
+        except OSError as e:
+            logger.warning(f"Failed to record search response to {path}: {e}")
+
+    def _record_cache_lookup(self, hit: bool) -> None:
+        run_stats = current_search_stats.get()
+        if run_stats is not None:
+            run_stats.record(hit)
+
+    def _record(self, duration: float, retries: int, error: bool) -> None:
+        with self._lock:
+            self._latencies.append(duration)
+            self._stats["requests"] += 1
+            self._stats["retries"] += retries
+            self._stats["total_seconds"] += duration
+            self._stats["max_seconds"] = max(self._stats["max_seconds"], duration)
+            if error:
+                self._stats["errors"] += 1
+
+
+search_client = SearchClient(
+    settings.serper_api_key,
+    connect_timeout=settings.search_connect_timeout,
+    read_timeout=settings.search_read_timeout,
+    max_retries=settings.search_max_retries,
+    backoff_factor=settings.search_retry_backoff,
+    pool_maxsize=settings.search_pool_maxsize,
+    batch_enabled=settings.search_batch_enabled,
+    batch_size=settings.search_batch_size,
+    max_concurrency=settings.search_max_concurrency,
+    record_dir=settings.search_record_dir or None,
+    rate_limiter=SEARCH_RATE_LIMITERS.get("serper"),
+    cache=(
+        TieredCache(
+            "search",
+            max_entries=settings.search_cache_max_entries,
+            ttl_seconds=settings.search_cache_ttl_seconds,
+            disk_dir=settings.search_cache_dir or None,
+            max_disk_bytes=settings.search_cache_max_disk_mb * 1024 * 1024,
+        )
+        if settings.search_cache_enabled
+        else None
+    ),
+)
+
+_backend: SearchBackend | None = None
+_backend_lock = threading.Lock()
+
+
+def get_search_backend() -> SearchBackend:
+    """
+    Get the configured search backend: the live Serper client, or the offline BM25 index
+    (SEARCH_BACKEND=local), which is loaded on the first search.
+    """
+    global _backend
+    if _backend is None:
+        with _backend_lock:
+            if _backend is None:
+                if settings.search_backend == "local":
+                    from deep_research_agent.services.local_search import LocalSearchBackend
+
+                    _backend = LocalSearchBackend(
+                        index_path=settings.local_search_index_path,
+                        rate_limiter=SEARCH_RATE_LIMITERS.get("local"),
+                    )
+                else:
+                    _backend = search_client
+    return _backend
@@ -0,0 +1,75 @@
+import re
+from typing import Any
+from urllib.parse import urlparse
+
+from deep_research_agent.common.schemas import SearchResult
+
+_TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+# Words that carry no relevance signal when matching a query against a result
+_STOPWORDS = frozenset(
+    "a an and are as at be by for from how in is it of on or the to what when where which who why with".split()
+)
+
+
+def tokenize(text: str) -> list[str]:
+    """Lower-cased alphanumeric terms of a text, without stopwords."""
+    return [token for token in _TOKEN_PATTERN.findall(text.lower()) if token not in _STOPWORDS]
+
+
+def project_search_results(response: dict[str, Any]) -> list[SearchResult]:
+    """
+    Project a raw Serper response onto its organic results.
+
+    Knowledge graph, sitelinks, "people also ask" and other response sections are dropped.
+    """
+    results = []
+    for item in response.get("organic", []):
+        url = item.get("link") or item.get("url")
+        if not url:
+            continue
+        netloc = urlparse(url).netloc
+        results.append(
+            SearchResult(
+                title=item.get("title", "Untitled"),
+                url=url,
+                snippet=item.get("snippet", ""),
+                source=netloc.removeprefix("www.") or "unknown",
+            )
+        )
+    return results
+
+
+def rerank_search_results(query: str, results: list[SearchResult]) -> list[SearchResult]:
+    """
+    Order results by relevance to the query: coverage of the query terms in the title (weighted
+    double) and snippet, with the search engine's original rank as a tie-breaking prior.
+    """
+    query_terms = set(tokenize(query))
+    if not query_terms:
+        return results
+
+    def score(indexed: tuple[int, SearchResult]) -> float:
+        position, result = indexed
+        title_terms = set(tokenize(result.title))
+        snippet_terms = set(tokenize(result.snippet))
+        coverage = (2 * len(query_terms & title_terms) + len(query_terms & snippet_terms)) / (3 * len(query_terms))
+        return coverage + 0.5 / (position + 1)
+
+    return [result for _, result in sorted(enumerate(results), key=score, reverse=True)]
+
+
+def format_search_results(results: list[SearchResult], snippet_max_chars: int = 300) -> str:
+    """Render results as compact, numbered plain text for a model's context, with page text where fetched."""
+    if not results:
+        return "No results found."
+    blocks = []
+    for index, result in enumerate(results, start=1):
+        snippet = result.snippet
+        if len(snippet) > snippet_max_chars:
+            snippet = snippet[:snippet_max_chars].rsplit(" ", 1)[0] + "..."
+        block = f"[{index}] {result.title} ({result.source})\n{result.url}\n{snippet}"
+        if result.content:
+            block += f"\nPage content:\n{result.content}"
+        blocks.append(block)
+    return "\n\n".join(blocks)
@@ -0,0 +1,216 @@
+import hashlib
+import json
+import os
+import pickle
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from typing import Any
+
+from deep_research_agent.utils.logger import logger
+
+
+def make_cache_key(*parts: Any) -> str:
+    """Build a stable content hash from JSON-serializable parts."""
+    payload = json.dumps(parts, sort_keys=True, default=str, ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class CacheLookupStats:
+    """Thread-safe cache hit/miss counters for one workflow run"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def record(self, hit: bool) -> None:
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def as_dict(self) -> dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            }
+
+
+class TieredCache:
+    """
+    Two-tier key/value cache: an in-memory LRU in front of an optional on-disk tier.
+
+    Values are stored pickled, so every hit returns an independent copy that callers may mutate.
+    The disk tier expires entries after ``ttl_seconds`` and evicts the least recently used files
+    once it grows beyond ``max_disk_bytes``.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        max_entries: int = 256,
+        ttl_seconds: float | None = None,
+        disk_dir: str | None = None,
+        max_disk_bytes: int | None = None,
+    ):
+        self.name = name
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.disk_dir = disk_dir
+        self.max_disk_bytes = max_disk_bytes
+
+        self._memory: OrderedDict[str, tuple[float, bytes]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._disk_bytes: int | None = None  # computed lazily on first disk write
+        self._stats = {"hits": 0, "misses": 0, "memory_hits": 0, "disk_hits": 0, "stores": 0, "evictions": 0}
+
+        if self.disk_dir:
+            os.makedirs(self.disk_dir, exist_ok=True)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return the cached value for ``key``, or ``default`` on a miss."""
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None and not self._is_expired(entry[0], now):
+                self._memory.move_to_end(key)
+                self._stats["hits"] += 1
+                self._stats["memory_hits"] += 1
+                return pickle.loads(entry[1])
+            if entry is not None:
+                del self._memory[key]
+
+        data = self._read_disk(key, now)
+        with self._lock:
+            if data is None:
+                self._stats["misses"] += 1
+                return default
+            self._stats["hits"] += 1
+            self._stats["disk_hits"] += 1
+            self._remember(key, now, data)
+        return pickle.loads(data)
+
+    def set(self, key: str, value: Any) -> None:
+        """Store ``value`` under ``key`` in memory and, if configured, on disk."""
+        data = pickle.dumps(value)
+        now = time.time()
+        with self._lock:
+            self._stats["stores"] += 1
+            self._remember(key, now, data)
+        self._write_disk(key, data)
+
+    def clear(self) -> None:
+        """Drop all in-memory entries (the disk tier is left untouched)."""
+        with self._lock:
+            self._memory.clear()
+
+    def stats(self) -> dict[str, Any]:
+        """Hit/miss counters and current sizes."""
+        with self._lock:
+            lookups = self._stats["hits"] + self._stats["misses"]
+            return {
+                **self._stats,
+                "hit_rate": round(self._stats["hits"] / lookups, 4) if lookups else 0.0,
+                "memory_entries": len(self._memory),
+                "disk_enabled": bool(self.disk_dir),
+                "disk_bytes": self._disk_bytes,
+            }
+
+    def _is_expired(self, stored_at: float, now: float) -> bool:
+        return self.ttl_seconds is not None and now - stored_at > self.ttl_seconds
+
+    def _remember(self, key: str, stored_at: float, data: bytes) -> None:
+        # Caller must hold self._lock
+        self._memory[key] = (stored_at, data)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+            self._stats["evictions"] += 1
+
+    def _disk_path(self, key: str) -> str:
+        return os.path.join(self.disk_dir or "", key[:2], f"{key}.pkl")
+
+    def _read_disk(self, key: str, now: float) -> bytes | None:
+        if not self.disk_dir:
+            return None
+        path = self._disk_path(key)
+        try:
+            if self._is_expired(os.path.getmtime(path), now):
+                self._remove_disk_file(path)
+                return None
+            with open(path, "rb") as f:
+                data = f.read()
+            os.utime(path)  # refresh recency for size-based eviction
+            return data
+        except FileNotFoundError:
+            return None
+        except OSError as e:
+            logger.warning(f"{self.name} cache: failed to read {path}: {e}")
+            return None
+
+    def _write_disk(self, key: str, data: bytes) -> None:
+        if not self.disk_dir:
+            return
+        path = self._disk_path(key)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            previous_size = os.path.getsize(path) if os.path.exists(path) else 0
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"{self.name} cache: failed to write {path}: {e}")
+            return
+
+        with self._lock:
+            if self._disk_bytes is None:
+                self._disk_bytes = sum(size for _, size, _ in self._scan_disk())
+            else:
+                self._disk_bytes += len(data) - previous_size
+            over_budget = self.max_disk_bytes is not None and self._disk_bytes > self.max_disk_bytes
+        if over_budget:
+            self._evict_disk()
+
+    def _scan_disk(self) -> list[tuple[str, int, float]]:
+        entries = []
+        for root, _, files in os.walk(self.disk_dir or ""):
+            for file_name in files:
+                if not file_name.endswith(".pkl"):
+                    continue
+                path = os.path.join(root, file_name)
+                try:
+                    stat = os.stat(path)
+                except FileNotFoundError:
+                    continue
+                entries.append((path, stat.st_size, stat.st_mtime))
+        return entries
+
+    def _evict_disk(self) -> None:
+        """Delete expired files, then least recently used files until under the size budget."""
+        now = time.time()
+        entries = sorted(self._scan_disk(), key=lambda entry: entry[2])
+        total = sum(size for _, size, _ in entries)
+        # Shrink to 90% of the budget so we don't rescan on every subsequent write
+        target = int((self.max_disk_bytes or 0) * 0.9)
+        for path, size, mtime in entries:
+            if total <= target and not self._is_expired(mtime, now):
+                continue
+            self._remove_disk_file(path)
+            total -= size
+            with self._lock:
+                self._stats["evictions"] += 1
+        with self._lock:
+            self._disk_bytes = total
+
+    def _remove_disk_file(self, path: str) -> None:
+        try:
+            os.unlink(path)
+        except OSError:
+            pass
@@ -0,0 +1,44 @@
+# Rough characters-per-token ratio of English prose for Claude tokenizers
+CHARS_PER_TOKEN = 4
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimate the token count of a text without calling a tokenizer."""
+    return len(text) // CHARS_PER_TOKEN + 1
+
+
+def chunk_by_token_budget(documents: list[str], max_tokens: int, separator: str = "\n\n---\n\n") -> list[str]:
+    """
+    Pack documents, in order, into chunks of at most ``max_tokens`` estimated tokens.
+
+    Documents are kept whole where possible; a document larger than the budget is split on
+    paragraph boundaries, and a paragraph larger than the budget on character boundaries.
+    ``separator`` only goes between documents: the parts of a split document that share a
+    chunk are re-joined as paragraphs.
+    """
+    max_chars = max_tokens * CHARS_PER_TOKEN
+    # (text, whether it starts a document)
+    pieces: list[tuple[str, bool]] = []
+    for document in documents:
+        if len(document) <= max_chars:
+            pieces.append((document, True))
+            continue
+        parts = [
+            paragraph[i : i + max_chars]
+            for paragraph in document.split("\n\n")
+            for i in range(0, len(paragraph), max_chars)
+        ]
+        pieces.extend((part, index == 0) for index, part in enumerate(parts))
+
+    chunks: list[str] = []
+    current = ""
+    for piece, starts_document in pieces:
+        joiner = separator if starts_document else "\n\n"
+        if current and len(current) + len(joiner) + len(piece) > max_chars:
+            chunks.append(current)
+            current = piece
+        else:
+            current = f"{current}{joiner}{piece}" if current else piece
+    if current:
+        chunks.append(current)
+    return chunks
@@ -12,7 +12,12 @@ from typing import Any
 
 from mangum import Mangum
 
-from deep_research_agent.api.main import app
+# Lambda freezes the execution environment once a response is returned, and Mangum runs the app
+# without its lifespan, so a background job would stall: run each workflow call within its request.
+# Set before importing the app, whose settings are read at import time.
+os.environ.setdefault("BACKGROUND_JOBS_ENABLED", "false")
+
+from deep_research_agent.api.main import app  # noqa: E402
 
 # Configure logging for Lambda environment
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
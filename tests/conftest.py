@@ -0,0 +1,83 @@
+import pytest
+
+from deep_research_agent.common.schemas import AgentType
+from deep_research_agent.core import orchestrator, workflow
+
+# A small workflow: query understanding feeds two research steps, ideation reads one of them and the
+# report reads a key ("evaluation") that no step produces
+METADATA = {
+    AgentType.QUERY_UNDERSTANDING: {
+        "name": "Understand",
+        "inputs": ["conversation_history"],
+        "outputs": ["mission_brief"],
+        "requires": ["conversation_history"],
+    },
+    AgentType.GENERIC_SEARCH: {"name": "Search", "inputs": ["mission_brief"], "outputs": ["search_notes"]},
+    AgentType.PARALLEL_RESEARCH: {
+        "name": "Research",
+        "inputs": ["mission_brief"],
+        "outputs": ["research_results"],
+        "requires": ["mission_brief"],
+    },
+    AgentType.IDEATION: {
+        "name": "Ideate",
+        "inputs": ["research_results", "uploaded_docs"],
+        "outputs": ["initial_ideas"],
+        "requires": ["research_results"],
+    },
+    AgentType.REPORT_SYNTHESIZER: {
+        "name": "Report",
+        "inputs": ["initial_ideas", "evaluation"],
+        "outputs": ["final_report"],
+        "requires": ["evaluation"],
+    },
+}
+
+
+class StubStepAgent:
+    """Step agent writing a placeholder for each declared output of its step, or raising a queued error."""
+
+    uses_model = False
+    effective_model_id = None
+
+    def __init__(self, agent_type: AgentType, pool: "StubAgentPool"):
+        self.agent_type = agent_type
+        self.pool = pool
+
+    def execute(self, context: dict) -> None:
+        self.pool.calls.append(self.agent_type)
+        if self.pool.errors.get(self.agent_type):
+            raise self.pool.errors[self.agent_type].pop(0)
+        for key in METADATA[self.agent_type]["outputs"]:
+            context[key] = [f"{key} from {self.agent_type.value}"]
+
+
+class StubAgentPool:
+    def __init__(self):
+        self.calls: list[AgentType] = []
+        # Errors the next runs of a step raise, in order
+        self.errors: dict[AgentType, list[Exception]] = {}
+        self.agents: dict[AgentType, StubStepAgent] = {}
+
+    def get(self, agent_type: AgentType) -> StubStepAgent:
+        return self.agents.setdefault(agent_type, StubStepAgent(agent_type, self))
+
+    def stats(self) -> dict:
+        return {}
+
+
+@pytest.fixture
+def step_metadata(monkeypatch) -> dict:
+    """Replace the workflow step metadata with METADATA."""
+    monkeypatch.setattr(workflow, "WORKFLOW_STEP_METADATA", METADATA)
+    monkeypatch.setattr(orchestrator, "WORKFLOW_STEP_METADATA", METADATA)
+    monkeypatch.setattr(workflow, "WORKFLOW_RESULT_KEYS", frozenset({"initial_ideas", "final_report"}))
+    return METADATA
+
+
+@pytest.fixture
+def agent_pool(monkeypatch, step_metadata) -> StubAgentPool:
+    """Serve stub step agents to the orchestrator."""
+    pool = StubAgentPool()
+    monkeypatch.setattr(orchestrator, "step_agent_pool", pool)
+    return pool
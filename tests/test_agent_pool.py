@@ -0,0 +1,111 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from deep_research_agent.common.schemas import AgentType
+from deep_research_agent.core import agent_pool
+from deep_research_agent.core.agent_pool import StepAgentPool
+
+pytestmark = pytest.mark.unit
+
+
+class RoutedAgent:
+    """Step agent taking a prompt service and a model; counts its constructions."""
+
+    created = 0
+    lock = threading.Lock()
+
+    def __init__(self, prompt_service=None, model_id: str | None = None):
+        time.sleep(0.01)  # widen the window for racing constructions
+        with RoutedAgent.lock:
+            RoutedAgent.created += 1
+        self.prompt_service = prompt_service
+        self.model_id = model_id
+        self.effective_model_id = model_id or "default-model"
+
+
+class PlainAgent:
+    """Step agent whose constructor takes no arguments."""
+
+    effective_model_id = None
+
+
+class BrokenAgent:
+    def __init__(self):
+        raise RuntimeError("missing credentials")
+
+
+@pytest.fixture
+def routes(monkeypatch) -> dict:
+    """Model routes by agent type, read by the pool through resolve_model_id."""
+    routes = {}
+    RoutedAgent.created = 0
+    monkeypatch.setattr(agent_pool, "resolve_model_id", routes.get)
+    monkeypatch.setattr(agent_pool, "get_prompt_service", lambda: "prompt-service")
+    return routes
+
+
+@pytest.fixture
+def pool(routes) -> StepAgentPool:
+    return StepAgentPool(
+        {
+            AgentType.IDEATION: RoutedAgent,
+            AgentType.RANKING: RoutedAgent,
+            AgentType.CLARIFIER: PlainAgent,
+            AgentType.DEVILS_ADVOCATE: BrokenAgent,
+        }
+    )
+
+
+def test_agent_is_built_once_per_type_and_reused(pool):
+    first = pool.get(AgentType.IDEATION)
+    second = pool.get(AgentType.IDEATION)
+
+    assert first is second
+    assert pool.stats() == {"hits": 1, "created": 1, "agents": 1}
+
+
+def test_agents_are_keyed_by_type_and_routed_model(pool, routes):
+    default = pool.get(AgentType.IDEATION)
+    routes[AgentType.IDEATION] = "model-b"
+    routed = pool.get(AgentType.IDEATION)
+    ranking = pool.get(AgentType.RANKING)
+
+    assert routed is not default
+    assert (default.model_id, routed.model_id) == (None, "model-b")
+    assert ranking is not default
+    assert pool.stats()["agents"] == 3
+
+
+def test_constructor_receives_only_the_arguments_it_accepts(pool, routes):
+    routes[AgentType.IDEATION] = "model-b"
+    routes[AgentType.CLARIFIER] = "model-c"
+
+    assert pool.get(AgentType.IDEATION).prompt_service == "prompt-service"
+    assert isinstance(pool.get(AgentType.CLARIFIER), PlainAgent)
+
+
+def test_unregistered_type_is_an_error(pool):
+    with pytest.raises(ValueError):
+        pool.get(AgentType.REPORT_SYNTHESIZER)
+
+
+def test_concurrent_first_uses_build_a_single_agent(pool):
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        agents = list(executor.map(lambda _: pool.get(AgentType.IDEATION), range(8)))
+
+    assert all(agent is agents[0] for agent in agents)
+    assert RoutedAgent.created == 1
+    assert pool.stats() == {"hits": 7, "created": 1, "agents": 1}
+
+
+def test_warm_builds_agents_and_their_models_and_skips_failures(pool, monkeypatch):
+    models = []
+    monkeypatch.setattr(agent_pool.AgentFactory, "get_model", models.append)
+
+    pool.warm([AgentType.IDEATION, AgentType.DEVILS_ADVOCATE, AgentType.CLARIFIER, AgentType.IDEATION])
+
+    assert models == ["default-model"]
+    assert pool.stats() == {"hits": 0, "created": 2, "agents": 2}
@@ -0,0 +1,153 @@
+import asyncio
+import threading
+import time
+
+import pytest
+from strands.types.exceptions import EventLoopException
+
+from deep_research_agent.common.config import settings
+from deep_research_agent.core.async_agent import (
+    InvocationCancelledError,
+    InvocationDeadline,
+    InvocationTimeoutError,
+    current_invocation_deadline,
+    deadline_callback_handler,
+    invoke_agent_async,
+    research_semaphore,
+)
+
+pytestmark = pytest.mark.unit
+
+TOOL_USE = {"role": "assistant", "content": [{"toolUse": {"toolUseId": "t1", "name": "search", "input": {}}}]}
+
+
+class StubAgent:
+    """
+    Agent emitting scripted callback events from its worker thread, like a strands agent.
+
+    Each step is ("data", text), ("message", message) or ("sleep", seconds). Errors raised by the
+    callback handler are reported and wrapped the way strands' event loop does.
+    """
+
+    def __init__(self, steps: list[tuple[str, object]], result: str = "done"):
+        self.steps = steps
+        self.result = result
+        self.stopped = threading.Event()
+
+    def __call__(self, prompt: str, callback_handler):
+        try:
+            for kind, value in self.steps:
+                if kind == "sleep":
+                    time.sleep(value)
+                else:
+                    callback_handler(**{kind: value})
+            return self.result
+        except Exception as e:
+            self.stopped.set()
+            try:
+                callback_handler(force_stop=True, force_stop_reason=str(e))
+            finally:
+                raise EventLoopException(e) from e
+
+
+def set_deadline(soft: float | None, hard: float | None) -> None:
+    # Async tests run in their own task, so the deadline does not outlive the test
+    current_invocation_deadline.set(InvocationDeadline(soft, hard))
+
+
+async def test_invocation_returns_the_agent_result():
+    assert await invoke_agent_async(StubAgent([("data", "hi")]), "prompt") == "done"
+
+
+async def test_soft_deadline_stops_at_the_next_tool_round_trip_with_the_partial_text():
+    set_deadline(0.05, None)
+    agent = StubAgent([("data", "partial "), ("data", "answer"), ("sleep", 0.2), ("message", TOOL_USE)])
+
+    with pytest.raises(InvocationTimeoutError) as excinfo:
+        await invoke_agent_async(agent, "prompt")
+
+    assert excinfo.value.partial_text == "partial answer"
+    assert not excinfo.value.hard
+    assert agent.stopped.is_set()
+
+
+async def test_soft_deadline_lets_an_answer_without_tool_calls_finish():
+    set_deadline(0.05, None)
+    agent = StubAgent([("data", "text"), ("sleep", 0.15), ("data", "more")])
+
+    assert await invoke_agent_async(agent, "prompt") == "done"
+
+
+async def test_hard_deadline_abandons_the_invocation_and_aborts_the_agent():
+    set_deadline(None, 0.05)
+    agent = StubAgent([("data", "partial"), ("sleep", 0.2), ("data", "late")])
+
+    with pytest.raises(InvocationTimeoutError) as excinfo:
+        await invoke_agent_async(agent, "prompt")
+
+    assert excinfo.value.hard
+    assert excinfo.value.partial_text == "partial"
+    assert agent.stopped.wait(1)
+
+
+async def test_errors_other_than_cancellation_reach_the_caller():
+    set_deadline(0.05, None)
+
+    class FailingAgent(StubAgent):
+        def __call__(self, prompt, callback_handler):
+            time.sleep(0.1)
+            raise EventLoopException(ValueError("model failed"))
+
+    with pytest.raises(EventLoopException):
+        await invoke_agent_async(FailingAgent([]), "prompt")
+
+
+def test_deadline_callback_handler_aborts_past_the_hard_deadline():
+    token = current_invocation_deadline.set(InvocationDeadline(None, 60))
+    try:
+        deadline_callback_handler(data="token")
+        current_invocation_deadline.set(InvocationDeadline(None, 0.001))
+        time.sleep(0.01)
+        with pytest.raises(InvocationCancelledError):
+            deadline_callback_handler(data="token")
+    finally:
+        current_invocation_deadline.reset(token)
+
+
+def test_capped_deadline_takes_the_earlier_of_each():
+    step = InvocationDeadline(10, 20)
+    lane = InvocationDeadline(5, 30)
+
+    capped = lane.capped_by(step)
+
+    assert capped.soft_at == lane.soft_at
+    assert capped.hard_at == step.hard_at
+    assert lane.capped_by(None) is lane
+
+
+async def test_research_invocations_are_capped_and_run_on_the_research_executor(monkeypatch):
+    monkeypatch.setattr(settings, "research_max_concurrency", 2)
+    lock = threading.Lock()
+    running = {"now": 0, "peak": 0}
+    threads = set()
+
+    class CountingAgent(StubAgent):
+        def __call__(self, prompt, callback_handler):
+            with lock:
+                running["now"] += 1
+                running["peak"] = max(running["peak"], running["now"])
+                threads.add(threading.current_thread().name)
+            time.sleep(0.05)
+            with lock:
+                running["now"] -= 1
+            return prompt
+
+    semaphore = research_semaphore()
+    results = await asyncio.gather(
+        *(invoke_agent_async(CountingAgent([]), f"prompt {index}", semaphore) for index in range(6))
+    )
+
+    assert results == [f"prompt {index}" for index in range(6)]
+    assert running["peak"] == 2
+    assert all(name.startswith("research-agent") for name in threads)
+    assert research_semaphore() is semaphore
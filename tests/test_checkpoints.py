@@ -0,0 +1,110 @@
+import pytest
+
+from deep_research_agent.common.schemas import AgentType, AwaitingUserInputError
+from deep_research_agent.core.checkpoints import FileCheckpointStore, SQLiteCheckpointStore
+from deep_research_agent.core.orchestrator import OrchestratorAgent
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture(params=["file", "sqlite"])
+def store(request, tmp_path):
+    if request.param == "file":
+        return FileCheckpointStore(str(tmp_path / "checkpoints"))
+    return SQLiteCheckpointStore(str(tmp_path / "checkpoints" / "checkpoints.db"))
+
+
+class TestCheckpointStore:
+    def test_save_load_delete_round_trip(self, store):
+        checkpoint = {"workflow": ["ideation"], "workflow_context": {"initial_ideas": {"use_cases": [1, 2]}}}
+
+        store.save("wf-1", checkpoint)
+        assert store.load("wf-1") == checkpoint
+
+        store.delete("wf-1")
+        assert store.load("wf-1") is None
+        store.delete("wf-1")
+
+    def test_latest_checkpoint_replaces_the_previous_one(self, store):
+        store.save("wf-1", {"step": 1})
+        store.save("wf-1", {"step": 2})
+        store.save("wf-2", {"step": 9})
+
+        assert store.load("wf-1") == {"step": 2}
+        assert store.load("wf-2") == {"step": 9}
+
+    def test_unknown_workflow_has_no_checkpoint(self, store):
+        assert store.load("missing") is None
+
+    @pytest.mark.parametrize("workflow_id", ["../escape", "a/b", "", "x" * 129])
+    def test_unsafe_workflow_ids_are_rejected(self, store, workflow_id):
+        with pytest.raises(ValueError):
+            store.save(workflow_id, {})
+
+
+async def test_failed_workflow_resumes_from_its_checkpoint(store, agent_pool, step_metadata):
+    workflow = list(step_metadata)
+    agent_pool.errors[AgentType.IDEATION] = [RuntimeError("model unavailable")]
+    orchestrator = OrchestratorAgent(workflow=workflow, workflow_id="wf-1", checkpoint_store=store)
+
+    with pytest.raises(RuntimeError):
+        await orchestrator.run_workflow_from_conversation(["AI for retail"])
+
+    restored = OrchestratorAgent.from_checkpoint("wf-1", store)
+    assert restored.workflow_status["status"] == "error"
+    assert restored.workflow_status["error_agent"] == "ideation"
+    assert restored.workflow_context["research_results"] == ["research_results from parallel_research"]
+
+    agent_pool.calls.clear()
+    result = await restored.resume_workflow()
+
+    assert agent_pool.calls == [AgentType.IDEATION]
+    assert result == {"use_cases": ["initial_ideas from ideation"]}
+    assert store.load("wf-1") is None
+
+
+async def test_workflow_paused_for_user_input_is_checkpointed_as_awaiting_input(store, agent_pool, step_metadata):
+    workflow = list(step_metadata)
+    agent_pool.errors[AgentType.PARALLEL_RESEARCH] = [AwaitingUserInputError("Which market?")]
+    orchestrator = OrchestratorAgent(workflow=workflow, workflow_id="wf-1", checkpoint_store=store)
+
+    with pytest.raises(AwaitingUserInputError):
+        await orchestrator.start_workflow("AI for retail")
+
+    checkpoint = store.load("wf-1")
+    assert checkpoint["status"] == "awaiting_input"
+    assert checkpoint["pending_questions"] == "Which market?"
+    assert checkpoint["error"] == {}
+
+    restored = OrchestratorAgent.from_checkpoint("wf-1", store)
+    assert restored.workflow_status["status"] == "awaiting_input"
+    assert restored.workflow_status["pending_questions"] == "Which market?"
+
+    agent_pool.calls.clear()
+    result = await restored.continue_workflow("Grocery")
+
+    assert agent_pool.calls == [AgentType.PARALLEL_RESEARCH, AgentType.IDEATION]
+    assert restored.workflow_context["conversation_history"] == ["AI for retail", "Grocery"]
+    assert "pending_questions" not in restored.workflow_status
+    assert result == {"use_cases": ["initial_ideas from ideation"]}
+
+
+async def test_interrupted_run_is_restored_as_interrupted(store, step_metadata):
+    store.save(
+        "wf-1",
+        {
+            "workflow": [agent_type.value for agent_type in step_metadata],
+            "workflow_context": {"conversation_history": ["AI for retail"]},
+            "step_status": ["completed", "skipped", "running", "pending", "pending"],
+            "step_history": [],
+            "status": "running",
+            "error": {},
+            "started_at": "2026-01-01T00:00:00",
+            "saved_at": "2026-01-01T00:01:00",
+        },
+    )
+
+    restored = OrchestratorAgent.from_checkpoint("wf-1", store)
+
+    assert restored.workflow_status["status"] == "interrupted"
+    assert restored.step_status[2] == "cancelled"
@@ -0,0 +1,75 @@
+import pytest
+
+from deep_research_agent.agents.reporting import citation_report_generator_agent
+from deep_research_agent.agents.reporting.citation_report_generator_agent import CitationReportGeneratorAgent
+
+pytestmark = pytest.mark.unit
+
+USE_CASES = [
+    {"title": "Demand forecasting", "description": "Predict store demand"},
+    {"title": "Visual search", "description": "Find products from photos"},
+]
+
+
+class StubSearchBackend:
+    """Backend answering the n-th query of a batch with the n-th entry of ``responses`` (URLs, or an error)."""
+
+    available = True
+    unavailable_reason = ""
+
+    def __init__(self, responses: list):
+        self.responses = responses
+        self.payloads: list[dict] = []
+
+    def search_many(self, payloads: list[dict]) -> list:
+        self.payloads = payloads
+        return [
+            response
+            if isinstance(response, Exception)
+            else {"organic": [{"title": url, "link": f"https://{url}", "snippet": url} for url in response]}
+            for response in self.responses
+        ]
+
+
+@pytest.fixture
+def backend(monkeypatch) -> StubSearchBackend:
+    backend = StubSearchBackend(
+        [
+            ["shared", "a1", "a2"],
+            RuntimeError("rate limited"),
+            ["b0", "shared", "b2"],
+            ["c0"],
+            ["shared", "d1"],
+        ]
+    )
+    monkeypatch.setattr(citation_report_generator_agent, "get_search_backend", lambda: backend)
+    return backend
+
+
+def _urls(citations: list[tuple[str, str, str]]) -> list[str]:
+    return [url.removeprefix("https://") for _, url, _ in citations]
+
+
+def test_citations_interleave_queries_by_rank_without_duplicate_urls(backend):
+    citations = CitationReportGeneratorAgent(prompt_service=None)._search_consolidated_citations(USE_CASES)
+
+    # Three consolidated queries plus one per use case; the failed query is skipped
+    assert len(backend.payloads) == 5
+    assert _urls(citations) == ["shared", "b0", "c0", "a1", "d1", "a2", "b2"]
+
+
+def test_citations_are_capped_overall_and_per_query(backend):
+    citations = CitationReportGeneratorAgent(prompt_service=None)._search_consolidated_citations(
+        USE_CASES, max_results=4
+    )
+
+    assert _urls(citations) == ["shared", "b0", "c0", "a1"]
+    assert {payload["num"] for payload in backend.payloads} == {4 // 3 + 2}
+
+
+def test_no_citations_without_a_search_backend(backend):
+    backend.available = False
+    backend.unavailable_reason = "SERPER_API_KEY environment variable is not set"
+
+    assert CitationReportGeneratorAgent(prompt_service=None)._search_consolidated_citations(USE_CASES) == []
+    assert backend.payloads == []
@@ -0,0 +1,252 @@
+import threading
+import time
+
+import pytest
+from botocore.exceptions import ClientError, EndpointConnectionError
+from strands.models import BedrockModel
+from strands.types.exceptions import ModelThrottledException
+
+from deep_research_agent.common.config import settings
+from deep_research_agent.core import agent_factory
+from deep_research_agent.core.agent_factory import BedrockThrottledError, LimitedBedrockModel
+from deep_research_agent.core.concurrency import AdaptiveConcurrencyLimiter, TokenBucketRateLimiter, jittered_backoff
+
+pytestmark = pytest.mark.unit
+
+
+class TestAdaptiveConcurrencyLimiter:
+    def test_success_increases_limit_additively(self):
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=4, max_limit=10)
+
+        # Each success adds 1/limit, so the limit grows by one after about a limit's worth of calls
+        for _ in range(5):
+            with limiter.slot():
+                pass
+
+        assert limiter.limit == 5
+        assert limiter.stats()["acquired"] == 5
+
+    def test_limit_never_exceeds_max(self):
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=2, max_limit=2)
+
+        for _ in range(10):
+            with limiter.slot():
+                pass
+
+        assert limiter.limit == 2
+
+    def test_throttle_decreases_limit_multiplicatively_down_to_min(self):
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=8, min_limit=3)
+
+        with limiter.slot() as slot:
+            slot.mark_throttled()
+        assert limiter.limit == 4
+
+        with limiter.slot() as slot:
+            slot.mark_throttled()
+        assert limiter.limit == 3
+        assert limiter.stats()["limit_decreases"] == 2
+
+    def test_throttles_from_calls_started_before_a_decrease_count_once(self):
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=8)
+
+        with limiter.slot() as first, limiter.slot() as second:
+            first.mark_throttled()
+            second.mark_throttled()
+
+        assert limiter.limit == 4
+        stats = limiter.stats()
+        assert stats["throttled"] == 2
+        assert stats["limit_decreases"] == 1
+
+    def test_error_in_call_neither_grows_nor_shrinks_limit(self):
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=2)
+
+        with pytest.raises(RuntimeError), limiter.slot():
+            raise RuntimeError("boom")
+
+        assert limiter._limit == 2.0
+        assert limiter.stats()["in_flight"] == 0
+
+    def test_callers_wait_while_limit_is_reached(self):
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=1, max_limit=1)
+        acquired = threading.Event()
+
+        def second_call():
+            with limiter.slot():
+                acquired.set()
+
+        with limiter.slot():
+            thread = threading.Thread(target=second_call)
+            thread.start()
+            assert not acquired.wait(0.05)
+            assert limiter.stats()["waiting"] == 1
+
+        assert acquired.wait(1)
+        thread.join()
+        assert limiter.stats()["max_waiting"] == 1
+
+
+class TestTokenBucketRateLimiter:
+    def test_burst_up_to_capacity_does_not_wait(self):
+        bucket = TokenBucketRateLimiter(rate=1.0, capacity=3)
+
+        waits = [bucket.acquire() for _ in range(3)]
+
+        assert all(wait < 0.01 for wait in waits)
+        assert bucket.stats()["delayed"] == 0
+
+    def test_empty_bucket_waits_for_refill(self):
+        bucket = TokenBucketRateLimiter(rate=20.0, capacity=1)
+        bucket.acquire()
+
+        waited = bucket.acquire()
+
+        assert 0.03 <= waited < 0.5
+        assert bucket.stats()["delayed"] == 1
+
+    def test_request_larger_than_capacity_leaves_bucket_in_debt(self):
+        bucket = TokenBucketRateLimiter(rate=20.0, capacity=1)
+
+        assert bucket.acquire(3) < 0.01
+        waited = bucket.acquire()
+
+        # Two tokens of debt plus the token requested, at 20 tokens per second
+        assert waited >= 0.12
+
+    def test_waiting_callers_are_served_in_arrival_order(self):
+        bucket = TokenBucketRateLimiter(rate=50.0, capacity=2)
+        bucket.acquire(2)
+        order = []
+
+        def acquire(name: str, tokens: float):
+            bucket.acquire(tokens)
+            order.append(name)
+
+        large = threading.Thread(target=acquire, args=("large", 2))
+        large.start()
+        time.sleep(0.01)
+        small = threading.Thread(target=acquire, args=("small", 1))
+        small.start()
+        large.join(1)
+        small.join(1)
+
+        assert order == ["large", "small"]
+
+    @pytest.mark.parametrize("rate, capacity", [(0.0, 1.0), (-1.0, 1.0), (1.0, 0.0)])
+    def test_rate_and_capacity_must_be_positive(self, rate, capacity):
+        with pytest.raises(ValueError):
+            TokenBucketRateLimiter(rate, capacity)
+
+
+def test_jittered_backoff_is_bounded():
+    for attempt in range(10):
+        delay = jittered_backoff(attempt, base_delay=1.0, max_delay=5.0)
+        assert 0 <= delay <= min(5.0, 2**attempt)
+
+
+class TestLimitedBedrockModelRetries:
+    @pytest.fixture(autouse=True)
+    def no_backoff(self, monkeypatch):
+        monkeypatch.setattr(settings, "bedrock_throttle_retries", 2)
+        monkeypatch.setattr(settings, "bedrock_retry_base_delay", 0.0)
+
+    @staticmethod
+    def _model(monkeypatch, throttles: int) -> tuple[LimitedBedrockModel, list[int]]:
+        calls = []
+
+        def stream(self, request):
+            calls.append(1)
+            if len(calls) <= throttles:
+                raise ModelThrottledException("slow down")
+            yield {"messageStart": {"role": "assistant"}}
+
+        monkeypatch.setattr(BedrockModel, "stream", stream)
+        return LimitedBedrockModel(model_id="test-model", region_name="us-east-1"), calls
+
+    def test_throttled_call_is_retried(self, monkeypatch):
+        model, calls = self._model(monkeypatch, throttles=2)
+
+        events = list(model.stream({}))
+
+        assert events == [{"messageStart": {"role": "assistant"}}]
+        assert len(calls) == 3
+
+    def test_exhausted_retries_raise_an_error_strands_does_not_retry(self, monkeypatch):
+        model, calls = self._model(monkeypatch, throttles=5)
+
+        with pytest.raises(BedrockThrottledError) as error:
+            list(model.stream({}))
+
+        assert not isinstance(error.value, ModelThrottledException)
+        assert len(calls) == 3
+
+    @staticmethod
+    def _failing_model(monkeypatch, failures: list[Exception], mid_stream: Exception | None = None):
+        calls = []
+
+        def stream(self, request):
+            calls.append(1)
+            if len(calls) <= len(failures):
+                raise failures[len(calls) - 1]
+            yield {"messageStart": {"role": "assistant"}}
+            if mid_stream is not None:
+                raise mid_stream
+            yield {"messageStop": {"stopReason": "end_turn"}}
+
+        monkeypatch.setattr(BedrockModel, "stream", stream)
+        return LimitedBedrockModel(model_id="test-model", region_name="us-east-1"), calls
+
+    @pytest.mark.parametrize(
+        "error",
+        [
+            ClientError({"Error": {"Code": "InternalServerException"}}, "ConverseStream"),
+            ClientError({"Error": {"Code": "ServiceUnavailableException"}}, "ConverseStream"),
+            EndpointConnectionError(endpoint_url="https://bedrock-runtime"),
+        ],
+    )
+    def test_transient_errors_are_retried(self, monkeypatch, error):
+        model, calls = self._failing_model(monkeypatch, [error, error])
+
+        events = list(model.stream({}))
+
+        assert len(events) == 2
+        assert len(calls) == 3
+
+    def test_transient_errors_are_raised_once_retries_are_exhausted(self, monkeypatch):
+        error = ClientError({"Error": {"Code": "InternalServerException"}}, "ConverseStream")
+        model, calls = self._failing_model(monkeypatch, [error] * 3)
+
+        with pytest.raises(ClientError):
+            list(model.stream({}))
+
+        assert len(calls) == 3
+
+    def test_request_errors_are_not_retried(self, monkeypatch):
+        error = ClientError({"Error": {"Code": "ValidationException"}}, "ConverseStream")
+        model, calls = self._failing_model(monkeypatch, [error])
+
+        with pytest.raises(ClientError):
+            list(model.stream({}))
+
+        assert len(calls) == 1
+
+    def test_errors_after_the_first_event_are_not_retried(self, monkeypatch):
+        error = ClientError({"Error": {"Code": "InternalServerException"}}, "ConverseStream")
+        model, calls = self._failing_model(monkeypatch, [], mid_stream=error)
+
+        with pytest.raises(ClientError):
+            list(model.stream({}))
+
+        assert len(calls) == 1
+
+    def test_throttle_after_the_first_event_shrinks_the_limit_and_is_left_to_strands(self, monkeypatch):
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=8, min_limit=1, max_limit=8)
+        monkeypatch.setattr(agent_factory, "bedrock_limiter", limiter)
+        model, calls = self._failing_model(monkeypatch, [], mid_stream=ModelThrottledException("slow down"))
+
+        with pytest.raises(ModelThrottledException):
+            list(model.stream({}))
+
+        assert len(calls) == 1
+        assert limiter.limit < 8
@@ -0,0 +1,88 @@
+import asyncio
+import threading
+
+import pytest
+
+from deep_research_agent.core.events import WorkflowEventStream, format_sse
+
+pytestmark = pytest.mark.unit
+
+
+async def _collect(stream: WorkflowEventStream, **kwargs) -> list:
+    return [message async for message in stream.subscribe(**kwargs)]
+
+
+async def test_late_subscriber_gets_replayed_history_but_not_tokens():
+    stream = WorkflowEventStream()
+    stream.publish("step_started", {"step": 0})
+    stream.publish("token", {"text": "hello"}, replay=False)
+    stream.publish("step_completed", {"step": 0})
+    stream.close()
+
+    messages = await _collect(stream)
+
+    assert [message["event"] for message in messages] == ["step_started", "step_completed"]
+    assert [message["id"] for message in messages] == [1, 3]
+    assert messages[0]["data"]["step"] == 0
+    assert "timestamp" in messages[0]["data"]
+
+
+async def test_history_is_bounded():
+    stream = WorkflowEventStream(history_size=2)
+    for step in range(5):
+        stream.publish("step_started", {"step": step})
+    stream.close()
+
+    messages = await _collect(stream)
+
+    assert [message["data"]["step"] for message in messages] == [3, 4]
+
+
+async def test_close_ends_live_subscriptions_and_drops_later_events():
+    stream = WorkflowEventStream()
+    subscriber = asyncio.create_task(_collect(stream))
+    await asyncio.sleep(0)
+
+    stream.publish("step_started", {"step": 0})
+    stream.close()
+    stream.publish("step_completed", {"step": 0})
+    messages = await asyncio.wait_for(subscriber, 1)
+
+    assert [message["event"] for message in messages] == ["step_started"]
+    assert stream.closed
+    assert stream._subscribers == []
+
+
+async def test_publish_from_worker_thread_reaches_subscriber():
+    stream = WorkflowEventStream()
+    subscriber = asyncio.create_task(_collect(stream))
+    await asyncio.sleep(0)
+
+    def work():
+        for index in range(3):
+            stream.publish("token", {"text": str(index)}, replay=False)
+        stream.close()
+
+    thread = threading.Thread(target=work)
+    thread.start()
+    messages = await asyncio.wait_for(subscriber, 1)
+    thread.join()
+
+    assert [message["data"]["text"] for message in messages] == ["0", "1", "2"]
+
+
+async def test_idle_timeout_yields_keep_alive_marker():
+    stream = WorkflowEventStream()
+    subscription = stream.subscribe(idle_timeout=0.01)
+
+    assert await asyncio.wait_for(anext(subscription), 1) is None
+
+    stream.close()
+    with pytest.raises(StopAsyncIteration):
+        await asyncio.wait_for(anext(subscription), 1)
+
+
+def test_format_sse():
+    frame = format_sse({"id": 7, "event": "step_started", "data": {"step": 1}})
+
+    assert frame == 'id: 7\nevent: step_started\ndata: {"step": 1}\n\n'
@@ -0,0 +1,122 @@
+import asyncio
+
+import pytest
+from fastapi.testclient import TestClient
+
+from deep_research_agent.api import main
+from deep_research_agent.core.jobs import InMemoryJobQueue, JobRunner
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+def runner():
+    runner = JobRunner(InMemoryJobQueue(), workers=1)
+
+    async def echo(payload):
+        if payload.get("fail"):
+            raise ValueError("boom")
+        await asyncio.sleep(0)
+        return {"echo": payload["value"]}
+
+    runner.register("echo", echo)
+    return runner
+
+
+async def test_submit_runs_job_on_worker(runner):
+    job = await runner.submit("echo", {"value": 1}, key="c1")
+    assert job.status == "queued"
+
+    await asyncio.wait_for(job.done.wait(), 1)
+    assert job.status == "succeeded"
+    assert job.result == {"echo": 1}
+    assert runner.latest_job("c1") is job
+    await runner.stop()
+
+
+async def test_run_finishes_job_before_returning(runner):
+    job = await runner.run("echo", {"value": 2}, key="c1")
+
+    assert job.done.is_set()
+    assert job.result == {"echo": 2}
+    assert runner.get(job.id) is job
+    assert not runner._worker_tasks
+
+
+async def test_run_records_failure(runner):
+    job = await runner.run("echo", {"fail": True})
+
+    assert job.status == "failed"
+    assert job.error == "boom"
+
+
+async def test_active_key_is_refused(runner):
+    await runner.submit("echo", {"value": 1}, key="c1")
+    with pytest.raises(RuntimeError):
+        await runner.run("echo", {"value": 2}, key="c1")
+    with pytest.raises(KeyError):
+        await runner.run("unknown", {})
+    await runner.stop()
+
+
+async def test_stop_fails_running_and_queued_jobs_and_releases_their_keys(runner):
+    runner.register("wait", lambda payload: asyncio.Event().wait())
+    running = await runner.submit("wait", {}, key="c1")
+    queued = await runner.submit("wait", {}, key="c2")
+    await asyncio.sleep(0.01)
+
+    await runner.stop()
+
+    assert (running.status, running.error) == ("failed", "Job cancelled")
+    assert (queued.status, queued.started_at) == ("failed", None)
+    assert running.done.is_set() and queued.done.is_set()
+    job = await runner.submit("echo", {"value": 3}, key="c2")
+    await asyncio.wait_for(job.done.wait(), 1)
+    assert job.result == {"echo": 3}
+    await runner.stop()
+
+
+class FakeOrchestrator:
+    workflow_status = {"status": "failed"}
+
+    async def continue_workflow(self, response):
+        return {"answer": response}
+
+    async def resume_workflow(self):
+        return {"resumed": True}
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setattr(main, "job_runner", JobRunner(InMemoryJobQueue(), workers=1))
+    for kind, handler in (("respond", main._respond_job), ("resume", main._resume_job)):
+        main.job_runner.register(kind, handler)
+    monkeypatch.setattr(main.conversation_manager, "get_conversation", lambda conversation_id: FakeOrchestrator())
+    monkeypatch.setattr(main.settings, "agent_pool_warmup", False)
+    with TestClient(main.app) as client:
+        yield client
+
+
+def test_respond_without_background_jobs_returns_outcome(client, monkeypatch):
+    monkeypatch.setattr(main.settings, "background_jobs_enabled", False)
+
+    response = client.post("/research/c1/respond", json={"response": "yes"})
+
+    assert response.status_code == 200
+    assert response.json() == {
+        "status": "use_cases_generated",
+        "conversation_id": "c1",
+        "result": {"answer": "yes"},
+    }
+
+
+def test_resume_with_background_jobs_accepts(client, monkeypatch):
+    monkeypatch.setattr(main.settings, "background_jobs_enabled", True)
+
+    response = client.post("/research/c1/resume")
+
+    assert response.status_code == 202
+    body = response.json()
+    assert body["status"] == "accepted"
+    job = client.get(body["job_url"]).json()
+    assert job["kind"] == "resume"
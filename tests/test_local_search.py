@@ -0,0 +1,110 @@
+import json
+import sys
+
+import pytest
+
+from deep_research_agent.services.local_search import LocalSearchBackend, LocalSearchIndex, ingest
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+def index() -> LocalSearchIndex:
+    index = LocalSearchIndex()
+    index.add_document("Retail demand forecasting", "https://a.example", "Forecasting demand with machine learning.")
+    index.add_document("Warehouse robotics", "https://b.example", "Robots move pallets; forecasting is not covered.")
+    index.add_document("Store layout", "https://c.example", "Shelf placement and customer flow in stores.")
+    return index
+
+
+class TestLocalSearchIndex:
+    def test_bm25_ranks_title_and_frequent_matches_first(self, index):
+        hits = index.search("demand forecasting")
+
+        assert [document["url"] for document, _ in hits] == ["https://a.example", "https://b.example"]
+        assert hits[0][1] > hits[1][1] > 0
+
+    def test_rare_terms_outweigh_common_ones(self, index):
+        index.add_document("Forecasting pallets", "https://d.example", "Forecasting forecasting pallets.")
+
+        hits = index.search("forecasting robots")
+
+        assert hits[0][0]["url"] == "https://b.example"
+
+    def test_k_limits_results_and_unknown_terms_match_nothing(self, index):
+        assert len(index.search("forecasting", k=1)) == 1
+        assert index.search("quantum") == []
+        assert LocalSearchIndex().search("forecasting") == []
+
+    def test_duplicate_urls_are_not_reindexed(self, index):
+        assert not index.add_document("Again", "https://a.example", "Other text")
+        assert len(index.documents) == 3
+
+    def test_save_and_load_round_trip(self, index, tmp_path):
+        path = str(tmp_path / "index" / "search.json")
+        index.save(path)
+
+        loaded = LocalSearchIndex.load(path)
+
+        assert loaded.documents == index.documents
+        assert loaded.postings == index.postings
+        assert loaded.search("demand forecasting") == index.search("demand forecasting")
+        assert not loaded.add_document("Again", "https://a.example", "Other text")
+
+
+class TestLocalSearchBackend:
+    def test_search_returns_serper_shaped_response(self, index):
+        backend = LocalSearchBackend(index)
+
+        response = backend.search({"q": "store layout", "num": 5})
+
+        assert response["searchParameters"] == {"q": "store layout", "num": 5, "engine": "local"}
+        assert response["organic"][0]["link"] == "https://c.example"
+        assert response["organic"][0]["position"] == 1
+        assert backend.stats()["requests"] == 1
+
+    def test_missing_index_fails_searches_but_not_stats(self, tmp_path):
+        backend = LocalSearchBackend(index_path=str(tmp_path / "missing.json"))
+
+        assert backend.stats() == {"backend": "local", "loaded": False, "index_path": str(tmp_path / "missing.json")}
+        assert not backend.available
+        assert "ingest-search-index" in backend.unavailable_reason
+        with pytest.raises(FileNotFoundError, match="ingest-search-index"):
+            backend.search({"q": "forecasting"})
+
+    def test_index_is_loaded_on_first_search(self, index, tmp_path):
+        path = str(tmp_path / "search.json")
+        index.save(path)
+        backend = LocalSearchBackend(index_path=path)
+
+        assert backend.available and backend.unavailable_reason == ""
+        assert backend.stats()["loaded"] is False
+        backend.search({"q": "forecasting"})
+        assert backend.stats()["loaded"] is True
+        assert backend.stats()["documents"] == 3
+
+
+def test_ingest_builds_and_extends_the_index(tmp_path, monkeypatch):
+    corpus = tmp_path / "corpus"
+    corpus.mkdir()
+    (corpus / "serper.json").write_text(
+        json.dumps({"organic": [{"title": "Demand forecasting", "link": "https://a.example", "snippet": "Forecasts"}]})
+    )
+    (corpus / "pages.jsonl").write_text(json.dumps({"title": "Robots", "url": "https://b.example", "text": "Pallets"}))
+    (corpus / "store_layout.md").write_text("Shelf placement")
+    index_path = str(tmp_path / "search.json")
+
+    monkeypatch.setattr(sys, "argv", ["ingest-search-index", str(corpus), "--index", index_path])
+    ingest()
+    index = LocalSearchIndex.load(index_path)
+    assert {document["title"] for document in index.documents} == {"Demand forecasting", "Robots", "store layout"}
+
+    extra = tmp_path / "extra.jsonl"
+    extra.write_text(json.dumps({"title": "Pricing", "url": "https://c.example", "content": "Dynamic pricing"}))
+    monkeypatch.setattr(sys, "argv", ["ingest-search-index", str(extra), str(corpus), "--index", index_path])
+    ingest()
+    assert len(LocalSearchIndex.load(index_path).documents) == 4
+
+    monkeypatch.setattr(sys, "argv", ["ingest-search-index", str(extra), "--index", index_path, "--rebuild"])
+    ingest()
+    assert [document["title"] for document in LocalSearchIndex.load(index_path).documents] == ["Pricing"]
@@ -0,0 +1,43 @@
+import pytest
+from botocore.exceptions import ClientError
+from strands.types.exceptions import EventLoopException
+
+from deep_research_agent.core.model_routing import is_model_unavailable
+
+pytestmark = pytest.mark.unit
+
+
+def _client_error(code: str, message: str = "") -> ClientError:
+    return ClientError({"Error": {"Code": code, "Message": message}}, "ConverseStream")
+
+
+@pytest.mark.parametrize(
+    ("error", "expected"),
+    [
+        (_client_error("ResourceNotFoundException"), True),
+        (_client_error("AccessDeniedException"), True),
+        (_client_error("ValidationException", "The provided model identifier is invalid."), True),
+        (
+            _client_error(
+                "ValidationException", "Invocation of model ID x with on-demand throughput isn't supported."
+            ),
+            True,
+        ),
+        (_client_error("ValidationException", "Input is too long for requested model."), False),
+        (_client_error("ValidationException", "messages: field required"), False),
+        (_client_error("ThrottlingException"), False),
+        (ValueError("bad output"), False),
+    ],
+)
+def test_is_model_unavailable(error, expected):
+    assert is_model_unavailable(error) is expected
+
+
+def test_is_model_unavailable_follows_strands_wrapping():
+    try:
+        try:
+            raise _client_error("ResourceNotFoundException")
+        except ClientError as e:
+            raise EventLoopException(e, {}) from e
+    except EventLoopException as wrapped:
+        assert is_model_unavailable(wrapped)
@@ -0,0 +1,147 @@
+import asyncio
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from deep_research_agent.services.page_fetcher import PageFetcher, extract_main_text
+from deep_research_agent.utils.cache import TieredCache
+
+pytestmark = pytest.mark.unit
+
+ARTICLE_HTML = (
+    "<html><head><script>var tracking = 1;</script></head><body>"
+    "<nav>Home | About</nav><article><h1>Demand forecasting</h1><p>Retailers forecast demand.</p></article>"
+    "</body></html>"
+)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    requests: list[tuple[str, dict[str, str]]] = []
+
+    def do_GET(self):
+        _Handler.requests.append((self.path, dict(self.headers)))
+        if self.path == "/article":
+            if self.headers.get("If-None-Match") == '"v1"':
+                self.send_response(304)
+                self.end_headers()
+                return
+            self._send(200, "text/html; charset=utf-8", ARTICLE_HTML.encode(), {"ETag": '"v1"'})
+        elif self.path == "/large":
+            self._send(200, "text/plain", b"x" * 50_000)
+        elif self.path == "/image":
+            self._send(200, "image/png", b"\x89PNG")
+        else:
+            self._send(404, "text/plain", b"not found")
+
+    def _send(self, status: int, content_type: str, body: bytes, headers: dict[str, str] | None = None):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture(scope="module")
+def server_url():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+
+
+@pytest.fixture
+def fetcher():
+    _Handler.requests.clear()
+    fetcher = PageFetcher(TieredCache("test_page"), max_bytes=1000, max_chars=100_000, fresh_seconds=0)
+    yield fetcher
+    fetcher.close()
+
+
+def test_extracts_main_text_of_html_pages(fetcher, server_url):
+    contents = fetcher.fetch_contents([f"{server_url}/article"])
+
+    assert contents == {f"{server_url}/article": "Demand forecasting\nRetailers forecast demand."}
+
+
+def test_stale_cached_page_is_revalidated_with_etag(fetcher, server_url):
+    url = f"{server_url}/article"
+    first = fetcher.fetch_contents([url])[url]
+
+    second = fetcher.fetch_contents([url])[url]
+
+    assert second == first
+    assert _Handler.requests[1][1].get("If-None-Match") == '"v1"'
+    stats = fetcher.stats()
+    assert (stats["fetched"], stats["revalidated"]) == (1, 1)
+
+
+def test_fresh_cached_page_is_served_without_a_request(fetcher, server_url):
+    fetcher.fresh_seconds = 3600
+    url = f"{server_url}/article"
+    fetcher.fetch_contents([url])
+
+    fetcher.fetch_contents([url])
+
+    assert len(_Handler.requests) == 1
+    assert fetcher.stats()["fresh_hits"] == 1
+
+
+def test_body_is_cut_off_at_max_bytes(fetcher, server_url):
+    url = f"{server_url}/large"
+
+    assert fetcher.fetch_contents([url])[url] == "x" * 1000
+
+
+def test_non_text_content_and_non_http_urls_are_skipped(fetcher, server_url):
+    contents = fetcher.fetch_contents([f"{server_url}/image", "file:///etc/passwd"])
+
+    assert set(contents.values()) == {None}
+    assert fetcher.stats()["skipped"] == 2
+
+
+def test_http_errors_yield_none(fetcher, server_url):
+    assert fetcher.fetch_contents([f"{server_url}/missing"]) == {f"{server_url}/missing": None}
+    assert fetcher.stats()["failed"] == 1
+
+
+def test_client_is_shared_across_threads_and_event_loops(fetcher, server_url):
+    url = f"{server_url}/article"
+    fetcher.fetch_contents([url])
+    client = fetcher._client
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(fetcher.fetch_contents([url]))) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    results.append(asyncio.run(fetcher.fetch_all([url])))
+
+    assert fetcher._client is client
+    assert len(results) == 4 and all(result[url] for result in results)
+
+
+def test_host_limits_are_dropped_once_no_fetch_for_the_host_is_in_flight(fetcher, server_url):
+    other_host_url = server_url.replace("127.0.0.1", "localhost")
+
+    contents = fetcher.fetch_contents([f"{server_url}/article", f"{server_url}/large", f"{other_host_url}/article"])
+
+    assert all(contents.values())
+    assert fetcher._host_limits == {}
+    assert fetcher._host_fetches == {}
+
+
+def test_extract_main_text_falls_back_to_page_text_and_truncates():
+    html = "<body><nav>Menu</nav><p>" + "word " * 50 + "</p></body>"
+
+    text = extract_main_text(html, max_chars=30)
+
+    assert text.startswith("word word") and text.endswith("...")
+    assert "Menu" not in text
@@ -0,0 +1,176 @@
+import asyncio
+
+import pytest
+from botocore.exceptions import ClientError
+from strands.models import BedrockModel
+
+from deep_research_agent.agents import base_agent
+from deep_research_agent.agents.research import parallel_research_agent, search_summarizer_agent
+from deep_research_agent.agents.research.parallel_research_agent import ParallelResearchAgent
+from deep_research_agent.agents.research.research_engine import ResearchSpec
+from deep_research_agent.agents.research.search_summarizer_agent import condense_research_report_async
+from deep_research_agent.common.config import settings
+from deep_research_agent.common.schemas import AgentType
+from deep_research_agent.core.async_agent import (
+    InvocationDeadline,
+    InvocationTimeoutError,
+    current_invocation_deadline,
+)
+from deep_research_agent.core.events import current_event_stream
+from deep_research_agent.services.response_cache import ResponseCache
+from deep_research_agent.utils.cache import TieredCache
+
+pytestmark = pytest.mark.unit
+
+LANES = ("Alpha", "Beta", "Gamma")
+
+
+class RecordingEventStream:
+    def __init__(self):
+        self.events: list[tuple[str, dict]] = []
+
+    def publish(self, event: str, data: dict | None = None, replay: bool = True) -> None:
+        self.events.append((event, data))
+
+
+@pytest.fixture
+def lanes(monkeypatch) -> dict:
+    """
+    Research lanes Alpha, Beta and Gamma answering from ``outcomes`` (a result, an exception to raise,
+    or a (delay, result) pair), and a condenser answering "brief <lane>" unless it has an error queued.
+    """
+    state = {"outcomes": {}, "deadlines": {}, "condensed": [], "condense_errors": {}}
+    monkeypatch.setattr(
+        parallel_research_agent,
+        "RESEARCH_SPECS",
+        tuple(ResearchSpec(name, AgentType.GENERIC_SEARCH, "search", {}) for name in LANES),
+    )
+
+    async def run_research_async(spec, mission_brief, model_id=None):
+        state["deadlines"][spec.name] = current_invocation_deadline.get()
+        outcome = state["outcomes"].get(spec.name, f"report {spec.name}")
+        if isinstance(outcome, tuple):
+            delay, outcome = outcome
+            await asyncio.sleep(delay)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    async def condense(source, report):
+        state["condensed"].append((source, current_invocation_deadline.get()))
+        if source in state["condense_errors"]:
+            raise state["condense_errors"][source]
+        return f"brief {source}"
+
+    monkeypatch.setattr(parallel_research_agent, "run_research_async", run_research_async)
+    monkeypatch.setattr(parallel_research_agent, "condense_research_report_async", condense)
+    monkeypatch.setattr(settings, "research_progressive_summaries", True)
+    return state
+
+
+@pytest.fixture
+def events() -> RecordingEventStream:
+    stream = RecordingEventStream()
+    token = current_event_stream.set(stream)
+    yield stream
+    current_event_stream.reset(token)
+
+
+async def test_reports_are_condensed_as_lanes_finish_and_kept_in_lane_order(lanes):
+    lanes["outcomes"] = {"Alpha": (0.05, "report Alpha"), "Beta": ValueError("search down")}
+    lanes["condense_errors"] = {"Gamma": RuntimeError("throttled")}
+
+    results, summaries = await ParallelResearchAgent()._run_research_agents_parallel(None)
+
+    assert results == ["report Alpha", "Error in Beta: search down", "report Gamma"]
+    # Gamma finished first; Beta has nothing to condense; Gamma's failed summary falls back to its report
+    assert [source for source, _ in lanes["condensed"]] == ["Gamma", "Alpha"]
+    assert summaries == ["## Alpha\nbrief Alpha", "Error in Beta: search down", "report Gamma"]
+
+
+async def test_without_progressive_summaries_no_report_is_condensed(lanes, monkeypatch):
+    monkeypatch.setattr(settings, "research_progressive_summaries", False)
+
+    results, summaries = await ParallelResearchAgent()._run_research_agents_parallel(None)
+
+    assert results == ["report Alpha", "report Beta", "report Gamma"]
+    assert summaries == []
+    assert lanes["condensed"] == []
+
+
+async def test_timed_out_lanes_keep_their_partial_output_and_are_reported(lanes, events):
+    lanes["outcomes"] = {
+        "Alpha": InvocationTimeoutError("soft deadline", "partial findings"),
+        "Beta": InvocationTimeoutError("hard deadline", "", hard=True),
+    }
+
+    results, summaries = await ParallelResearchAgent()._run_research_agents_parallel(None)
+
+    assert results == [
+        "Timed out in Alpha (partial results):\npartial findings",
+        "Timed out in Beta: no results before the deadline",
+        "report Gamma",
+    ]
+    assert sorted(source for source, _ in lanes["condensed"]) == ["Alpha", "Gamma"]
+    assert summaries[1] == results[1]
+    assert [(event, data["agent"], data["deadline"], data["partial"]) for event, data in events.events] == [
+        ("research_agent_timed_out", "Alpha", "soft", True),
+        ("research_agent_timed_out", "Beta", "hard", False),
+    ]
+
+
+async def test_lane_deadlines_are_capped_by_the_step_and_summaries_run_under_the_step(lanes, monkeypatch):
+    monkeypatch.setattr(settings, "research_soft_deadline_seconds", 100)
+    monkeypatch.setattr(settings, "research_hard_deadline_seconds", 200)
+    step_deadline = InvocationDeadline(50, 150)
+    current_invocation_deadline.set(step_deadline)
+
+    await ParallelResearchAgent()._run_research_agents_parallel(None)
+
+    lane_deadline = lanes["deadlines"]["Alpha"]
+    assert all(deadline is lane_deadline for deadline in lanes["deadlines"].values())
+    assert (lane_deadline.soft_at, lane_deadline.hard_at) == (step_deadline.soft_at, step_deadline.hard_at)
+    assert all(deadline is step_deadline for _, deadline in lanes["condensed"])
+
+
+class StubPromptService:
+    def format_user_prompt(self, agent_type, template_name, **kwargs) -> str:
+        return f"{template_name}: {kwargs['source']}"
+
+    def get_system_prompt(self, agent_type) -> str:
+        return "You summarize research."
+
+
+@pytest.fixture
+def summarizer_model(monkeypatch) -> list[str]:
+    """Stub Bedrock for the summarizer: the routed model is unavailable, others answer; returns the models called."""
+    calls = []
+
+    def stream(self, request):
+        calls.append(request["modelId"])
+        if request["modelId"] == "routed-model":
+            raise ClientError({"Error": {"Code": "ResourceNotFoundException", "Message": ""}}, "ConverseStream")
+        yield {"messageStart": {"role": "assistant"}}
+        yield {"contentBlockDelta": {"delta": {"text": f"condensed by {request['modelId']}"}}}
+        yield {"contentBlockStop": {}}
+        yield {"messageStop": {"stopReason": "end_turn"}}
+
+    monkeypatch.setattr(BedrockModel, "stream", stream)
+    monkeypatch.setattr(search_summarizer_agent, "get_prompt_service", StubPromptService)
+    monkeypatch.setattr(search_summarizer_agent, "resolve_model_id", lambda agent_type: "routed-model")
+    monkeypatch.setattr(settings, "default_model_id", "default-model")
+    monkeypatch.setattr(settings, "model_fallback_enabled", True)
+    monkeypatch.setattr(
+        base_agent, "response_cache", ResponseCache(TieredCache("test_condense"), {AgentType.SEARCH_SUMMARIZER})
+    )
+    return calls
+
+
+async def test_condensing_falls_back_from_an_unavailable_model_and_is_cached(summarizer_model):
+    first = await condense_research_report_async("Alpha", "report")
+    second = await condense_research_report_async("Alpha", "report")
+
+    assert first.strip() == second.strip() == "condensed by default-model"
+    # The routed model is tried again, and the fallback is then served from the cache
+    assert summarizer_model == ["routed-model", "default-model", "routed-model"]
+    assert base_agent.response_cache.stats()["hits"] == 1
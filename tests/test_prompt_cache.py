@@ -0,0 +1,120 @@
+import json
+
+import pytest
+from strands.models import BedrockModel
+
+from deep_research_agent.common.prompt_cache import PROMPT_CACHE_BREAK
+from deep_research_agent.core.agent_factory import LimitedBedrockModel
+from deep_research_agent.core.usage import TokenUsage, current_token_usage
+
+pytestmark = pytest.mark.unit
+
+CACHE_POINT = {"cachePoint": {"type": "default"}}
+TOOL_SPECS = [{"name": "websearch", "description": "Search the web", "inputSchema": {"json": {}}}]
+
+
+def _model(caching: bool = True) -> LimitedBedrockModel:
+    cache_config = {"cache_prompt": "default", "cache_tools": "default"} if caching else {}
+    return LimitedBedrockModel(model_id="test-model", region_name="us-east-1", **cache_config)
+
+
+def _user(text: str) -> dict:
+    return {"role": "user", "content": [{"text": text}]}
+
+
+def _count_cache_points(request: dict) -> int:
+    return json.dumps(request).count('"cachePoint"')
+
+
+def test_break_in_the_latest_message_becomes_a_cache_point():
+    messages = [_user(f"Instructions{PROMPT_CACHE_BREAK}Company: Acme")]
+
+    formatted = _model()._format_cache_points(messages)
+
+    assert formatted[0]["content"] == [{"text": "Instructions"}, CACHE_POINT, {"text": "Company: Acme"}]
+    assert messages[0]["content"] == [{"text": f"Instructions{PROMPT_CACHE_BREAK}Company: Acme"}]
+
+
+def test_break_is_stripped_from_older_messages_and_a_rolling_cache_point_follows_the_conversation():
+    messages = [
+        _user(f"Instructions{PROMPT_CACHE_BREAK}Company: Acme"),
+        {"role": "assistant", "content": [{"toolUse": {"toolUseId": "t1", "name": "websearch", "input": {}}}]},
+        {"role": "user", "content": [{"toolResult": {"toolUseId": "t1", "content": [{"text": "results"}]}}]},
+    ]
+
+    formatted = _model()._format_cache_points(messages)
+
+    assert formatted[0]["content"] == [{"text": "InstructionsCompany: Acme"}]
+    assert formatted[2]["content"][-1] == CACHE_POINT
+    assert _count_cache_points({"messages": formatted}) == 1
+
+
+def test_break_at_the_end_of_the_text_leaves_no_empty_block():
+    formatted = _model()._format_cache_points([_user(f"Instructions{PROMPT_CACHE_BREAK}")])
+
+    assert formatted[0]["content"] == [{"text": "Instructions"}, CACHE_POINT]
+
+
+def test_break_at_the_start_of_the_text_adds_no_cache_point():
+    formatted = _model()._format_cache_points([_user(f"{PROMPT_CACHE_BREAK}Company: Acme")])
+
+    assert formatted[0]["content"] == [{"text": "Company: Acme"}]
+
+
+def test_break_is_stripped_when_caching_is_off():
+    messages = [_user("a"), {"role": "assistant", "content": [{"text": "b"}]}, _user(f"c{PROMPT_CACHE_BREAK}d")]
+
+    formatted = _model(caching=False)._format_cache_points(messages)
+
+    assert formatted[2]["content"] == [{"text": "cd"}]
+    assert _count_cache_points({"messages": formatted}) == 0
+
+
+def test_requests_stay_within_four_cache_points():
+    messages = [
+        _user("Earlier question"),
+        {"role": "assistant", "content": [{"text": "Earlier answer"}]},
+        _user(f"Instructions{PROMPT_CACHE_BREAK}Follow-up{PROMPT_CACHE_BREAK}Company: Acme"),
+    ]
+
+    request = _model().format_request(messages, TOOL_SPECS, "You research companies.")
+
+    # System prompt, tools, the latest break and the rolling point
+    assert _count_cache_points(request) == 4
+    assert request["messages"][2]["content"][0] == {"text": "InstructionsFollow-up"}
+
+
+def test_cache_reads_are_recorded_in_the_step_usage(monkeypatch):
+    cached_prefixes = set()
+
+    def stream(self, request):
+        # Stub Bedrock: a prefix before a cache point is written on first sight and read afterwards
+        content = request["messages"][-1]["content"]
+        prefix = content[0]["text"]
+        usage = {"inputTokens": 10, "outputTokens": 5}
+        if CACHE_POINT in content:
+            key = "cacheReadInputTokens" if prefix in cached_prefixes else "cacheWriteInputTokens"
+            usage[key] = len(prefix)
+            cached_prefixes.add(prefix)
+        yield {"messageStart": {"role": "assistant"}}
+        yield {"messageStop": {"stopReason": "end_turn"}}
+        yield {"metadata": {"usage": usage, "metrics": {"latencyMs": 1}}}
+
+    monkeypatch.setattr(BedrockModel, "stream", stream)
+    model = _model()
+    step_usage = TokenUsage()
+    token = current_token_usage.set(step_usage)
+    try:
+        for company in ("Acme", "Globex"):
+            request = model.format_request([_user(f"Instructions{PROMPT_CACHE_BREAK}Company: {company}")])
+            list(model.stream(request))
+    finally:
+        current_token_usage.reset(token)
+
+    assert step_usage.as_dict() == {
+        "model_calls": 2,
+        "input_tokens": 20,
+        "output_tokens": 10,
+        "cache_read_input_tokens": len("Instructions"),
+        "cache_write_input_tokens": len("Instructions"),
+    }
@@ -0,0 +1,104 @@
+import asyncio
+
+import pytest
+
+from deep_research_agent.agents.research import research_engine
+from deep_research_agent.agents.research.research_engine import ResearchAgentPool, ResearchSpec, run_research_async
+from deep_research_agent.common.schemas import AgentType
+from deep_research_agent.core.async_agent import InvocationTimeoutError
+
+pytestmark = pytest.mark.unit
+
+SPEC = ResearchSpec("Generic Search", AgentType.GENERIC_SEARCH, "search", {"topic": "main_topic"})
+
+
+class StubPromptService:
+    def format_user_prompt(self, agent_type, template_name, **kwargs) -> str:
+        return f"{template_name}: {kwargs}"
+
+    def get_system_prompt(self, agent_type) -> str:
+        return "You research."
+
+
+class StubAgent:
+    def __init__(self, model_id: str):
+        self.model_id = model_id
+        self.messages = []
+        self.event_loop_metrics = None
+
+
+class MissionBrief:
+    main_topic = "retail"
+
+
+@pytest.fixture
+def engine(monkeypatch) -> dict:
+    """
+    A fresh research agent pool over stub agents, with invocations that answer after ``delay`` seconds
+    or raise the next queued error; records the agents created and those running at once.
+    """
+    state = {"created": [], "running": set(), "overlaps": [], "errors": [], "delay": 0.0}
+    monkeypatch.setattr(research_engine, "research_agent_pool", ResearchAgentPool(max_idle_per_key=3))
+    monkeypatch.setattr(research_engine, "get_prompt_service", StubPromptService)
+    monkeypatch.setattr(research_engine, "resolve_model_id", lambda agent_type: None)
+
+    def create_agent(model_id=None, system_prompt=None, tools=None):
+        agent = StubAgent(model_id)
+        state["created"].append(agent)
+        return agent
+
+    async def invoke_agent_async(agent, prompt, semaphore=None):
+        assert agent not in state["running"], "an agent is shared by two lanes"
+        state["running"].add(agent)
+        state["overlaps"].append(len(state["running"]))
+        try:
+            agent.messages.append(prompt)
+            await asyncio.sleep(state["delay"])
+            if state["errors"]:
+                raise state["errors"].pop(0)
+            return f"report from {id(agent)}"
+        finally:
+            state["running"].discard(agent)
+
+    monkeypatch.setattr(research_engine.AgentFactory, "create_agent", create_agent)
+    monkeypatch.setattr(research_engine, "invoke_agent_async", invoke_agent_async)
+    return state
+
+
+async def test_agent_is_reused_with_a_cleared_conversation(engine):
+    await run_research_async(SPEC, MissionBrief(), "model-a")
+    await run_research_async(SPEC, MissionBrief(), "model-a")
+
+    assert len(engine["created"]) == 1
+    assert engine["created"][0].messages == []
+
+
+async def test_agents_are_pooled_per_model(engine):
+    await run_research_async(SPEC, MissionBrief(), "model-a")
+    await run_research_async(SPEC, MissionBrief(), "model-b")
+
+    assert [agent.model_id for agent in engine["created"]] == ["model-a", "model-b"]
+
+
+async def test_agent_whose_invocation_raised_is_not_returned_to_the_pool(engine):
+    engine["errors"] = [InvocationTimeoutError("Agent invocation passed its soft deadline", "partial")]
+
+    with pytest.raises(InvocationTimeoutError):
+        await run_research_async(SPEC, MissionBrief(), "model-a")
+    await run_research_async(SPEC, MissionBrief(), "model-a")
+
+    assert len(engine["created"]) == 2
+    abandoned, fresh = engine["created"]
+    assert abandoned.messages  # never cleared: it may still be running on its thread
+    assert research_engine.research_agent_pool.acquire(AgentType.GENERIC_SEARCH, "model-a") is fresh
+
+
+async def test_concurrent_lanes_never_share_an_agent(engine):
+    engine["delay"] = 0.05
+
+    await asyncio.gather(*(run_research_async(SPEC, MissionBrief(), "model-a") for _ in range(5)))
+
+    assert max(engine["overlaps"]) == 5
+    assert len(engine["created"]) == 5
+    # Idle agents beyond max_idle_per_key are dropped
+    assert len(research_engine.research_agent_pool._idle[(AgentType.GENERIC_SEARCH, "model-a")]) == 3
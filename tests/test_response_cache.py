@@ -0,0 +1,190 @@
+import os
+import time
+
+import pytest
+from pydantic import BaseModel
+from strands.models import BedrockModel
+
+from deep_research_agent.agents import base_agent
+from deep_research_agent.agents.base_agent import BaseAgent
+from deep_research_agent.common.schemas import AgentType
+from deep_research_agent.services.response_cache import ResponseCache, current_llm_cache_stats
+from deep_research_agent.utils.cache import CacheLookupStats, TieredCache
+
+pytestmark = pytest.mark.unit
+
+
+class StubPromptService:
+    def __init__(self, system_prompt: str):
+        self.system_prompt = system_prompt
+
+    def get_system_prompt(self, agent_type: AgentType) -> str:
+        return self.system_prompt
+
+
+class StubAgent(BaseAgent):
+    agent_type = AgentType.QUERY_ENHANCER
+
+    def execute(self, context):
+        return self._invoke(context["prompt"])
+
+
+@pytest.fixture
+def model_calls(monkeypatch) -> list[dict]:
+    """Replace Bedrock with a stub model that answers with the model id and prompt, recording every call."""
+    calls = []
+
+    def stream(self, request):
+        calls.append(request)
+        prompt = request["messages"][-1]["content"][0]["text"]
+        yield {"messageStart": {"role": "assistant"}}
+        yield {"contentBlockDelta": {"delta": {"text": f"{request['modelId']}: {prompt}"}}}
+        yield {"contentBlockStop": {}}
+        yield {"messageStop": {"stopReason": "end_turn"}}
+
+    monkeypatch.setattr(BedrockModel, "stream", stream)
+    return calls
+
+
+@pytest.fixture
+def cache(monkeypatch) -> ResponseCache:
+    cache = ResponseCache(TieredCache("test_llm_response"), {AgentType.QUERY_ENHANCER})
+    monkeypatch.setattr(base_agent, "response_cache", cache)
+    return cache
+
+
+def test_identical_call_is_served_from_cache(model_calls, cache):
+    agent = StubAgent(StubPromptService("You enhance queries."), model_id="model-a")
+    run_stats = CacheLookupStats()
+    token = current_llm_cache_stats.set(run_stats)
+    try:
+        first = agent.execute({"prompt": "AI in retail"})
+        second = agent.execute({"prompt": "AI in retail"})
+    finally:
+        current_llm_cache_stats.reset(token)
+
+    assert first == second
+    assert first.strip() == "model-a: AI in retail"
+    assert len(model_calls) == 1
+    assert cache.stats()["hits"] == 1
+    assert run_stats.as_dict() == {"hits": 1, "misses": 1, "hit_rate": 0.5}
+
+
+def test_different_system_prompt_is_a_miss(model_calls, cache):
+    StubAgent(StubPromptService("You enhance queries."), model_id="model-a").execute({"prompt": "AI in retail"})
+    StubAgent(StubPromptService("You enhance queries tersely."), model_id="model-a").execute(
+        {"prompt": "AI in retail"}
+    )
+
+    assert len(model_calls) == 2
+    assert cache.stats()["hits"] == 0
+
+
+def test_different_model_is_a_miss(model_calls, cache):
+    prompt_service = StubPromptService("You enhance queries.")
+
+    first = StubAgent(prompt_service, model_id="model-a").execute({"prompt": "AI in retail"})
+    second = StubAgent(prompt_service, model_id="model-b").execute({"prompt": "AI in retail"})
+
+    assert (first.strip(), second.strip()) == ("model-a: AI in retail", "model-b: AI in retail")
+    assert len(model_calls) == 2
+
+
+def test_agent_types_without_caching_always_call_the_model(model_calls, cache):
+    cache.enabled_agent_types = set()
+    agent = StubAgent(StubPromptService("You enhance queries."), model_id="model-a")
+
+    agent.execute({"prompt": "AI in retail"})
+    agent.execute({"prompt": "AI in retail"})
+
+    assert len(model_calls) == 2
+    assert cache.stats()["hits"] + cache.stats()["misses"] == 0
+
+
+def test_different_output_schema_is_a_miss():
+    class Summary(BaseModel):
+        text: str
+
+    class DetailedSummary(BaseModel):
+        text: str
+        sources: list[str]
+
+    cache = ResponseCache(TieredCache("test_llm_response"), {AgentType.QUERY_ENHANCER})
+    calls = []
+
+    def call(output_model):
+        def run():
+            calls.append(output_model)
+            return output_model.__name__
+
+        return run
+
+    for output_model in (Summary, DetailedSummary, Summary):
+        cache.get_or_call(AgentType.QUERY_ENHANCER, "model-a", "system", "prompt", output_model, call(output_model))
+
+    assert calls == [Summary, DetailedSummary]
+
+
+class TestTieredCache:
+    def test_hits_return_independent_copies(self):
+        cache = TieredCache("test")
+        cache.set("key", {"items": [1]})
+
+        cache.get("key")["items"].append(2)
+
+        assert cache.get("key") == {"items": [1]}
+
+    def test_memory_tier_evicts_least_recently_used(self):
+        cache = TieredCache("test", max_entries=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.get("b") is None
+        assert (cache.get("a"), cache.get("c")) == (1, 3)
+        assert cache.stats()["evictions"] == 1
+
+    def test_memory_entries_expire_after_ttl(self, monkeypatch):
+        now = [1000.0]
+        monkeypatch.setattr(time, "time", lambda: now[0])
+        cache = TieredCache("test", ttl_seconds=60)
+        cache.set("key", "value")
+
+        now[0] += 59
+        assert cache.get("key") == "value"
+        now[0] += 2
+        assert cache.get("key") is None
+        assert cache.stats()["memory_entries"] == 0
+
+    def test_disk_tier_survives_a_new_cache_instance(self, tmp_path):
+        TieredCache("test", disk_dir=str(tmp_path)).set("key", {"answer": 42})
+
+        reloaded = TieredCache("test", disk_dir=str(tmp_path))
+
+        assert reloaded.get("key") == {"answer": 42}
+        assert reloaded.get("key") == {"answer": 42}
+        stats = reloaded.stats()
+        assert (stats["disk_hits"], stats["memory_hits"]) == (1, 1)
+
+    def test_expired_disk_entries_are_dropped(self, tmp_path):
+        TieredCache("test", ttl_seconds=60, disk_dir=str(tmp_path)).set("key", "value")
+        reloaded = TieredCache("test", ttl_seconds=60, disk_dir=str(tmp_path))
+        path = reloaded._disk_path("key")
+        stale = time.time() - 120
+        os.utime(path, (stale, stale))
+
+        assert reloaded.get("key") is None
+        assert not os.path.exists(path)
+
+    def test_disk_tier_evicts_oldest_files_over_budget(self, tmp_path):
+        cache = TieredCache("test", disk_dir=str(tmp_path), max_disk_bytes=2500)
+        for index in range(3):
+            cache.set(f"key{index}", "x" * 1000)
+            path = cache._disk_path(f"key{index}")
+            os.utime(path, (1000 + index, 1000 + index))
+        cache.set("key3", "x" * 1000)
+
+        reloaded = TieredCache("test", disk_dir=str(tmp_path))
+        assert reloaded.get("key0") is None
+        assert reloaded.get("key3") is not None
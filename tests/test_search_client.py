@@ -0,0 +1,185 @@
+import json as jsonlib
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+import requests
+
+from deep_research_agent.services.search_client import SearchClient, _parse_rate_limits, current_search_stats
+from deep_research_agent.utils.cache import CacheLookupStats, TieredCache
+
+pytestmark = pytest.mark.unit
+
+
+class CountingRateLimiter:
+    def __init__(self):
+        self.acquired: list[float] = []
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        self.acquired.append(tokens)
+        return 0.0
+
+    def stats(self):
+        return {"acquired": len(self.acquired)}
+
+
+def _response(status: int, body: bytes = b"{}", headers: dict[str, str] | None = None) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status
+    response._content = body
+    response.headers.update(headers or {})
+    response.url = SearchClient.SEARCH_URL
+    return response
+
+
+@pytest.fixture
+def client(monkeypatch):
+    def make(statuses: list[int], **kwargs) -> tuple[SearchClient, list]:
+        client = SearchClient("test-key", backoff_factor=0.0, rate_limiter=CountingRateLimiter(), **kwargs)
+        sent = []
+
+        def post(url, json, timeout):
+            sent.append(json)
+            status = statuses[min(len(sent), len(statuses)) - 1]
+            return _response(status, b'{"organic": []}' if status == 200 else b"{}", {"Retry-After": "0"})
+
+        monkeypatch.setattr(client.session, "post", post)
+        return client, sent
+
+    return make
+
+
+def test_rate_limited_request_is_retried_with_a_token_per_attempt(client):
+    search_client, sent = client([429, 429, 200])
+
+    assert search_client.search({"q": "retail ai"}) == {"organic": []}
+    assert len(sent) == 3
+    assert search_client.rate_limiter.acquired == [1, 1, 1]
+    assert search_client.stats()["retries"] == 2
+
+
+def test_batch_retries_take_a_token_per_query(client):
+    search_client, _ = client([429, 200])
+
+    search_client._post([{"q": "a"}, {"q": "b"}])
+
+    assert search_client.rate_limiter.acquired == [2, 2]
+
+
+def test_rate_limit_persisting_past_max_retries_raises(client):
+    search_client, sent = client([429], max_retries=2)
+
+    with pytest.raises(requests.HTTPError):
+        search_client.search({"q": "retail ai"})
+    assert len(sent) == 3
+    assert search_client.stats()["errors"] == 1
+
+
+def test_rate_limits_that_are_not_positive_are_ignored():
+    limiters = _parse_rate_limits("serper=5:10,local=0,other=-1:5,bm25=1:0,bad=x")
+
+    assert list(limiters) == ["serper"]
+    assert (limiters["serper"].rate, limiters["serper"].capacity) == (5.0, 10.0)
+
+
+def test_identical_searches_are_served_from_cache(client):
+    search_client, sent = client([200], cache=TieredCache("test_search"))
+    search_client.search({"q": "Retail AI"})
+
+    stats = CacheLookupStats()
+    token = current_search_stats.set(stats)
+    try:
+        search_client.search({"q": "retail ai"})
+    finally:
+        current_search_stats.reset(token)
+
+    assert len(sent) == 1
+    assert stats.as_dict()["hits"] == 1
+
+
+@pytest.fixture
+def echo_client(monkeypatch):
+    """Client whose Serper stub answers each query with its own text, after ``delay`` seconds."""
+
+    def make(delay: float = 0.0, fail_queries: frozenset[str] = frozenset(), **kwargs) -> tuple[SearchClient, list]:
+        search_client = SearchClient("test-key", backoff_factor=0.0, **kwargs)
+        sent = []
+
+        def answer(payload: dict) -> dict:
+            return {"organic": [{"title": payload["q"], "link": f"https://example.com/{payload['q']}"}]}
+
+        def post(url, json, timeout):
+            sent.append(json)
+            time.sleep(delay)
+            queries = [payload["q"] for payload in json] if isinstance(json, list) else [json["q"]]
+            if fail_queries & set(queries):
+                return _response(500)
+            body = [answer(payload) for payload in json] if isinstance(json, list) else answer(json)
+            return _response(200, jsonlib.dumps(body).encode())
+
+        monkeypatch.setattr(search_client.session, "post", post)
+        return search_client, sent
+
+    return make
+
+
+def _titles(results: list) -> list:
+    return [result if isinstance(result, Exception) else result["organic"][0]["title"] for result in results]
+
+
+def test_concurrent_identical_searches_share_one_request(echo_client):
+    search_client, sent = echo_client(delay=0.2, cache=TieredCache("test_search"))
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(search_client.search, [{"q": "retail ai"}, {"q": "Retail AI "}] * 2))
+
+    assert len(sent) == 1
+    assert _titles(results) == ["retail ai"] * 4
+    # Each caller gets its own copy of the shared response
+    assert len({id(result) for result in results}) == 4
+
+
+def test_concurrent_identical_searches_share_a_failure(echo_client):
+    search_client, sent = echo_client(
+        delay=0.2, fail_queries=frozenset({"retail ai"}), cache=TieredCache("test_search")
+    )
+
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        futures = [executor.submit(search_client.search, {"q": "retail ai"}) for _ in range(3)]
+    errors = [future.exception() for future in futures]
+
+    assert all(isinstance(error, requests.HTTPError) for error in errors)
+    assert len(sent) == 1
+    assert not search_client._in_flight
+
+
+def test_search_many_batches_distinct_misses_and_keeps_result_order(echo_client):
+    search_client, sent = echo_client(cache=TieredCache("test_search"), batch_size=2)
+    search_client.search({"q": "cached"})
+    sent.clear()
+
+    payloads = [{"q": query} for query in ("a", "cached", "b", "A", "c", "d")]
+    results = search_client.search_many(payloads)
+
+    assert _titles(results) == ["a", "cached", "b", "a", "c", "d"]
+    # Four distinct misses ("A" is "a") in batches of two
+    assert [[payload["q"] for payload in batch] for batch in sent] == [["a", "b"], ["c", "d"]]
+
+
+def test_search_many_reports_a_failed_batch_in_place_of_its_queries(echo_client):
+    search_client, _ = echo_client(fail_queries=frozenset({"c"}), batch_size=2)
+
+    results = search_client.search_many([{"q": query} for query in ("a", "b", "c", "d", "e")])
+
+    assert _titles(results)[:2] == ["a", "b"]
+    assert all(isinstance(result, requests.HTTPError) for result in results[2:4])
+    assert _titles(results)[4] == "e"
+
+
+def test_search_many_without_batching_sends_single_requests_in_order(echo_client):
+    search_client, sent = echo_client(batch_enabled=False, max_concurrency=3)
+
+    results = search_client.search_many([{"q": query} for query in ("a", "b", "c", "a")])
+
+    assert _titles(results) == ["a", "b", "c", "a"]
+    assert sorted(payload["q"] for payload in sent) == ["a", "b", "c"]
@@ -0,0 +1,143 @@
+import pytest
+
+from deep_research_agent.agents.research import tools
+from deep_research_agent.agents.research.tools import websearch
+from deep_research_agent.common.config import settings
+from deep_research_agent.common.schemas import SearchResult
+from deep_research_agent.services.search_results import (
+    format_search_results,
+    project_search_results,
+    rerank_search_results,
+    tokenize,
+)
+
+pytestmark = pytest.mark.unit
+
+RESPONSE = {
+    "searchParameters": {"q": "ai retail"},
+    "knowledgeGraph": {"title": "Retail"},
+    "peopleAlsoAsk": [{"question": "What is retail AI?"}],
+    "organic": [
+        {"title": "AI in retail", "link": "https://news.example.org/ai-retail", "snippet": "Retail adopts AI"},
+        {"title": "Missing link", "snippet": "no url"},
+        {"url": "https://retail.example.com/ai", "snippet": "AI for retail stores", "sitelinks": [{"title": "x"}]},
+        {"title": "Cooking tips", "link": "https://www.recipes.com/tips", "snippet": "How to bake bread"},
+    ],
+}
+
+
+def _result(title: str, snippet: str = "", url: str = "https://example.com") -> SearchResult:
+    return SearchResult(title=title, url=url, snippet=snippet, source="example.com")
+
+
+def test_tokenize_drops_stopwords_and_punctuation():
+    assert tokenize("What is the AI-driven Retail of 2025?") == ["ai", "driven", "retail", "2025"]
+
+
+def test_projection_keeps_organic_results_with_a_url():
+    results = project_search_results(RESPONSE)
+
+    assert [(result.title, result.url, result.source) for result in results] == [
+        ("AI in retail", "https://news.example.org/ai-retail", "news.example.org"),
+        ("Untitled", "https://retail.example.com/ai", "retail.example.com"),
+        ("Cooking tips", "https://www.recipes.com/tips", "recipes.com"),
+    ]
+    assert results[1].snippet == "AI for retail stores"
+    assert project_search_results({}) == []
+
+
+def test_rerank_orders_by_query_coverage_weighting_titles():
+    results = [
+        _result("Cooking tips", "How to bake bread"),
+        _result("Store news", "AI in retail"),
+        _result("AI in retail", "Retail adopts AI"),
+    ]
+
+    reranked = rerank_search_results("AI for retail", results)
+
+    assert [result.title for result in reranked] == ["AI in retail", "Store news", "Cooking tips"]
+
+
+def test_rerank_keeps_the_engine_order_on_ties_and_for_empty_queries():
+    results = [_result("First"), _result("Second")]
+
+    assert rerank_search_results("retail", results) == results
+    assert rerank_search_results("the of", list(reversed(results))) == list(reversed(results))
+
+
+def test_format_numbers_results_and_truncates_snippets_on_a_word():
+    results = [
+        _result("AI in retail", "word " * 10, url="https://a.example"),
+        _result("Page", "short", url="https://b.example"),
+    ]
+    results[1].content = "Full page text"
+
+    text = format_search_results(results, snippet_max_chars=12)
+
+    assert text == (
+        "[1] AI in retail (example.com)\nhttps://a.example\nword word...\n\n"
+        "[2] Page (example.com)\nhttps://b.example\nshort\nPage content:\nFull page text"
+    )
+    assert format_search_results([]) == "No results found."
+
+
+class StubBackend:
+    available = True
+    unavailable_reason = ""
+
+    def __init__(self):
+        self.payloads: list[dict] = []
+
+    def search(self, payload: dict) -> dict:
+        self.payloads.append(payload)
+        return RESPONSE
+
+
+class StubPageFetcher:
+    def fetch_contents(self, urls: list[str]) -> dict[str, str]:
+        return {url: f"text of {url}" for url in urls}
+
+
+@pytest.fixture
+def backend(monkeypatch) -> StubBackend:
+    backend = StubBackend()
+    monkeypatch.setattr(tools, "get_search_backend", lambda: backend)
+    monkeypatch.setattr(tools, "page_fetcher", StubPageFetcher())
+    monkeypatch.setattr(settings, "search_fetch_content", False)
+    return backend
+
+
+def test_websearch_returns_the_top_reranked_results(backend):
+    text = websearch("AI retail", max_results=2)
+
+    assert backend.payloads == [{"q": "AI retail", "gl": "us", "hl": "en"}]
+    assert text.startswith("[1] AI in retail (news.example.org)")
+    assert "[2] Untitled (retail.example.com)" in text
+    assert "Cooking tips" not in text
+
+
+def test_websearch_asks_for_more_results_than_the_default_page(backend):
+    websearch("AI retail", region="de", max_results=25)
+
+    assert backend.payloads == [{"q": "AI retail", "gl": "de", "num": 25}]
+
+
+def test_websearch_adds_fetched_page_text_of_the_top_results(backend, monkeypatch):
+    monkeypatch.setattr(settings, "search_fetch_content", True)
+    monkeypatch.setattr(settings, "page_fetch_top_n", 1)
+
+    text = websearch("AI retail", max_results=2)
+
+    assert text.count("Page content:") == 1
+    assert "Page content:\ntext of https://news.example.org/ai-retail" in text
+
+
+def test_websearch_reports_why_the_backend_is_unavailable(backend):
+    backend.available = False
+    backend.unavailable_reason = "Local search index not found at index.json"
+
+    assert (
+        websearch("AI retail")
+        == "Error: the websearch tool is unavailable: Local search index not found at index.json"
+    )
+    assert backend.payloads == []
@@ -0,0 +1,68 @@
+import pytest
+
+from deep_research_agent.agents.research.search_summarizer_agent import MAX_REDUCE_ROUNDS, SearchSummarizerAgent
+from deep_research_agent.common.config import settings
+
+pytestmark = pytest.mark.unit
+
+
+class StubPromptService:
+    def format_user_prompt(self, agent_type, template_name, **kwargs) -> str:
+        return f"{template_name}: {next(iter(kwargs.values()))}"
+
+    def get_system_prompt(self, agent_type) -> str:
+        return ""
+
+
+@pytest.fixture
+def summarizer(monkeypatch):
+    monkeypatch.setattr(settings, "summarizer_map_reduce_threshold_tokens", 100)
+    monkeypatch.setattr(settings, "summarizer_chunk_tokens", 60)
+    monkeypatch.setattr(settings, "summarizer_max_concurrency", 4)
+    agent = SearchSummarizerAgent(StubPromptService(), model_id="test-model")
+    agent.prompts = []
+
+    def invoke(prompt: str) -> str:
+        agent.prompts.append(prompt)
+        return agent.respond(prompt)
+
+    agent.respond = lambda prompt: "brief"
+    monkeypatch.setattr(agent, "_invoke", invoke)
+    return agent
+
+
+def test_input_under_threshold_is_summarized_in_one_call(summarizer):
+    context = {"research_results": ["short report", "another report"]}
+
+    summarizer.execute(context)
+
+    assert summarizer.prompts == ["summarize_reports: short report\n\n---\n\nanother report"]
+    assert context["creative_brief"] == "brief"
+
+
+def test_input_over_threshold_is_mapped_in_chunks_then_merged(summarizer):
+    reports = ["r" * 200 for _ in range(4)]
+
+    summarizer.execute({"research_results": reports})
+
+    *map_prompts, final_prompt = summarizer.prompts
+    assert len(map_prompts) == 4
+    assert all(prompt.startswith("summarize_chunk: ") for prompt in map_prompts)
+    assert final_prompt == "merge_partial_briefs: " + "\n\n---\n\n".join(["brief"] * 4)
+
+
+def test_partial_briefs_are_merged_directly(summarizer):
+    summarizer.execute({"research_results": ["full report"], "research_summaries": ["## A\nbrief a"]})
+
+    assert summarizer.prompts == ["merge_partial_briefs: ## A\nbrief a"]
+
+
+def test_reduce_rounds_are_capped(summarizer):
+    # Chunk summaries that never shrink would otherwise reduce forever
+    summarizer.respond = lambda prompt: "s" * 200
+
+    summarizer.execute({"research_results": ["r" * 200 for _ in range(4)]})
+
+    map_calls = [prompt for prompt in summarizer.prompts if prompt.startswith("summarize_chunk: ")]
+    assert len(map_calls) == 4 * MAX_REDUCE_ROUNDS
+    assert summarizer.prompts[-1].startswith("merge_partial_briefs: ")
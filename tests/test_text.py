@@ -0,0 +1,47 @@
+import pytest
+
+from deep_research_agent.utils.text import CHARS_PER_TOKEN, chunk_by_token_budget, estimate_tokens
+
+pytestmark = pytest.mark.unit
+
+SEPARATOR = "\n\n---\n\n"
+
+
+def test_estimate_tokens():
+    assert estimate_tokens("") == 1
+    assert estimate_tokens("x" * 400) == 400 // CHARS_PER_TOKEN + 1
+
+
+def test_small_documents_are_packed_whole_with_the_separator():
+    documents = ["a" * 40, "b" * 40, "c" * 40]
+
+    chunks = chunk_by_token_budget(documents, max_tokens=30, separator=SEPARATOR)
+
+    assert chunks == [f"{'a' * 40}{SEPARATOR}{'b' * 40}", "c" * 40]
+
+
+def test_chunks_never_exceed_the_budget():
+    documents = [f"report {index} " * (index * 7 + 1) for index in range(20)]
+
+    chunks = chunk_by_token_budget(documents, max_tokens=50, separator=SEPARATOR)
+
+    assert all(len(chunk) <= 50 * CHARS_PER_TOKEN for chunk in chunks)
+    assert "".join(chunks).replace(SEPARATOR, "").replace("\n\n", "") == "".join(documents)
+
+
+def test_split_document_keeps_paragraph_breaks_and_separator_marks_report_boundaries():
+    large = "\n\n".join(["p1 " * 10, "p2 " * 10, "p3 " * 10])
+    documents = ["intro", large, "outro"]
+
+    chunks = chunk_by_token_budget(documents, max_tokens=20, separator=SEPARATOR)
+
+    assert chunks == [
+        f"intro{SEPARATOR}{'p1 ' * 10}\n\n{'p2 ' * 10}",
+        f"{'p3 ' * 10}{SEPARATOR}outro",
+    ]
+
+
+def test_oversized_paragraph_is_split_on_character_boundaries():
+    chunks = chunk_by_token_budget(["x" * 100], max_tokens=10, separator=SEPARATOR)
+
+    assert chunks == ["x" * 40, "x" * 40, "x" * 20]
@@ -0,0 +1,171 @@
+import threading
+import time
+
+import pytest
+
+from deep_research_agent.common.schemas import AgentType
+from deep_research_agent.core.async_agent import InvocationCancelledError, deadline_callback_handler
+from deep_research_agent.core.orchestrator import OrchestratorAgent, StepTimeoutError
+from deep_research_agent.core.workflow import (
+    DEFAULT_WORKFLOW,
+    SIMPLE_WORKFLOW,
+    WORKFLOW_STEP_METADATA,
+    build_workflow_graph,
+    find_dead_steps,
+    find_unproduced_inputs,
+    missing_required_inputs,
+)
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+def workflow(step_metadata) -> list[AgentType]:
+    return list(step_metadata)
+
+
+def test_graph_links_steps_through_the_keys_they_read_and_write(workflow):
+    assert build_workflow_graph(workflow) == [[], [0], [0], [2], [3]]
+
+
+def test_steps_without_declared_inputs_are_barriers(step_metadata):
+    workflow = [AgentType.QUERY_UNDERSTANDING, AgentType.CLARIFIER, AgentType.PARALLEL_RESEARCH]
+
+    assert build_workflow_graph(workflow) == [[], [0], [0, 1]]
+
+
+def test_steps_before_one_without_declared_inputs_are_never_dead(step_metadata):
+    workflow = [AgentType.QUERY_UNDERSTANDING, AgentType.CLARIFIER, AgentType.PARALLEL_RESEARCH]
+
+    assert find_dead_steps(workflow) == {2}
+
+
+def test_steps_writing_the_same_key_run_in_order(step_metadata):
+    workflow = [AgentType.QUERY_UNDERSTANDING, AgentType.QUERY_UNDERSTANDING]
+
+    assert build_workflow_graph(workflow) == [[], [0]]
+
+
+def test_step_whose_outputs_nothing_reads_is_dead(workflow):
+    assert find_dead_steps(workflow) == {1}
+
+
+def test_step_only_feeding_dead_steps_is_dead_too(step_metadata):
+    workflow = [AgentType.QUERY_UNDERSTANDING, AgentType.PARALLEL_RESEARCH]
+
+    assert find_dead_steps(workflow) == {0, 1}
+
+
+def test_inputs_no_step_or_caller_provides_are_reported(workflow):
+    assert find_unproduced_inputs(workflow) == {3: ["uploaded_docs"], 4: ["evaluation"]}
+
+
+@pytest.mark.parametrize("shipped_workflow", [DEFAULT_WORKFLOW, SIMPLE_WORKFLOW], ids=["default", "simple"])
+def test_shipped_workflows_produce_every_required_input(shipped_workflow):
+    unproduced = {
+        index: [key for key in keys if key in WORKFLOW_STEP_METADATA[shipped_workflow[index]].get("requires", [])]
+        for index, keys in find_unproduced_inputs(shipped_workflow).items()
+    }
+
+    assert {index: keys for index, keys in unproduced.items() if keys} == {}
+
+
+def test_missing_required_inputs_ignores_optional_ones(step_metadata):
+    context = {"research_results": ["r"], "evaluation": []}
+
+    assert missing_required_inputs(AgentType.IDEATION, context) == []
+    assert missing_required_inputs(AgentType.REPORT_SYNTHESIZER, context) == ["evaluation"]
+
+
+async def test_dead_steps_and_steps_missing_required_inputs_are_skipped(agent_pool, workflow):
+    orchestrator = OrchestratorAgent(workflow=workflow)
+
+    use_cases = await orchestrator.run_workflow_from_conversation(["AI for retail"])
+
+    assert orchestrator.step_status == ["completed", "skipped", "completed", "completed", "skipped"]
+    assert agent_pool.calls == [AgentType.QUERY_UNDERSTANDING, AgentType.PARALLEL_RESEARCH, AgentType.IDEATION]
+    assert use_cases == ["initial_ideas from ideation"]
+    skipped = [record for record in orchestrator.workflow_status["step_history"] if record["status"] == "skipped"]
+    assert [(record["step"], record["reason"]) for record in skipped] == [(4, "missing evaluation")]
+    assert orchestrator.workflow_status["status"] == "completed"
+
+
+async def test_required_input_provided_by_the_caller_lets_the_step_run(agent_pool, workflow):
+    orchestrator = OrchestratorAgent(workflow=workflow)
+    orchestrator.workflow_context = {"conversation_history": ["AI for retail"], "evaluation": ["scores"]}
+
+    await orchestrator.run_next_step()
+
+    assert orchestrator.step_status[4] == "completed"
+    assert orchestrator.workflow_context["final_report"] == ["final_report from report_synthesizer"]
+
+
+class RunawayStepAgent:
+    """Step agent editing the conversation history in place, then making model calls until it is stopped."""
+
+    uses_model = False
+    effective_model_id = None
+
+    def __init__(self):
+        self.stopped = threading.Event()
+
+    def execute(self, context: dict) -> None:
+        context["conversation_history"][0] = "rewritten by a timed-out step"
+        try:
+            while True:
+                # Stands in for the callback of a model call made by the step
+                deadline_callback_handler(data="token")
+                time.sleep(0.01)
+        except InvocationCancelledError:
+            self.stopped.set()
+
+
+async def test_step_abandoned_at_its_hard_timeout_stops_and_leaves_the_context_unchanged(
+    agent_pool, step_metadata, workflow, monkeypatch
+):
+    monkeypatch.setitem(step_metadata[AgentType.QUERY_UNDERSTANDING], "hard_timeout_seconds", 0.1)
+    step = agent_pool.agents[AgentType.QUERY_UNDERSTANDING] = RunawayStepAgent()
+    orchestrator = OrchestratorAgent(workflow=workflow)
+
+    with pytest.raises(StepTimeoutError):
+        await orchestrator.run_workflow_from_conversation(["AI for retail"])
+
+    assert step.stopped.wait(1)
+    assert orchestrator.workflow_context["conversation_history"] == ["AI for retail"]
+
+
+class ContextEditingStepAgent:
+    """Step agent recording the context it was given, then applying ``edit`` to it."""
+
+    uses_model = False
+    effective_model_id = None
+
+    def __init__(self, edit):
+        self.edit = edit
+        self.context: dict | None = None
+
+    def execute(self, context: dict) -> None:
+        self.context = context
+        self.edit(context)
+
+
+async def test_step_copies_only_its_declared_keys_and_its_removals_are_applied(agent_pool, workflow):
+    def edit(context):
+        context["conversation_history"].append("edited")
+        context["mission_brief"] = ["brief"]
+        del context["stale_key"]
+
+    step = agent_pool.agents[AgentType.QUERY_UNDERSTANDING] = ContextEditingStepAgent(edit)
+    orchestrator = OrchestratorAgent(workflow=workflow)
+    history, documents = ["AI for retail"], ["a large document"]
+    orchestrator.workflow_context = {"conversation_history": history, "documents": documents, "stale_key": 1}
+
+    await orchestrator._execute_step(0)
+
+    assert step.context["documents"] is documents
+    assert history == ["AI for retail"]
+    assert orchestrator.workflow_context == {
+        "conversation_history": ["AI for retail", "edited"],
+        "documents": documents,
+        "mission_brief": ["brief"],
+    }